@@ -0,0 +1,58 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Cold start cost: import of the connectors modules and the first client construction.
+
+Usage:
+  python -m benchmarks.import_time [repeats]
+
+Every measurement runs in a fresh interpreter, the median is reported.
+"""
+import sys
+import json
+import statistics
+import subprocess
+
+
+MODULES = {
+    "cloud_connectors.aws.s3": "Client()",
+    "cloud_connectors.aws.sts": None,
+    "cloud_connectors.aws.redshift": None,
+    "cloud_connectors.gcp.gcs": None,
+    "cloud_connectors.listing_index": None,
+}
+
+SCRIPT = """
+import json, time
+start = time.perf_counter()
+import {module} as module
+imported = time.perf_counter()
+{construct}
+print(json.dumps([imported - start, time.perf_counter() - imported]))
+"""
+
+
+def _measure(module: str, construct: str) -> list:
+    resp = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            SCRIPT.format(module=module, construct=f"module.{construct}" if construct else ""),
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+        env={"AWS_DEFAULT_REGION": "eu-central-1"},
+    )
+    return json.loads(resp.stdout)
+
+
+def main(repeats: int) -> None:
+    print(f"{'module':<34}{'import, ms':>12}{'client, ms':>12}")
+    for module, construct in MODULES.items():
+        timings = [_measure(module, construct) for _ in range(repeats)]
+        imported = statistics.median(i[0] for i in timings) * 1000
+        constructed = statistics.median(i[1] for i in timings) * 1000
+        print(f"{module:<34}{imported:>12.1f}{constructed if construct else float('nan'):>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
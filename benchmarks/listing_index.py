@@ -0,0 +1,74 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Repeated prefix, glob and size queries: fresh LIST vs. the local listing index.
+
+Usage:
+  python -m benchmarks.listing_index [number_of_objects] [queries] [latency_ms]
+
+The latency emulates the round trip time of a remote endpoint.
+"""
+import os
+import sys
+import time
+import fnmatch
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from benchmarks.moto_server import moto_server, create_bucket, add_latency
+from cloud_connectors.listing_index import ListingIndex
+
+
+BUCKET = "benchmark"
+
+
+def _report(name: str, elapsed: float, queries: int, baseline: float = None) -> None:
+    speedup = f"{baseline / elapsed:>10.1f}x" if baseline else ""
+    print(f"{name:<28}{elapsed / queries * 1000:>10.2f} ms/query{speedup}")
+
+
+def main(objects: int, queries: int, latency: float) -> None:
+    with moto_server() as configuration:
+        client = create_bucket(configuration, BUCKET)
+        keys = [f"data/{i % 24:02d}/{i:06d}.{'json' if i % 2 else 'csv'}" for i in range(objects)]
+        with ThreadPoolExecutor(32) as executor:
+            list(executor.map(lambda key: client.write(b"{}", BUCKET, key), keys))
+        add_latency(client, latency)
+
+        start = time.perf_counter()
+        for _ in range(queries):
+            listing = client.list_objects_size(BUCKET, "data/")
+            _ = sum(size for _, size in listing)
+            _ = [path for path, _ in listing if fnmatch.fnmatchcase(path, "data/1*.csv")]
+        baseline = time.perf_counter() - start
+        _report("fresh LIST", baseline, queries)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            index = ListingIndex(client, path=os.path.join(tmp, "index.sqlite"), ttl=3600)
+
+            start = time.perf_counter()
+            index.refresh(BUCKET, "data/")
+            _report("index build", time.perf_counter() - start, 1)
+
+            start = time.perf_counter()
+            for _ in range(queries):
+                _ = index.list_objects_size(BUCKET, "data/")
+            _report("index prefix", time.perf_counter() - start, queries, baseline)
+
+            start = time.perf_counter()
+            for _ in range(queries):
+                _ = index.glob(BUCKET, "data/1*.csv")
+            _report("index glob", time.perf_counter() - start, queries, baseline)
+
+            start = time.perf_counter()
+            for _ in range(queries):
+                _ = index.size(BUCKET, "data/")
+            _report("index size", time.perf_counter() - start, queries, baseline)
+
+            index.close()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+        float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.05,
+    )
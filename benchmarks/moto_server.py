@@ -0,0 +1,79 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Local moto server to run the benchmarks against."""
+import os
+import sys
+import time
+import socket
+import subprocess
+from contextlib import contextmanager
+from typing import Iterator
+from cloud_connectors.aws.s3 import Client
+
+
+CREDENTIALS = {
+    "aws_access_key_id": "AKIAAAAAAAAAAAAA1111",
+    "aws_secret_access_key": "aaaaaaaaxxxxxxxx02330128skjjhasdg7723s!!",
+    "region_name": "us-east-1",
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def moto_server() -> Iterator[dict]:
+    """Context manager to run moto server in a subprocess.
+
+    Returns:
+      s3 client configuration to connect to the server.
+    """
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "moto.server", "-p", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env={**os.environ, **{k.upper(): v for k, v in CREDENTIALS.items()}},
+    )
+    try:
+        for _ in range(100):
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        yield {**CREDENTIALS, "endpoint_url": f"http://127.0.0.1:{port}"}
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def create_bucket(configuration: dict, bucket: str) -> Client:
+    """Function to create a bucket on the moto server.
+
+    Args:
+      configuration: s3 client configuration.
+      bucket: Bucket name.
+
+    Returns:
+      s3 client.
+    """
+    client = Client(dict(configuration))
+    client.client.create_bucket(Bucket=bucket)
+    return client
+
+
+def add_latency(client: Client, seconds: float) -> None:
+    """Function to emulate the network round trip time of a remote endpoint.
+
+    Args:
+      client: s3 client.
+      seconds: Delay to add to every request.
+    """
+    if seconds:
+        client.client.meta.events.register(
+            "before-send.s3.*", lambda **kwargs: time.sleep(seconds)
+        )
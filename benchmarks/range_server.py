@@ -0,0 +1,105 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Local HTTP server serving S3 HEAD and ranged GET requests with the bandwidth caps.
+
+moto server re-reads the whole object for every ranged request, the server below
+serves a static object to measure the client side of the ranged transfers.
+"""
+import time
+import hashlib
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from benchmarks.moto_server import CREDENTIALS
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = b""
+    etag = ""
+    bandwidth = 0.
+    # the link shared by all connections, the chunks are sent in turns
+    total_bandwidth = 0.
+    link = {"lock": threading.Lock(), "free_at": 0.}
+
+    def log_message(self, *args) -> None: # pylint: disable=arguments-differ
+        pass
+
+    def _headers(self, status: int, length: int, content_range: str = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Last-Modified", "Thu, 01 Oct 2020 00:00:00 GMT")
+        if content_range:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+
+    def do_HEAD(self) -> None: # pylint: disable=invalid-name
+        self._headers(200, len(self.body))
+
+    def do_GET(self) -> None: # pylint: disable=invalid-name
+        start, end = 0, len(self.body) - 1
+        if "Range" in self.headers:
+            first, last = self.headers["Range"].split("=")[1].split("-")
+            start, end = int(first), min(int(last) if last else end, end)
+            self._headers(206, end - start + 1, f"bytes {start}-{end}/{len(self.body)}")
+        else:
+            self._headers(200, len(self.body))
+
+        view = memoryview(self.body)[start:end + 1]
+        chunk = 64 * 1024
+        began = time.perf_counter()
+        for position in range(0, len(view), chunk):
+            if self.total_bandwidth:
+                with self.link["lock"]:
+                    now = time.perf_counter()
+                    self.link["free_at"] = max(now, self.link["free_at"]) + \
+                        len(view[position:position + chunk]) / self.total_bandwidth
+                    delay = self.link["free_at"] - now
+                time.sleep(delay)
+            self.wfile.write(view[position:position + chunk])
+            if self.bandwidth:
+                delay = (position + chunk) / self.bandwidth - (time.perf_counter() - began)
+                if delay > 0:
+                    time.sleep(delay)
+
+
+@contextmanager
+def range_server(
+    body: bytes, bandwidth: float = 0., total_bandwidth: float = 0.
+) -> Iterator[dict]:
+    """Context manager to run the server in a thread.
+
+    Args:
+      body: Object served for any bucket and key.
+      bandwidth: Max bytes per second per connection, unlimited if 0.
+      total_bandwidth: Max bytes per second of all connections, unlimited if 0.
+
+    Returns:
+      s3 client configuration to connect to the server.
+    """
+    handler = type(
+        "Handler",
+        (_Handler,),
+        {
+            "body": body,
+            "etag": f'"{hashlib.md5(body).hexdigest()}"',
+            "bandwidth": bandwidth,
+            "total_bandwidth": total_bandwidth,
+            "link": {"lock": threading.Lock(), "free_at": 0.},
+        },
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield {
+            **CREDENTIALS,
+            "endpoint_url": f"http://127.0.0.1:{server.server_address[1]}",
+        }
+    finally:
+        server.shutdown()
+        server.server_close()
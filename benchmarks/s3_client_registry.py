@@ -0,0 +1,55 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Client construction cost and first request latency: new boto3 client vs. the shared registry.
+
+Usage:
+  python -m benchmarks.s3_client_registry [number_of_clients]
+"""
+import sys
+import time
+import boto3
+from benchmarks.moto_server import moto_server, create_bucket
+from cloud_connectors.aws import registry
+from cloud_connectors.aws.s3 import Client
+
+
+BUCKET = "benchmark"
+
+
+def _report(name: str, construction: float, request: float, count: int) -> None:
+    print(
+        f"{name:<20}{construction / count * 1000:>10.2f} ms/client"
+        f"{request / count * 1000:>10.2f} ms/first request"
+    )
+
+
+def main(count: int) -> None:
+    with moto_server() as configuration:
+        create_bucket(configuration, BUCKET).write(b"{}", BUCKET, "test.json")
+
+        construction, request = 0., 0.
+        for _ in range(count):
+            start = time.perf_counter()
+            client = boto3.client("s3", **configuration)
+            construction += time.perf_counter() - start
+
+            start = time.perf_counter()
+            client.head_object(Bucket=BUCKET, Key="test.json")
+            request += time.perf_counter() - start
+        _report("boto3.client", construction, request, count)
+
+        registry.clear()
+        construction, request = 0., 0.
+        for _ in range(count):
+            start = time.perf_counter()
+            client = Client(dict(configuration), metadata_cache_size=0)
+            construction += time.perf_counter() - start
+
+            start = time.perf_counter()
+            client.head(BUCKET, "test.json")
+            request += time.perf_counter() - start
+        _report("registry", construction, request, count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
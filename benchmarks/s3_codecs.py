@@ -0,0 +1,79 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Throughput and peak RSS of gzip objects: whole payload (de)compressed in memory
+vs. the streaming codecs of write_stream and read_stream.
+
+Every variant runs in its own process, so the peak RSS is not shared between them.
+
+Usage:
+  python -m benchmarks.s3_codecs [object_size_mb]
+"""
+import os
+import sys
+import gzip
+import json
+import time
+import resource
+import tempfile
+import subprocess
+from benchmarks.moto_server import moto_server, create_bucket
+from cloud_connectors.aws.s3 import Client
+
+
+BUCKET = "benchmark"
+MB = 1024 * 1024
+
+VARIANTS = ["write_in_memory", "write_stream", "read_in_memory", "read_stream"]
+
+
+def _run(variant: str, configuration: dict, path: str) -> None:
+    client = Client(configuration, metadata_cache_size=0)
+    size = os.path.getsize(path)
+
+    start = time.perf_counter()
+    if variant == "write_in_memory":
+        with open(path, "rb") as fread:
+            client.write(
+                gzip.compress(fread.read()), BUCKET, "in_memory.json.gz",
+                configuration={"ContentEncoding": "gzip"},
+            )
+    elif variant == "write_stream":
+        with open(path, "rb") as fread:
+            client.write_stream(BUCKET, "stream.json.gz", fread, codec="gzip")
+    elif variant == "read_in_memory":
+        size = len(gzip.decompress(client.read(BUCKET, "in_memory.json.gz")))
+    else:
+        chunks = client.read_stream(BUCKET, "stream.json.gz", codec="gzip")
+        size = sum(len(chunk) for chunk in chunks)
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is in KB on Linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{variant:<20}{size / MB / elapsed:>10.1f} MB/s{rss:>10.1f} MB peak RSS")
+
+
+def main(size: int) -> None:
+    with tempfile.NamedTemporaryFile(suffix=".json") as fwrite:
+        # random payloads keep the compression ratio close to real data
+        for i in range(size * MB // 100):
+            fwrite.write(json.dumps({"id": i, "payload": os.urandom(32).hex()}).encode("utf-8"))
+            fwrite.write(b"\n")
+        fwrite.flush()
+
+        with moto_server() as configuration:
+            create_bucket(configuration, BUCKET)
+            for variant in VARIANTS:
+                subprocess.run(
+                    [
+                        sys.executable, "-m", "benchmarks.s3_codecs",
+                        variant, json.dumps(configuration), fwrite.name,
+                    ],
+                    check=True,
+                )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in VARIANTS:
+        _run(sys.argv[1], json.loads(sys.argv[2]), sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 256)
@@ -0,0 +1,49 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Batched concurrent delete_objects of 1M keys against a local stand-in.
+
+The stand-in replaces the DeleteObjects call with a fixed per-request latency,
+so the benchmark measures the batching and the request concurrency.
+
+Usage:
+  python -m benchmarks.s3_delete_objects [number_of_keys] [latency_ms]
+"""
+import sys
+import time
+from cloud_connectors.aws.s3 import Client
+from benchmarks.moto_server import CREDENTIALS
+
+
+BUCKET = "benchmark"
+
+
+def main(keys: int, latency: float) -> None:
+    client = Client(dict(CREDENTIALS))
+
+    def _delete_objects(**kwargs) -> dict:
+        time.sleep(latency)
+        return {"Deleted": [{"Key": obj["Key"]} for obj in kwargs["Delete"]["Objects"]]}
+
+    client.client.delete_objects = _delete_objects
+
+    paths = (f"data/{i:08d}.json" for i in range(keys))
+    requests = -(-keys // Client.DELETE_BATCH_SIZE_MAX)
+    print(f"{keys} keys, {requests} requests, {latency * 1000:.0f} ms per request")
+    print(f"{'sequential estimate':<24}{requests * latency:>10.2f} s")
+
+    for max_concurrency in (1, 4, 16, 32):
+        paths = (f"data/{i:08d}.json" for i in range(keys))
+        start = time.perf_counter()
+        errors = client.delete_objects(BUCKET, paths, max_concurrency=max_concurrency)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{f'delete_objects x{max_concurrency}':<24}{elapsed:>10.2f} s"
+            f"{keys / elapsed:>14.0f} keys/s{len(errors):>8} errors"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000000,
+        float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.05,
+    )
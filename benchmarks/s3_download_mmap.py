@@ -0,0 +1,96 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Throughput and peak RSS of loading the object for a zero-copy consumer:
+read with the copy into the array buffer, download followed by mmap,
+and download_mmap writing the ranges straight into the mapping.
+
+The consumer computes CRC32 over the buffer, so every page is touched.
+Every variant runs in its own process, so the peak RSS is not shared between them.
+The resident pages of the mapped file are clean page cache, the kernel can drop them
+under memory pressure unlike the anonymous memory of read.
+
+Usage:
+  python -m benchmarks.s3_download_mmap [object_size_mb]
+"""
+import os
+import sys
+import mmap
+import json
+import time
+import zlib
+import resource
+import tempfile
+import subprocess
+from benchmarks.moto_server import moto_server, create_bucket
+from cloud_connectors.aws.s3 import Client
+
+
+BUCKET = "benchmark"
+PATH = "object.bin"
+MB = 1024 * 1024
+
+VARIANTS = ["read_copy", "download_then_mmap", "download_mmap"]
+
+
+def _run(variant: str, configuration: dict, path: str) -> None:
+    client = Client(configuration, metadata_cache_size=0)
+
+    start = time.perf_counter()
+    if variant == "read_copy":
+        # the bytes are copied into the array buffer, e.g. numpy.array(data)
+        buffer = bytearray(client.read(BUCKET, PATH))
+    elif variant == "download_then_mmap":
+        client.download(BUCKET, PATH, path)
+        with open(path, "rb") as fread:
+            buffer = mmap.mmap(fread.fileno(), 0, access=mmap.ACCESS_READ)
+    else:
+        buffer = client.download_mmap(BUCKET, PATH, path)
+    checksum = zlib.crc32(buffer)
+    elapsed = time.perf_counter() - start
+    size = len(buffer)
+
+    # ru_maxrss is in KB on Linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{variant:<20}{size / MB / elapsed:>10.1f} MB/s{rss:>10.1f} MB peak RSS"
+        f"{_rss_anonymous():>10.1f} MB anonymous RSS  crc32 {checksum:08x}"
+    )
+
+
+def _rss_anonymous() -> float:
+    """Function to get the resident anonymous memory, i.e. without the mapped file pages.
+
+    Returns:
+      RssAnon in MB, 0 if /proc is not available.
+    """
+    try:
+        with open("/proc/self/status") as fread:
+            for line in fread:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.
+
+
+def main(size: int) -> None:
+    with moto_server() as configuration, tempfile.TemporaryDirectory() as tmp:
+        create_bucket(configuration, BUCKET)
+        Client(dict(configuration)).write_stream(
+            BUCKET, PATH, (os.urandom(MB) for _ in range(size)), part_size=8 * MB
+        )
+        for variant in VARIANTS:
+            subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.s3_download_mmap",
+                    variant, json.dumps(configuration), os.path.join(tmp, f"{variant}.bin"),
+                ],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in VARIANTS:
+        _run(sys.argv[1], json.loads(sys.argv[2]), sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 256)
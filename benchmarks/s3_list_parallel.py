@@ -0,0 +1,52 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Sequential vs. prefix-sharded parallel listing against a local moto server.
+
+Usage:
+  python -m benchmarks.s3_list_parallel [number_of_prefixes] [objects_per_prefix] [latency_ms]
+
+moto server handles requests in a single python process, the latency emulates
+the round trip time of a remote endpoint which dominates listing against S3.
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from benchmarks.moto_server import moto_server, create_bucket, add_latency
+
+
+BUCKET = "benchmark"
+
+
+def main(prefixes: int, objects: int, latency: float) -> None:
+    with moto_server() as configuration:
+        client = create_bucket(configuration, BUCKET)
+        keys = [f"data/{p:03d}/{i:05d}.json" for p in range(prefixes) for i in range(objects)]
+        with ThreadPoolExecutor(32) as executor:
+            list(executor.map(lambda key: client.write(b"{}", BUCKET, key), keys))
+        add_latency(client, latency)
+
+        start = time.perf_counter()
+        count = sum(1 for _ in client.iter_objects(BUCKET, "data/"))
+        sequential = time.perf_counter() - start
+        print(f"{'sequential':<28}{count:>10} objects{sequential:>10.2f} s")
+
+        for max_concurrency in (2, 4, 8, 16):
+            for ordered in (True, False):
+                start = time.perf_counter()
+                count = sum(1 for _ in client.iter_objects_parallel(
+                    BUCKET, "data/", max_concurrency=max_concurrency, ordered=ordered,
+                ))
+                elapsed = time.perf_counter() - start
+                name = f"parallel x{max_concurrency} {'ordered' if ordered else 'unordered'}"
+                print(
+                    f"{name:<28}{count:>10} objects{elapsed:>10.2f} s"
+                    f"{sequential / elapsed:>8.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 16,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+        float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.05,
+    )
@@ -0,0 +1,53 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Serial read loop vs. read_many of small JSON objects with the emulated network latency.
+
+Usage:
+  python -m benchmarks.s3_read_many [number_of_objects] [latency_ms]
+"""
+import sys
+import json
+import time
+from cloud_connectors.aws.s3 import Client
+from benchmarks.moto_server import moto_server, create_bucket, add_latency
+
+
+BUCKET = "benchmark"
+
+
+def main(objects: int, latency: float) -> None:
+    with moto_server() as configuration:
+        create_bucket(configuration, BUCKET)
+        paths = [f"features/{i:06d}.json" for i in range(objects)]
+        client = Client(configuration, max_concurrency=64, metadata_cache_size=0)
+        for i, path in enumerate(paths):
+            client.write(json.dumps({"id": i, "weights": [i] * 32}).encode("utf-8"), BUCKET, path)
+
+        add_latency(client, latency)
+        print(f"{objects} objects, {latency * 1000:.0f} ms per request")
+
+        start = time.perf_counter()
+        for path in paths:
+            _ = client.read(BUCKET, path)
+        baseline = time.perf_counter() - start
+        print(f"{'read loop':<24}{baseline:>10.2f} s")
+
+        for max_concurrency in (8, 32, 64):
+            for ordered in (True, False):
+                start = time.perf_counter()
+                failed = sum(
+                    result.exception is not None
+                    for result in client.read_many(
+                        BUCKET, paths, max_concurrency=max_concurrency, ordered=ordered
+                    )
+                )
+                elapsed = time.perf_counter() - start
+                name = f"read_many x{max_concurrency}{'' if ordered else ' unordered'}"
+                print(f"{name:<24}{elapsed:>10.2f} s{baseline / elapsed:>8.1f}x{failed:>6} failed")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.02,
+    )
@@ -0,0 +1,47 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Single GET vs. parallel ranged GETs into a preallocated buffer.
+
+The object is served by a local server capping the bandwidth per connection,
+similar to the per-connection throughput limit of S3.
+
+Usage:
+  python -m benchmarks.s3_read_parallel [object_size_mb] [bandwidth_mb_per_connection]
+"""
+import os
+import sys
+import time
+from cloud_connectors.aws.s3 import Client
+from benchmarks.range_server import range_server
+
+
+BUCKET = "benchmark"
+PATH = "object.bin"
+MB = 1024 * 1024
+
+
+def main(size: int, bandwidth: float) -> None:
+    with range_server(os.urandom(size * MB), bandwidth * MB) as configuration:
+        client = Client(configuration)
+
+        start = time.perf_counter()
+        _ = client.read(BUCKET, PATH)
+        baseline = time.perf_counter() - start
+        print(f"{'read':<32}{size / baseline:>10.1f} MB/s")
+
+        for part_size in (4, 8, 16, 32):
+            for max_concurrency in (2, 4, 8):
+                start = time.perf_counter()
+                _ = client.read_parallel(
+                    BUCKET, PATH, part_size=part_size * MB, max_concurrency=max_concurrency
+                )
+                elapsed = time.perf_counter() - start
+                name = f"read_parallel {part_size} MB x{max_concurrency}"
+                print(f"{name:<32}{size / elapsed:>10.1f} MB/s{baseline / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 128,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 50.,
+    )
@@ -0,0 +1,107 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Latency of small interactive reads while bulk parallel reads saturate the link,
+without and with the shared transfer scheduler.
+
+The objects are served by a local server capping the total bandwidth of all connections.
+Every variant runs in its own process, so the peak RSS is not shared between them.
+
+Usage:
+  python -m benchmarks.s3_scheduler [object_size_mb] [total_bandwidth_mb]
+"""
+import os
+import sys
+import json
+import time
+import resource
+import threading
+import subprocess
+from cloud_connectors.aws.s3 import Client
+from cloud_connectors.scheduler import TransferScheduler
+from benchmarks.range_server import range_server
+
+
+BUCKET = "benchmark"
+PATH = "object.bin"
+MB = 1024 * 1024
+
+BULK_CALLERS = 4
+INTERACTIVE_READS = 50
+INTERACTIVE_SIZE = 64 * 1024
+
+VARIANTS = ["no_scheduler", "scheduler"]
+
+
+def _run(variant: str, configuration: dict) -> None:
+    scheduler = TransferScheduler(max_bytes=64 * MB, max_connections=8) \
+        if variant == "scheduler" else None
+    bulk = Client(dict(configuration), max_concurrency=64, scheduler=scheduler, priority="bulk")
+    interactive = Client(dict(configuration), max_concurrency=64, scheduler=scheduler)
+
+    stop = threading.Event()
+    received = []
+
+    def _bulk() -> None:
+        while not stop.is_set():
+            obj = bulk.read_parallel(BUCKET, PATH, part_size=4 * MB, max_concurrency=8)
+            received.append((time.perf_counter(), len(obj)))
+
+    threads = [threading.Thread(target=_bulk) for _ in range(BULK_CALLERS)]
+    for thread in threads:
+        thread.start()
+    time.sleep(1)
+
+    start = time.perf_counter()
+    latencies = []
+    for _ in range(INTERACTIVE_READS):
+        began = time.perf_counter()
+        interactive.read_range(BUCKET, PATH, 0, INTERACTIVE_SIZE)
+        latencies.append(time.perf_counter() - began)
+        time.sleep(0.01)
+    end = time.perf_counter()
+    elapsed = end - start
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    bulk_bytes = sum(size for received_at, size in received if start <= received_at <= end)
+    # ru_maxrss is in KB on Linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{variant:<16}"
+        f"p50 {latencies[len(latencies) // 2] * 1000:>8.1f} ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99)] * 1000:>8.1f} ms"
+        f"  bulk {bulk_bytes / MB / elapsed:>7.1f} MB/s"
+        f"  {rss:>8.1f} MB peak RSS"
+    )
+    if scheduler is not None:
+        stats = scheduler.stats()
+        for priority, granted in stats.granted.items():
+            print(
+                f"{'':<16}{priority:<12}{granted:>6} granted"
+                f"  wait avg {stats.wait_time[priority] / max(granted, 1) * 1000:>8.1f} ms"
+                f"  max {stats.wait_time_max[priority] * 1000:>8.1f} ms"
+            )
+
+
+def main(size: int, total_bandwidth: float) -> None:
+    with range_server(os.urandom(size * MB), total_bandwidth=total_bandwidth * MB) \
+            as configuration:
+        for variant in VARIANTS:
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.s3_scheduler", variant,
+                 json.dumps(configuration)],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in VARIANTS:
+        _run(sys.argv[1], json.loads(sys.argv[2]))
+    else:
+        main(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 64,
+            float(sys.argv[2]) if len(sys.argv) > 2 else 200.,
+        )
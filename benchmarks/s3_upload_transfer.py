@@ -0,0 +1,77 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Upload throughput across the transfer settings, and the cost of small uploads
+with a new TransferConfig per call vs. the reused transfer manager.
+
+Usage:
+  python -m benchmarks.s3_upload_transfer [file_size_mb] [number_of_small_files] [latency_ms]
+"""
+import os
+import sys
+import time
+import tempfile
+import boto3.s3.transfer
+from benchmarks.moto_server import moto_server, create_bucket, add_latency
+from cloud_connectors.aws import registry
+
+
+BUCKET = "benchmark"
+MB = 1024 * 1024
+
+SETTINGS = [
+    {"multipart_chunksize": 8 * MB, "max_concurrency": 1},
+    {"multipart_chunksize": 8 * MB, "max_concurrency": 4},
+    {"multipart_chunksize": 8 * MB, "max_concurrency": 10},
+    {"multipart_chunksize": 16 * MB, "max_concurrency": 10},
+    {"multipart_chunksize": 32 * MB, "max_concurrency": 10},
+]
+
+
+def main(size_mb: int, count: int, latency: float) -> None:
+    with moto_server() as configuration, tempfile.TemporaryDirectory() as tmp:
+        path_large = os.path.join(tmp, "large.bin")
+        path_small = os.path.join(tmp, "small.bin")
+        with open(path_large, "wb") as f:
+            f.write(os.urandom(size_mb * MB))
+        with open(path_small, "wb") as f:
+            f.write(os.urandom(1024))
+
+        registry.clear()
+        client = create_bucket(configuration, BUCKET)
+        add_latency(client, latency)
+
+        print(f"{'chunk, MB':>10}{'threads':>10}{'MB/s':>10}")
+        for settings in SETTINGS:
+            start = time.perf_counter()
+            client.upload(BUCKET, path_large, "large.bin", configuration=settings)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{settings['multipart_chunksize'] // MB:>10}{settings['max_concurrency']:>10}"
+                f"{size_mb / elapsed:>10.1f}"
+            )
+
+        # the calls alternate, so both variants see the same server state
+        new_config, reused = 0., 0.
+        for i in range(count):
+            start = time.perf_counter()
+            client.client.upload_file(
+                Filename=path_small,
+                Bucket=BUCKET,
+                Key=f"small/new/{i}",
+                Config=boto3.s3.transfer.TransferConfig(),
+            )
+            new_config += time.perf_counter() - start
+
+            start = time.perf_counter()
+            client.upload(BUCKET, path_small, f"small/reused/{i}")
+            reused += time.perf_counter() - start
+        print(f"{'new TransferConfig':<25}{new_config / count * 1000:>10.2f} ms/upload")
+        print(f"{'reused transfer manager':<25}{reused / count * 1000:>10.2f} ms/upload")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 64,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+        float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.,
+    )
@@ -0,0 +1,41 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+"""Per-call config validation cost: compile on every call vs. the shared validator registry.
+
+Usage:
+  python -m benchmarks.validators [number_of_calls]
+"""
+import sys
+import timeit
+import fastjsonschema
+from cloud_connectors.aws.s3 import Client
+from cloud_connectors.validators import validate
+
+
+CASES = {
+    "CLIENT_CONFIG_SCHEMA": (
+        Client.CLIENT_CONFIG_SCHEMA,
+        {
+            "aws_access_key_id": "AKIAAAAAAAAAAAAA1111",
+            "aws_secret_access_key": "aaaaaaaaxxxxxxxx02330128skjjhasdg7723s!!",
+        },
+    ),
+    "S3_TRANSFER_SCHEMA": (
+        Client.S3_TRANSFER_SCHEMA,
+        {"multipart_threshold": 8388608, "max_concurrency": 10},
+    ),
+}
+
+
+def main(number: int) -> None:
+    print(f"{'schema':<24}{'compile per call, us':>24}{'registry, us':>16}{'speedup':>10}")
+    for name, (schema, data) in CASES.items():
+        before = timeit.timeit(
+            lambda: fastjsonschema.validate(schema, dict(data)), number=number
+        ) / number
+        after = timeit.timeit(lambda: validate(schema, dict(data)), number=number) / number
+        print(f"{name:<24}{before * 1e6:>24.1f}{after * 1e6:>16.1f}{before / after:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -3,10 +3,12 @@
 
 from collections import namedtuple
 from typing import List, Tuple, Any, NamedTuple
-import psycopg2
-import psycopg2.extras
-import fastjsonschema
 from cloud_connectors import exceptions
+from cloud_connectors.lazy import lazy_import
+from cloud_connectors.validators import validate
+
+psycopg2 = lazy_import("psycopg2")
+fastjsonschema = lazy_import("fastjsonschema")
 
 
 class Client:
@@ -80,7 +82,7 @@ class Client:
                  config: dict = CONF_DEFAULT,
                  autocommit: bool = True) -> None:
         try:
-            _ = fastjsonschema.validate(Client.SCHEMA, config)
+            _ = validate(Client.SCHEMA, config)
         except fastjsonschema.JsonSchemaException as ex:
             raise exceptions.ConfigurationError(ex)
 
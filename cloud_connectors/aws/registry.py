@@ -0,0 +1,115 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+import json
+from threading import RLock
+from typing import Any, Dict, Tuple
+from cloud_connectors.lazy import lazy_import
+
+boto3 = lazy_import("boto3")
+botocore_config = lazy_import("botocore.config")
+
+
+SESSION_KEYS = ["aws_access_key_id", "aws_secret_access_key", "aws_session_token", "region_name"]
+MAX_POOL_CONNECTIONS_DEFAULT = 10
+
+_SESSIONS: Dict[str, "boto3.session.Session"] = {}
+_CLIENTS: Dict[str, Tuple[int, Any]] = {}
+_LOCK = RLock()
+
+
+def _key(*args: Any) -> str:
+    """Function to build the registry key.
+
+    Args:
+      args: Key components.
+
+    Returns:
+      Canonical key.
+    """
+    return json.dumps(args, sort_keys=True, default=str)
+
+
+def get_session(configuration: dict = None) -> "boto3.session.Session":
+    """Function to get the shared boto3 session for the credentials and region.
+
+    Args:
+      configuration: Client configuration, only credentials and region are used.
+
+    Returns:
+      boto3 session.
+    """
+    configuration = configuration if configuration else {}
+    parameters = {k: configuration[k] for k in SESSION_KEYS if configuration.get(k) is not None}
+    key = _key(parameters)
+
+    session = _SESSIONS.get(key)
+    if session is None:
+        with _LOCK:
+            session = _SESSIONS.get(key)
+            if session is None:
+                session = boto3.session.Session(**parameters)
+                _SESSIONS[key] = session
+    return session
+
+
+def get_client(service: str, configuration: dict = None, max_concurrency: int = None) -> Any:
+    """Function to get the shared boto3 client for the effective configuration.
+
+    Clients are created once per configuration and reused by all callers,
+    so their connection pools stay warm. The pool is sized to fit max_concurrency,
+    a larger client replaces the registered one when more concurrency is requested.
+    boto3 clients are thread-safe, event handlers registered on a shared client
+    affect all its users.
+
+    Args:
+      service: AWS service name, e.g. s3.
+      configuration: Client configuration, see boto3.session.Session.client.
+        The "config" may be a dict of botocore.config.Config parameters.
+      max_concurrency: Max number of concurrent requests the caller sends.
+
+    Returns:
+      boto3 client.
+    """
+    configuration = dict(configuration) if configuration else {}
+    config = configuration.pop("config", None)
+    if isinstance(config, botocore_config.Config):
+        # pylint: disable=protected-access
+        config = dict(config._user_provided_options)
+    config = {k: v for k, v in (config if config else {}).items() if v is not None}
+
+    max_pool_connections = max(
+        config.pop("max_pool_connections", MAX_POOL_CONNECTIONS_DEFAULT),
+        max_concurrency if max_concurrency else 0,
+    )
+    parameters = {k: v for k, v in configuration.items() if v is not None}
+    key = _key(service, parameters, config)
+
+    entry = _CLIENTS.get(key)
+    if entry is None or entry[0] < max_pool_connections:
+        with _LOCK:
+            entry = _CLIENTS.get(key)
+            if entry is None or entry[0] < max_pool_connections:
+                session = get_session(parameters)
+                client_parameters = {k: v for k, v in parameters.items() if k not in SESSION_KEYS}
+                client = session.client(
+                    service,
+                    region_name=parameters.get("region_name"),
+                    aws_access_key_id=parameters.get("aws_access_key_id"),
+                    aws_secret_access_key=parameters.get("aws_secret_access_key"),
+                    aws_session_token=parameters.get("aws_session_token"),
+                    config=botocore_config.Config(
+                        **config, max_pool_connections=max_pool_connections
+                    ),
+                    **client_parameters,
+                )
+                entry = (max_pool_connections, client)
+                _CLIENTS[key] = entry
+    return entry[1]
+
+
+def clear() -> None:
+    """Function to drop all registered sessions and clients."""
+    with _LOCK:
+        _SESSIONS.clear()
+        _CLIENTS.clear()
@@ -2,12 +2,224 @@
 # www.dkisler.com
 
 import os
-from typing import List, Tuple
-import boto3
-from fastjsonschema import validate, JsonSchemaException
+import copy
+import json
+import mmap
+import shutil
+import weakref
+import hashlib
+from urllib.parse import urlencode
+from datetime import datetime
+import tempfile
+from collections import deque
+from typing import (Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Tuple, Union)
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from threading import Lock, get_ident
 from botocore.exceptions import ClientError, NoCredentialsError, ParamValidationError
 from cloud_connectors.template.cloud_storage import Client as ClientCommon
-from cloud_connectors import exceptions
+from cloud_connectors.aws import registry
+from cloud_connectors import checksums, codecs, exceptions, local_select
+from cloud_connectors.cache import DiskCache, MetadataCache
+from cloud_connectors.concurrency import bounded_map, merge_iterators, shared_executor
+from cloud_connectors.lazy import lazy_import
+from cloud_connectors.scheduler import PRIORITIES, TransferScheduler, TransferSlot
+from cloud_connectors.validators import validate
+
+boto3_transfer = lazy_import("boto3.s3.transfer")
+fastjsonschema = lazy_import("fastjsonschema")
+
+
+def _iter_chunks(
+    source: Union[Iterable[bytes], BinaryIO], chunk_size: int
+) -> Iterable[bytes]:
+    """Function to iterate over a stream chunk by chunk.
+
+    Args:
+      source: Bytes, iterator of bytes chunks, or readable binary file object.
+      chunk_size: Size of the chunks read from a file object.
+
+    Returns:
+      Iterator over the chunks.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return [source]
+    if hasattr(source, "read"):
+        return iter(partial(source.read, chunk_size), b"")
+    return source
+
+
+def _iter_parts(source: Union[Iterable[bytes], BinaryIO], part_size: int) -> Iterator[bytes]:
+    """Function to split a stream into parts of the fixed size.
+
+    Args:
+      source: Iterator of bytes chunks, or readable binary file object.
+      part_size: Part size in bytes, the last part can be smaller.
+
+    Returns:
+      Iterator over the parts.
+    """
+    buffer = bytearray()
+    for chunk in _iter_chunks(source, part_size):
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _local_etag(path: str, multipart_threshold: int, multipart_chunksize: int) -> str:
+    """Function to compute the S3 ETag of a file for the given multipart settings.
+
+    Args:
+      path: Path to the file on fs.
+      multipart_threshold: File size to switch to multipart upload at.
+      multipart_chunksize: Size of the uploaded parts.
+
+    Returns:
+      MD5 hex digest of the file, or of its parts digests suffixed with the number of parts.
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as fread:
+        if size < multipart_threshold:
+            digest = hashlib.md5()
+            for chunk in iter(partial(fread.read, 1024 * 1024), b""):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+        digests = [
+            hashlib.md5(chunk).digest()
+            for chunk in iter(partial(fread.read, multipart_chunksize), b"")
+        ]
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+def _release(slot: TransferSlot, body: Any = None) -> None:
+    """Function to close the response body and release the transfer slot.
+
+    Args:
+      slot: Acquired transfer slot.
+      body: Response body, or event stream.
+    """
+    try:
+        if body is not None:
+            body.close()
+    finally:
+        slot.release()
+
+
+class _HoldingIterator:
+    """Iterator over the chunks holding the transfer slot and the response body.
+
+    The slot is released and the body is closed once the iterator is exhausted, fails,
+    is closed, or garbage collected. Unlike a generator, it's released by close
+    before the first chunk is read too.
+
+    Args:
+      chunks: Iterator of the object chunks.
+      slot: Acquired transfer slot.
+      body: Response body, or event stream, closed with the iterator.
+    """
+
+    __slots__ = ["chunks", "finalizer", "__weakref__"]
+
+    def __init__(self, chunks: Iterable[bytes], slot: TransferSlot, body: Any = None) -> None:
+        self.chunks = iter(chunks)
+        self.finalizer = weakref.finalize(self, _release, slot, body)
+
+    def __iter__(self) -> "_HoldingIterator":
+        return self
+
+    def __next__(self) -> bytes:
+        try:
+            return next(self.chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "_HoldingIterator":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Function to stop the iteration and release the slot, the repeated calls are ignored."""
+        try:
+            close = getattr(self.chunks, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self.finalizer()
+
+
+def _verifiable_etag(resp: dict) -> Optional[str]:
+    """Function to get the object ETag if it's derived from the object content.
+
+    The ETag of the objects encrypted with SSE-KMS, or SSE-C is not the MD5 of the content.
+
+    Args:
+      resp: head_object, get_object, or put_object response.
+
+    Returns:
+      ETag without the quotes, None if it cannot be used to verify the content.
+    """
+    if resp.get("ServerSideEncryption") == "aws:kms" or resp.get("SSECustomerAlgorithm"):
+        return None
+    etag = resp.get("ETag")
+    return etag.strip('"') if etag else None
+
+
+def _iter_select_records(events: Iterable[dict]) -> Iterator[bytes]:
+    """Function to extract the records payload from the S3 Select events stream.
+
+    Args:
+      events: S3 Select response events.
+
+    Returns:
+      Iterator over the records payload chunks.
+    """
+    for event in events:
+        if "Records" in event:
+            yield event["Records"]["Payload"]
+
+
+def _select_unsupported(ex: ClientError) -> bool:
+    """Function to check if the error means the backend doesn't support S3 Select.
+
+    Args:
+      ex: select_object_content error.
+
+    Returns:
+      True if the request is rejected as not implemented, or not allowed.
+    """
+    code = ex.response.get("Error", {}).get("Code")
+    if code in Client.SELECT_UNSUPPORTED_ERRORS:
+        return True
+    # the backends without the route, e.g. older moto, respond with a bare status code
+    status_code = ex.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return status_code in Client.SELECT_UNSUPPORTED_STATUS_CODES \
+        and code in [None, "", str(status_code)]
+
+
+def _transfer_configuration(configuration: dict = None) -> dict:
+    """Function to validate the transfer configuration and fill in the defaults.
+
+    Args:
+      configuration: Transfer config parameters.
+
+    Returns:
+      Transfer config parameters with the defaults.
+
+    Raises:
+      exceptions.ConfigurationError: Raised when provided transfer configuration is wrong.
+    """
+    try:
+        return validate(Client.S3_TRANSFER_SCHEMA, dict(configuration) if configuration else {})
+    except fastjsonschema.JsonSchemaException as ex:
+        raise exceptions.ConfigurationError(ex)
 
 
 class Client(ClientCommon):
@@ -22,7 +234,23 @@ class Client(ClientCommon):
           See config key:
             https://botocore.amazonaws.com/v1/documentation/api/1.17.2/reference/config.html
 
+        The boto3 client is shared by the Client instances with the same configuration.
+      max_concurrency: Max number of concurrent requests to size the connections pool for.
+      metadata_cache_size: Max number of objects metadata entries to cache, disabled by default.
+        The cached metadata is not revalidated, the changes by other clients are seen
+        once the entries expire.
+      metadata_cache_ttl: Lifetime of the cached objects metadata in seconds.
+      disk_cache_dir: Path to the local directory to cache the objects read and downloaded,
+        the objects are revalidated with conditional GET requests. Disabled if not set.
+      disk_cache_max_bytes: Total size budget of the disk cache in bytes.
+      scheduler: Transfer scheduler shared with other clients to cap the bytes
+        and the connections in flight. The object reads, ranges, parts and S3 Select requests
+        are scheduled, download and upload transfer the objects by parts with it.
+        The server side copies hold a connection, their bytes don't pass through the client.
+      priority: Priority class of the transfers, "interactive", or "bulk".
+
     Raises:
+      ValueError: Raised when unknown priority class provided.
       exceptions.ConnectionError: Raised when a connection error to s3 occurred.
       exceptions.ConfigurationError: Raised when provided connection configuration is wrong.
     """
@@ -282,16 +510,83 @@ class Client(ClientCommon):
     }
     # fmt: on
 
-    def __init__(self, configuration: dict = None) -> None:
+    BATCH_RESULT_TUPLE = NamedTuple(
+        "batch_result", [("succeeded", List[str]), ("failed", Dict[str, Exception])]
+    )
+    READ_RESULT_TUPLE = NamedTuple(
+        "read_result", [("path", str), ("data", bytes), ("exception", Exception)]
+    )
+    DELETE_RESULT_TUPLE = NamedTuple("delete_result", [("count", int), ("failed", Dict[str, str])])
+    TRANSFER_SUMMARY_TUPLE = NamedTuple(
+        "transfer_summary",
+        [("files", int), ("bytes", int), ("skipped", int), ("failed", Dict[str, Exception])],
+    )
+    OBJECT_METADATA_TUPLE = NamedTuple(
+        "object_metadata",
+        [("size", int), ("etag", str), ("content_type", str), ("last_modified", datetime)],
+    )
+
+    LIST_PAGE_SIZE_MAX = 1000
+    READ_CHUNK_SIZE = 256 * 1024
+    MULTIPART_PART_SIZE_MIN = 5 * 1024 * 1024
+    MULTIPART_PARTS_MAX = 10000
+    COPY_OBJECT_SIZE_MAX = 5 * 1024 ** 3
+    DELETE_BATCH_SIZE_MAX = 1000
+    # error codes of the backends without S3 Select, the other errors are not masked by the fallback
+    SELECT_UNSUPPORTED_ERRORS = ["NotImplemented", "MethodNotAllowed", "UnsupportedOperation"]
+    SELECT_UNSUPPORTED_STATUS_CODES = [404, 501]
+    COPY_METADATA_KEYS = [
+        "Metadata",
+        "CacheControl",
+        "ContentDisposition",
+        "ContentEncoding",
+        "ContentLanguage",
+        "Expires",
+    ]
+
+    def __init__(
+        self,
+        configuration: dict = None,
+        max_concurrency: int = 10,
+        metadata_cache_size: int = 0,
+        metadata_cache_ttl: float = 60,
+        disk_cache_dir: str = None,
+        disk_cache_max_bytes: int = 1024 ** 3,
+        scheduler: TransferScheduler = None,
+        priority: str = "interactive",
+    ) -> None:
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}', use one of {PRIORITIES}.")
+
         if configuration:
             try:
                 _ = validate(Client.CLIENT_CONFIG_SCHEMA, configuration)
-            except JsonSchemaException as ex:
+            except fastjsonschema.JsonSchemaException as ex:
                 raise exceptions.ConfigurationError(ex)
         else:
             configuration = {}
 
-        self.client = boto3.client("s3", **configuration)
+        self.configuration = configuration
+        self.client = registry.get_client("s3", configuration, max_concurrency=max_concurrency)
+        self.transfers = {}
+        self.transfers_lock = Lock()
+        self.metadata_cache = MetadataCache(max_size=metadata_cache_size, ttl=metadata_cache_ttl)
+        self.disk_cache = DiskCache(disk_cache_dir, max_bytes=disk_cache_max_bytes) \
+            if disk_cache_dir else None
+        self.scheduler = scheduler
+        self.priority = priority
+
+    def _slot(self, size: int = 0, caller: int = None) -> TransferSlot:
+        """Function to get the transfer slot of the client scheduler.
+
+        Args:
+          size: Number of bytes to transfer, 0 if not known before the request.
+          caller: Caller to queue the request for, the current thread if not set.
+
+        Returns:
+          Transfer slot, it doesn't limit anything if the client has no scheduler.
+        """
+        return TransferSlot(self.scheduler, size=size, priority=self.priority, caller=caller)
 
     def list_buckets(self) -> List[str]:
         """Function to list buckets.
@@ -327,7 +622,7 @@ class Client(ClientCommon):
         Raises:
           exceptions.BucketNotFound: Raised when the bucket not found.
         """
-        return [obj["Key"] for obj in self._list_objects(
+        return [obj["Key"] for obj in self.iter_objects(
             bucket=bucket, prefix=prefix, max_objects=max_objects
         )]
 
@@ -347,258 +642,1812 @@ class Client(ClientCommon):
         Raises:
           exceptions.BucketNotFound: Raised when the bucket not found.
         """
-        return [(obj["Key"], obj["Size"]) for obj in self._list_objects(
+        return [(obj["Key"], obj["Size"]) for obj in self.iter_objects(
             bucket=bucket, prefix=prefix, max_objects=max_objects
         )]
 
-    def _list_objects(
-        self, bucket: str, prefix: str = "", max_objects: int = None
-    ) -> List[dict]:
-        """Function to list objects in a bucket with their size.
+    def iter_objects(
+        self,
+        bucket: str,
+        prefix: str = "",
+        max_objects: int = None,
+        page_size: int = None,
+        start_after: str = None,
+    ) -> Iterator[dict]:
+        """Function to iterate over objects in a bucket page by page.
+
+        Objects are fetched lazily, no LIST requests are sent once max_objects is reached.
 
         Args:
           bucket: Bucket name.
           prefix: Objects prefix to restrict the list of results.
-          max_objects: Max number of keys to output.
+          max_objects: Max number of objects to output.
+          page_size: Max number of objects to fetch per LIST request (up to 1000).
+          start_after: Path to start listing after.
 
         Returns:
-          List of objects attributes in the bucket.
+          Iterator over objects attributes in the bucket.
 
         Raises:
           exceptions.BucketNotFound: Raised when the bucket not found.
         """
-        output = []
-        max_objects = max_objects if max_objects else 1000
+        for page in self._iter_pages(
+            bucket=bucket,
+            prefix=prefix,
+            max_objects=max_objects,
+            page_size=page_size,
+            start_after=start_after,
+        ):
+            yield from page
 
-        paginator = self.client.get_paginator("list_objects_v2")
+    def iter_objects_size(
+        self, bucket: str, prefix: str = "", start_after: str = None
+    ) -> Iterator[Tuple[str, int]]:
+        """Function to iterate over objects in a bucket with their size.
 
-        try:
-            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-                if "Contents" in page:
-                    output.extend(page["Contents"])
-        except ParamValidationError as ex:
-            raise exceptions.BucketNotFound(ex)
-        except ClientError as ex:
-            if type(ex).__name__ == "NoSuchBucket":
-                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix to restrict the list of results.
+          start_after: Path to start listing after.
+
+        Returns:
+          Iterator over tuples with objects path and size in bytes.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        for obj in self.iter_objects(bucket=bucket, prefix=prefix, start_after=start_after):
+            yield obj["Key"], obj["Size"]
 
-        return output
+    def iter_objects_parallel(
+        self,
+        bucket: str,
+        prefix: str = "",
+        shards: List[str] = None,
+        delimiter: str = "/",
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        page_size: int = None,
+    ) -> Iterator[dict]:
+        """Function to iterate over objects in a bucket listing several shards concurrently.
 
-    def read(self, bucket: str, path: str) -> bytes:
-        """Function to read the object from a bucket into memory.
+        The listing is split into shards either by the sub-prefixes found with the delimiter
+        one level below the prefix, or by the provided shard boundaries. Shards are listed
+        on a bounded thread pool and the output is streamed as the pages arrive.
 
         Args:
           bucket: Bucket name.
-          path: Path to locate the object in a bucket.
+          prefix: Objects prefix to restrict the list of results.
+          shards: Keys to split the listing at, e.g. ["data/2020", "data/2021"].
+            Every key closes a shard, the next shard is listed with StartAfter the key.
+            Sub-prefixes are discovered with the delimiter if not provided.
+          delimiter: Delimiter to discover the sub-prefixes with.
+          max_concurrency: Max number of shards listed at the same time.
+          ordered: Output objects in the key order, otherwise as the pages arrive.
+          page_size: Max number of objects to fetch per LIST request (up to 1000).
 
         Returns:
-          Bytes encoded object.
+          Iterator over objects attributes in the bucket.
 
         Raises:
-          ConnectionError: Raised when connection error occured.
-          exceptions.ObjectNotFound: Raised when the object not found.
           exceptions.BucketNotFound: Raised when the bucket not found.
         """
-        try:
-            obj = self.client.get_object(Bucket=bucket, Key=path)
-            return obj["Body"].read()
-        except ParamValidationError as ex:
-            raise exceptions.BucketNotFound(ex)
-        except NoCredentialsError: # pragma: no cover
-            raise ConnectionError("Cannot connect, no credentials provided")
-        except Exception as ex:
-            if type(ex).__name__ == "NoSuchKey":
-                raise exceptions.ObjectNotFound(
-                    f"Object '{path}' not found in bucket '{bucket}'"
-                )
-            if type(ex).__name__ in ["NoSuchBucket", "InvalidBucketName"]:
-                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found: {ex}")
-            raise Exception(ex) # pragma: no cover
+        if shards:
+            producers = self._shards_ranges(bucket, prefix, sorted(set(shards)), page_size)
+        else:
+            producers = self._shards_prefixes(bucket, prefix, delimiter, page_size)
 
-    def write(
-        self, obj: bytes, bucket: str, path: str, configuration: dict = None
-    ) -> None:
-        """Function to write the object from memory into bucket.
+        for page in merge_iterators(producers, max_concurrency=max_concurrency, ordered=ordered):
+            yield from page
+
+    def _shards_ranges(
+        self, bucket: str, prefix: str, boundaries: List[str], page_size: int = None
+    ) -> List[Callable[[], Iterator[List[dict]]]]:
+        """Function to define the listing shards by the keys boundaries.
 
         Args:
-          obj: Object data to store in a bucket.
           bucket: Bucket name.
-          path: Path to store the object to.
-          configuration: Extra configurations.
-            See: https://boto3.amazonaws.com/v1/documentation/api/1.14.3/reference/services/s3.html?highlight=s3%20client#S3.Client.put_object
-            For example:
-            *.json.gz file should be uploaded with the following configuration:
-                {
-                    "ContentEncoding": "gzip",
-                    "ContentType": "application/json"
-                }
+          prefix: Objects prefix to restrict the list of results.
+          boundaries: Sorted keys to split the listing at.
+          page_size: Max number of objects to fetch per LIST request.
 
-        Raises:
-          ConnectionError: Raised when connection error occured.
-          TypeError: Raised when provided attributes have wrong types.
-          exceptions.BucketNotFound: Raised when the bucket not found.
+        Returns:
+          Functions listing the shards pages.
         """
-        configuration = configuration if configuration else {}
-        try:
-            self.client.put_object(Body=obj, Bucket=bucket, Key=path, **configuration)
-        except NoCredentialsError: # pragma: no cover
-            raise ConnectionError("Cannot connect, no credentials provided")
-        except Exception as ex:
-            if type(ex).__name__ == "NoSuchBucket":
-                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
-            if type(ex).__name__ == "ParamValidationError":
-                raise TypeError("Provided function attributes have wrong type.")
-            raise Exception(ex) # pragma: no cover
+        def _shard(start_after: str, end: str) -> Iterator[List[dict]]:
+            for page in self._iter_pages(
+                bucket=bucket, prefix=prefix, page_size=page_size, start_after=start_after
+            ):
+                if end is not None and page[-1]["Key"] >= end:
+                    page = [obj for obj in page if obj["Key"] <= end]
+                    if page:
+                        yield page
+                    return
+                yield page
 
-    def upload(
-        self, bucket: str, path_source: str, path_destination: str = None
-    ) -> None:
-        """Function to upload the object from disk into a bucket.
+        starts = [None, *boundaries]
+        ends = [*boundaries, None]
+        return [partial(_shard, start_after=start, end=end) for start, end in zip(starts, ends)]
+
+    def _shards_prefixes(
+        self, bucket: str, prefix: str, delimiter: str, page_size: int = None
+    ) -> List[Callable[[], Iterator[List[dict]]]]:
+        """Function to define the listing shards by the sub-prefixes.
 
         Args:
           bucket: Bucket name.
-          path_source: Path to locate the object on fs.
-          path_destination: Path to store the object to.
+          prefix: Objects prefix to restrict the list of results.
+          delimiter: Delimiter to discover the sub-prefixes with.
+          page_size: Max number of objects to fetch per LIST request.
+
+        Returns:
+          Functions listing the shards pages.
 
         Raises:
-          FileNotFoundError: Raised when file path_source not found.
           exceptions.BucketNotFound: Raised when the bucket not found.
         """
-        if not os.path.exists(path_source):
-            raise FileNotFoundError(f"{path_source} not found")
+        # objects stored directly under the prefix are listed by the discovery requests
+        entries = []
+        kwargs = {"Bucket": bucket, "Prefix": prefix, "Delimiter": delimiter}
+        while True:
+            page = self._list_page(**kwargs)
+            entries.extend((obj["Key"], obj) for obj in page.get("Contents", []))
+            entries.extend((i["Prefix"], None) for i in page.get("CommonPrefixes", []))
+            if not page.get("IsTruncated"):
+                break
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+        entries.sort(key=lambda entry: entry[0])
 
-        try:
-            self.client.upload_file(
-                Filename=path_source,
-                Bucket=bucket,
-                Key=path_destination if path_destination else path_source,
+        producers = []
+        objects = []
+        for key, obj in entries:
+            if obj is not None:
+                objects.append(obj)
+                continue
+            if objects:
+                producers.append(partial(iter, [objects]))
+                objects = []
+            producers.append(
+                partial(self._iter_pages, bucket=bucket, prefix=key, page_size=page_size)
             )
-        except Exception as ex:
-            if type(ex).__name__ == "S3UploadFailedError":
-                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
-            raise Exception(ex) # pragma: no cover
+        if objects:
+            producers.append(partial(iter, [objects]))
+        return producers
 
-    def download(
+    def _iter_pages(
         self,
         bucket: str,
-        path_source: str,
-        path_destination: str,
-        configuration: dict = None,
-    ) -> None:
-        """Function to download the object from a bucket to disk.
+        prefix: str = "",
+        max_objects: int = None,
+        page_size: int = None,
+        start_after: str = None,
+    ) -> Iterator[List[dict]]:
+        """Function to iterate over the LIST pages of objects in a bucket.
 
         Args:
           bucket: Bucket name.
-          path_source: Path to locate the object in bucket.
-          path_destination: Fs path to store the object to.
-          configuration: Transfer config parameters.
-            See: https://boto3.amazonaws.com/v1/documentation/api/1.14.2/reference/customizations/s3.html#boto3.s3.transfer.TransferConfig
+          prefix: Objects prefix to restrict the list of results.
+          max_objects: Max number of objects to output.
+          page_size: Max number of objects to fetch per LIST request (up to 1000).
+          start_after: Key to start listing after.
+
+        Returns:
+          Iterator over lists of objects attributes in the bucket.
 
         Raises:
-          exceptions.ObjectNotFound: Raised when the object not found.
           exceptions.BucketNotFound: Raised when the bucket not found.
-          exceptions.DestinationPathError: Raised when cannot save object to provided location.
-          exceptions.DestinationPathPermissionsError: Raised when cannot save object to provided
-            location due to lack of permissons.
         """
-        if configuration:
-            try:
-                _ = validate(Client.S3_TRANSFER_SCHEMA, configuration)
-            except JsonSchemaException as ex:
-                raise exceptions.ConfigurationError(ex)
-        else:
-            configuration = {k: v["default"]
-                for k, v in Client.S3_TRANSFER_SCHEMA["properties"].items()
-            }
+        page_size = min(page_size, Client.LIST_PAGE_SIZE_MAX) if page_size \
+            else Client.LIST_PAGE_SIZE_MAX
+        remaining = max_objects
+        kwargs = {"Bucket": bucket, "Prefix": prefix}
+        if start_after:
+            kwargs["StartAfter"] = start_after
 
-        try:
-            self.client.download_file(
-                Filename=path_destination,
-                Bucket=bucket,
-                Key=path_source,
-                Config=boto3.s3.transfer.TransferConfig(**configuration),
-            )
-        except (NotADirectoryError, FileNotFoundError):
-            raise exceptions.DestinationPathError(
-                f"Cannot download file to {path_destination}"
-            )
-        except PermissionError:
-            raise exceptions.DestinationPathPermissionsError(
-                f"Cannot download file to {path_destination}"
-            )
-        except ClientError as ex:
-            if type(ex).__name__ == "NoSuchBucket":
-                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
-            if ex.response["Error"]["Code"] == "404":
-                raise exceptions.ObjectNotFound(
-                    f"Object '{path_source}' not found in bucket '{bucket}'"
+        while remaining is None or remaining > 0:
+            kwargs["MaxKeys"] = page_size if remaining is None else min(page_size, remaining)
+            page = self._list_page(**kwargs)
+
+            contents = page.get("Contents", [])
+            if contents:
+                self.metadata_cache.put_many(
+                    bucket,
+                    (
+                        (obj["Key"], {
+                            "ContentLength": obj["Size"],
+                            "ETag": obj["ETag"],
+                            "LastModified": obj["LastModified"],
+                        })
+                        for obj in contents
+                    ),
+                    complete=False,
                 )
-            raise Exception(ex) # pragma: no cover
+                if remaining is not None:
+                    remaining -= len(contents)
+                yield contents
 
-    def copy(
-        self,
-        bucket_source: str,
-        bucket_destination: str,
-        path_source: str,
-        path_destination: str = None,
-        configuration: dict = None,
-    ) -> None:
-        """Function to copy the object from bucket to bucket.
+            if not page.get("IsTruncated"):
+                break
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    def _list_page(self, **kwargs) -> dict:
+        """Function to send a single LIST request.
 
         Args:
-          bucket_source: Bucket name source.
-          bucket_destination: Bucket name destination.
-          path_source: Initial path to locate the object in bucket.
-          path_destination: Final path to locate the object in bucket.
-          configuration: Extra configurations.
-            #S3.Client.copy_object
-            See: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html?highlight=copy_object
+          kwargs: list_objects_v2 request parameters.
+
+        Returns:
+          list_objects_v2 response.
 
         Raises:
-          ConnectionError: Raised when a connection error to s3 occurred.
-          exceptions.ObjectNotFound: Raised when the object not found.
           exceptions.BucketNotFound: Raised when the bucket not found.
         """
-        configuration = configuration if configuration else {}
-        if (bucket_destination, path_destination) == (bucket_source, path_source):
-            configuration["MetadataDirective"] = "REPLACE"
-
         try:
-            obj = self.client.get_object(Bucket=bucket_source, Key=path_source)
-        except NoCredentialsError: # pragma: no cover
-            raise ConnectionError("Cannot connect, no credentials provided")
+            return self.client.list_objects_v2(**kwargs)
+        except ParamValidationError as ex:
+            raise exceptions.BucketNotFound(ex)
         except ClientError as ex:
-            if type(ex).__name__ == "NoSuchKey":
-                raise exceptions.ObjectNotFound(
-                    f"Object '{path_source}' not found in bucket '{bucket_source}'"
-                )
             if type(ex).__name__ == "NoSuchBucket":
-                raise exceptions.BucketNotFound(f"Bucket '{bucket_source}' not found.")
+                raise exceptions.BucketNotFound(f"Bucket '{kwargs['Bucket']}' not found.")
             raise Exception(ex) # pragma: no cover
 
-        configuration["ContentType"] = obj["ContentType"]
+    def head(
+        self, bucket: str, path: str
+    ) -> OBJECT_METADATA_TUPLE:
+        """Function to get the object metadata.
 
-        try:
-            self.client.copy_object(
-                Bucket=bucket_destination,
-                CopySource={"Bucket": bucket_source, "Key": path_source,},
-                Key=path_destination if path_destination else path_source,
-                **configuration,
-            )
-        except ClientError as ex:
-            if type(ex).__name__ == "NoSuchBucket":
-                raise exceptions.BucketNotFound(
-                    f"Bucket '{bucket_destination}' not found."
-                )
-            raise Exception(ex) # pragma: no cover
+        The metadata is served from the client cache, HEAD request is sent on a cache miss.
 
-    def move(
-        self,
-        bucket_source: str,
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+
+        Returns:
+          Object size in bytes, ETag, content type and last modification time.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        head = self._head_object_cached(bucket=bucket, path=path)
+        return Client.OBJECT_METADATA_TUPLE(
+            size=head["ContentLength"],
+            etag=head["ETag"],
+            content_type=head.get("ContentType"),
+            last_modified=head["LastModified"],
+        )
+
+    def exists(self, bucket: str, path: str) -> bool:
+        """Function to check if the object exists.
+
+        The objects seen in the recent listings are found without requests.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+
+        Returns:
+          True if the object exists.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        if self.metadata_cache.get(bucket, path, complete=False) is not None:
+            return True
+        try:
+            self._head_object_cached(bucket=bucket, path=path)
+        except exceptions.ObjectNotFound:
+            return False
+        return True
+
+    def read(self, bucket: str, path: str, verify: bool = False) -> bytes:
+        """Function to read the object from a bucket into memory.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          verify: Compare the object ETag to the one computed from the received bytes.
+            The objects encrypted with SSE-KMS, or SSE-C are not verified.
+
+        Returns:
+          Bytes encoded object.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the received object is corrupted.
+        """
+        if self.disk_cache is not None:
+            with self._open_cached(bucket=bucket, path=path, verify=verify) as obj:
+                return obj.read()
+
+        with self._slot() as slot:
+            resp = self._get_object(bucket=bucket, path=path)
+            slot.reserve(resp["ContentLength"])
+            if not verify:
+                return resp["Body"].read()
+            return b"".join(
+                self._verify_chunks(
+                    bucket=bucket, path=path, resp=resp, chunks=[resp["Body"].read()]
+                )
+            )
+
+    def _verify_chunks(
+        self, bucket: str, path: str, resp: dict, chunks: Iterable[bytes]
+    ) -> Iterable[bytes]:
+        """Function to verify the object ETag while its chunks are consumed.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          resp: get_object response of the whole object.
+          chunks: Iterator of the object chunks.
+
+        Returns:
+          Iterator over the chunks raising exceptions.ChecksumMismatch after the last one
+            if the object is corrupted.
+        """
+        etag = _verifiable_etag(resp)
+        if etag is None:
+            return chunks
+        return checksums.verify(
+            chunks,
+            checksums.ETag(self._etag_part_size(bucket=bucket, path=path, etag=etag)),
+            etag,
+            f"s3://{bucket}/{path}",
+        )
+
+    def _etag_part_size(self, bucket: str, path: str, etag: str) -> Optional[int]:
+        """Function to get the size of the parts the object was uploaded with.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          etag: Object ETag.
+
+        Returns:
+          Size of the first part, None if the object was not uploaded in parts.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        if not checksums.etag_parts_count(etag):
+            return None
+        # all parts but the last one have the size of the first part
+        return self._head_object(bucket=bucket, path=path, PartNumber=1)["ContentLength"]
+
+    def _open_cached(self, bucket: str, path: str, verify: bool = False) -> BinaryIO:
+        """Function to open the object from the disk cache.
+
+        The cached object is revalidated with the conditional GET request,
+        it's downloaded into the cache if missing, or modified. The request holds
+        the transfer slot until the object is cached, the cached file is read without it.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          verify: Verify the object ETag when it's downloaded into the cache.
+
+        Returns:
+          Opened cached file.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the received object is corrupted,
+            it's not cached in that case.
+        """
+        with self._slot() as slot:
+            cached = self.disk_cache.get(bucket, path)
+            if cached is not None:
+                etag, obj = cached
+                try:
+                    resp = self._get_object(bucket=bucket, path=path, IfNoneMatch=etag)
+                except BaseException:
+                    obj.close()
+                    raise
+                if resp is None:
+                    return obj
+                obj.close()
+            else:
+                resp = self._get_object(bucket=bucket, path=path)
+            slot.reserve(resp["ContentLength"])
+
+            chunks = resp["Body"].iter_chunks(Client.READ_CHUNK_SIZE)
+            if verify:
+                chunks = self._verify_chunks(bucket=bucket, path=path, resp=resp, chunks=chunks)
+            return self.disk_cache.put(bucket, path, resp["ETag"], chunks)
+
+    def read_range(self, bucket: str, path: str, start: int, end: int = None) -> bytes:
+        """Function to read a byte range of the object from a bucket into memory.
+
+        The range follows the python slice notation, e.g.
+          read_range(bucket, path, 0, 100) reads the first 100 bytes,
+          read_range(bucket, path, 100) reads the object starting from the byte 100,
+          read_range(bucket, path, -100) reads the last 100 bytes.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          start: Range start, inclusive. Negative value to read the object footer.
+          end: Range end, exclusive. The object end if not set.
+
+        Returns:
+          Bytes encoded object range.
+
+        Raises:
+          ValueError: Raised when the range is not valid for the object.
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        if start < 0:
+            if end is not None:
+                raise ValueError("Range end cannot be set for a negative range start.")
+            byte_range = f"bytes={start}"
+        elif end is None:
+            byte_range = f"bytes={start}-"
+        elif end > start:
+            byte_range = f"bytes={start}-{end - 1}"
+        else:
+            return b""
+
+        with self._slot() as slot:
+            resp = self._get_object(bucket=bucket, path=path, Range=byte_range)
+            slot.reserve(resp["ContentLength"])
+            return resp["Body"].read()
+
+    def read_stream(
+        self,
+        bucket: str,
+        path: str,
+        chunk_size: int = 1024 * 1024,
+        codec: str = None,
+        verify: bool = False,
+    ) -> Iterator[bytes]:
+        """Function to read the object from a bucket chunk by chunk.
+
+        The object is streamed from the connection without buffering it in memory,
+        and decompressed chunk by chunk if the codec is set.
+        The caller must exhaust, or close the iterator, e.g. use it as the context manager,
+        the abandoned iterator holds the connection and the scheduler slot
+        until it's garbage collected.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          chunk_size: Max chunk size in bytes.
+          codec: Codec to decompress the object with, "gzip", or "zstd".
+            "auto" to define the codec from the object ContentEncoding.
+          verify: Compare the object ETag to the one computed from the received bytes,
+            the mismatch is raised after the last chunk.
+
+        Returns:
+          Iterator over the object chunks.
+
+        Raises:
+          ValueError: Raised when unknown codec provided.
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the received object is corrupted.
+        """
+        if codec not in [None, "auto"]:
+            codecs.check(codec)
+
+        # the slot and the connection are held until the stream is consumed, or closed
+        slot = self._slot()
+        slot.acquire()
+        try:
+            resp = self._get_object(bucket=bucket, path=path)
+            slot.reserve(resp["ContentLength"])
+            chunks = resp["Body"].iter_chunks(chunk_size)
+            if verify:
+                chunks = self._verify_chunks(bucket=bucket, path=path, resp=resp, chunks=chunks)
+            if codec == "auto":
+                codec = codecs.codec_from_encoding(resp.get("ContentEncoding"))
+            if codec is not None:
+                chunks = codecs.decode(chunks, codec, chunk_size=chunk_size)
+        except BaseException:
+            slot.release()
+            raise
+        return _HoldingIterator(chunks, slot, body=resp["Body"])
+
+    def select(
+        self,
+        bucket: str,
+        path: str,
+        sql: str,
+        input_format: str = "JSON",
+        output_format: str = "JSON",
+        input_serialization: dict = None,
+        output_serialization: dict = None,
+        codec: str = None,
+        pushdown: bool = None,
+    ) -> Iterator[bytes]:
+        """Function to filter the CSV, or JSON records of the object with the SQL expression.
+
+        The expression is evaluated by S3 Select, the matching records are streamed
+        from the response events as they arrive. If the backend doesn't support S3 Select,
+        i.e. the request is rejected as not implemented, or not allowed, the object
+        is streamed and filtered locally, see local_select.select for the supported SQL subset.
+        Other errors, e.g. access denied, throttling, or invalid SQL, are raised.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          sql: SQL expression, e.g. "SELECT * FROM S3Object s WHERE s.id > 100".
+          input_format: Object format, "CSV", or "JSON".
+          output_format: Output format, "CSV", or "JSON".
+          input_serialization: Input format parameters,
+            e.g. {"FileHeaderInfo": "USE"} for CSV, or {"Type": "LINES"} for JSON.
+            See: https://boto3.amazonaws.com/v1/documentation/api/1.14.2/reference/services/s3.html#S3.Client.select_object_content
+          output_serialization: Output format parameters.
+          codec: Codec the object is compressed with, "gzip", or "zstd".
+            zstd objects are always filtered locally.
+          pushdown: True to evaluate the expression only with S3 Select,
+            False to always filter locally. By default, S3 Select is tried first.
+
+        Returns:
+          Iterator over the matching records, each ends with the output records delimiter.
+            The caller must exhaust, or close it, like the read_stream iterator.
+
+        Raises:
+          ValueError: Raised when unknown format, or codec provided,
+            or the expression is not supported by the local filter.
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        for data_format in [input_format, output_format]:
+            if data_format not in local_select.FORMATS:
+                raise ValueError(
+                    f"Unknown format '{data_format}', "
+                    f"supported: {', '.join(local_select.FORMATS)}."
+                )
+        if codec is not None:
+            codecs.check(codec)
+
+        if pushdown is not False and codec in [None, "gzip"]:
+            input_serialization = {
+                **local_select.INPUT_SERIALIZATION_DEFAULT[input_format],
+                **(input_serialization or {}),
+            }
+            output_serialization = {
+                **local_select.OUTPUT_SERIALIZATION_DEFAULT[output_format],
+                **(output_serialization or {}),
+            }
+            # the slot and the connection are held until the records are consumed, or closed
+            slot = self._slot()
+            slot.acquire()
+            try:
+                resp = self.client.select_object_content(
+                    Bucket=bucket,
+                    Key=path,
+                    Expression=sql,
+                    ExpressionType="SQL",
+                    InputSerialization={
+                        input_format: input_serialization,
+                        "CompressionType": "GZIP" if codec else "NONE",
+                    },
+                    OutputSerialization={output_format: output_serialization},
+                )
+            except NoCredentialsError: # pragma: no cover
+                slot.release()
+                raise ConnectionError("Cannot connect, no credentials provided")
+            except ClientError as ex:
+                slot.release()
+                if type(ex).__name__ == "NoSuchKey":
+                    raise exceptions.ObjectNotFound(
+                        f"Object '{path}' not found in bucket '{bucket}'"
+                    )
+                if type(ex).__name__ in ["NoSuchBucket", "InvalidBucketName"]:
+                    raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found: {ex}")
+                if pushdown or not _select_unsupported(ex):
+                    raise
+            except BaseException:
+                slot.release()
+                raise
+            else:
+                # the quoted CSV fields may span multiple lines
+                quote = output_serialization["QuoteCharacter"].encode("utf-8") \
+                    if output_format == "CSV" else None
+                return _HoldingIterator(
+                    local_select.split_records(
+                        _iter_select_records(resp["Payload"]),
+                        output_serialization["RecordDelimiter"].encode("utf-8"),
+                        keep_delimiter=True,
+                        quote=quote,
+                    ),
+                    slot,
+                    body=resp["Payload"],
+                )
+        elif pushdown:
+            raise ValueError(f"S3 Select doesn't support the codec '{codec}'.")
+
+        stream = self.read_stream(
+            bucket=bucket, path=path, chunk_size=Client.READ_CHUNK_SIZE, codec=codec
+        )
+        try:
+            records = local_select.select(
+                stream,
+                sql,
+                input_format=input_format,
+                output_format=output_format,
+                input_serialization=input_serialization,
+                output_serialization=output_serialization,
+            )
+        except BaseException:
+            stream.close()
+            raise
+        # closing the records closes the object stream, the stream holds the slot
+        return _HoldingIterator(records, TransferSlot(None), body=stream)
+
+    def read_parallel(
+        self,
+        bucket: str,
+        path: str,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 10,
+        as_memoryview: bool = False,
+        verify: bool = False,
+    ) -> Union[bytearray, memoryview]:
+        """Function to read the object from a bucket into memory fetching its parts concurrently.
+
+        The object size is requested with HEAD, the byte ranges are fetched on a bounded
+        thread pool and written directly into a preallocated buffer.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          part_size: Size of the byte range fetched by a single request.
+          max_concurrency: Max number of ranges fetched at the same time.
+          as_memoryview: Return the memoryview of the buffer.
+          verify: Compare the object ETag to the one computed from the received bytes.
+            The ranges follow the parts the object was uploaded with instead of part_size,
+            the object uploaded in a single part is fetched with one request.
+
+        Returns:
+          Buffer with the object.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the received object is corrupted.
+        """
+        head = self._head_object(bucket=bucket, path=path)
+
+        buffer = bytearray(head["ContentLength"])
+        view = memoryview(buffer)
+        self._read_parts_into(
+            bucket=bucket,
+            path=path,
+            view=view,
+            head=head,
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+            verify=verify,
+        )
+        return view if as_memoryview else buffer
+
+    def read_many(
+        self,
+        bucket: str,
+        paths: Iterable[str],
+        max_concurrency: int = 32,
+        ordered: bool = True,
+        verify: bool = False,
+    ) -> Iterator[READ_RESULT_TUPLE]:
+        """Function to read many objects from a bucket into memory concurrently.
+
+        The GET requests are issued on the thread pool shared by all clients,
+        at most max_concurrency of them at a time, the connection pool is grown to fit.
+
+        Args:
+          bucket: Bucket name.
+          paths: Paths to locate the objects in a bucket.
+          max_concurrency: Max number of objects read at the same time.
+          ordered: Output the objects in the paths order, otherwise as they are read.
+          verify: Compare the objects ETag to the ones computed from the received bytes.
+
+        Returns:
+          Iterator over the path, the object and the exception per path, the exception is None
+            for the objects read successfully, e.g. exceptions.ObjectNotFound for missing ones.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        reader = self
+        if self.client.meta.config.max_pool_connections < max_concurrency:
+            # the shallow copy shares the caches and the scheduler,
+            # the other calls of the client keep its own connection pool
+            reader = copy.copy(self)
+            reader.client = registry.get_client(
+                "s3", self.configuration, max_concurrency=max_concurrency
+            )
+
+        for path, obj, exception in bounded_map(
+            lambda path: reader.read(bucket=bucket, path=path, verify=verify),
+            paths,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            executor=shared_executor(),
+        ):
+            if isinstance(exception, exceptions.BucketNotFound):
+                raise exception
+            yield Client.READ_RESULT_TUPLE(path=path, data=obj, exception=exception)
+
+    def _read_parts_into(
+        self,
+        bucket: str,
+        path: str,
+        view: memoryview,
+        head: dict,
+        part_size: int,
+        max_concurrency: int,
+        verify: bool = False,
+    ) -> None:
+        """Function to fetch the object byte ranges concurrently into a writable buffer.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          view: Writable buffer of the object size.
+          head: head_object response, its ETag makes sure all ranges belong
+            to the same object version.
+          part_size: Size of the byte range fetched by a single request.
+          max_concurrency: Max number of ranges fetched at the same time.
+          verify: Compare the object ETag to the one computed from the received bytes.
+            The ranges follow the uploaded parts, so every range digest is the part digest.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the received object is corrupted.
+        """
+        etag = head["ETag"]
+        etag_verified = _verifiable_etag(head)
+        verify = verify and etag_verified is not None
+        if verify:
+            part_size = self._etag_part_size(bucket=bucket, path=path, etag=etag_verified)
+            part_size = part_size or len(view) or 1
+
+        caller = get_ident()
+
+        def _read_part(start: int) -> Optional[bytes]:
+            end = min(start + part_size, len(view))
+            with self._slot(end - start, caller=caller):
+                obj = self._get_object(
+                    bucket=bucket, path=path, Range=f"bytes={start}-{end - 1}", IfMatch=etag
+                )
+                digest = hashlib.md5() if verify else None
+                position = start
+                for chunk in obj["Body"].iter_chunks(Client.READ_CHUNK_SIZE):
+                    view[position:position + len(chunk)] = chunk
+                    position += len(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
+            if position != end:
+                raise IOError(
+                    f"Incomplete range {start}-{end - 1} of '{path}': {position - start} bytes"
+                )
+            return digest.digest() if digest is not None else None
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            digests = list(executor.map(_read_part, range(0, len(view), part_size)))
+
+        if verify:
+            if checksums.etag_parts_count(etag_verified):
+                got = checksums.multipart_etag(digests)
+            else:
+                got = digests[0].hex() if digests else hashlib.md5().hexdigest()
+            checksums.check(got, etag_verified, f"s3://{bucket}/{path}")
+
+    def _head_object(self, bucket: str, path: str, **kwargs) -> dict:
+        """Function to send the HEAD object request.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          kwargs: Extra head_object request parameters.
+
+        Returns:
+          head_object response.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        try:
+            return self.client.head_object(Bucket=bucket, Key=path, **kwargs)
+        except ParamValidationError as ex:
+            raise exceptions.BucketNotFound(ex)
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            # HEAD responses have no body to tell a missing bucket from a missing key
+            if ex.response["Error"]["Code"] in ["404", "NoSuchKey"]:
+                if not self._bucket_exists(bucket):
+                    raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+                raise exceptions.ObjectNotFound(
+                    f"Object '{path}' not found in bucket '{bucket}'"
+                )
+            raise Exception(ex) # pragma: no cover
+
+    def _head_object_cached(self, bucket: str, path: str) -> dict:
+        """Function to get the object metadata from the cache, or with the HEAD request.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+
+        Returns:
+          head_object response.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        head = self.metadata_cache.get(bucket, path)
+        if head is None:
+            head = self._head_object(bucket=bucket, path=path)
+            head.pop("ResponseMetadata", None)
+            self.metadata_cache.put(bucket, path, head)
+        return head
+
+    def _bucket_exists(self, bucket: str) -> bool:
+        """Function to check if the bucket exists.
+
+        Args:
+          bucket: Bucket name.
+
+        Returns:
+          True if the bucket exists.
+        """
+        try:
+            self.client.head_bucket(Bucket=bucket)
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] in ["404", "NoSuchBucket"]:
+                return False
+            raise Exception(ex) # pragma: no cover
+        return True
+
+    def _get_object(self, bucket: str, path: str, **kwargs) -> dict:
+        """Function to send the GET object request.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          kwargs: Extra get_object request parameters.
+
+        Returns:
+          get_object response with the streaming body,
+            None if the object is not modified for the IfNoneMatch request.
+
+        Raises:
+          ValueError: Raised when requested range is not valid for the object.
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        try:
+            return self.client.get_object(Bucket=bucket, Key=path, **kwargs)
+        except ParamValidationError as ex:
+            raise exceptions.BucketNotFound(ex)
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except Exception as ex:
+            if type(ex).__name__ == "NoSuchKey":
+                raise exceptions.ObjectNotFound(
+                    f"Object '{path}' not found in bucket '{bucket}'"
+                )
+            if type(ex).__name__ in ["NoSuchBucket", "InvalidBucketName"]:
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found: {ex}")
+            if isinstance(ex, ClientError) and ex.response["Error"]["Code"] == "InvalidRange":
+                raise ValueError(f"Range '{kwargs.get('Range')}' is not valid for '{path}'")
+            if isinstance(ex, ClientError) and ex.response["Error"]["Code"] == "304":
+                return None
+            raise Exception(ex) # pragma: no cover
+
+    def write(
+        self,
+        obj: bytes,
+        bucket: str,
+        path: str,
+        configuration: dict = None,
+        codec: str = None,
+        verify: bool = False,
+    ) -> None:
+        """Function to write the object from memory into bucket.
+
+        Args:
+          obj: Object data to store in a bucket.
+          bucket: Bucket name.
+          path: Path to store the object to.
+          configuration: Extra configurations.
+            See: https://boto3.amazonaws.com/v1/documentation/api/1.14.3/reference/services/s3.html?highlight=s3%20client#S3.Client.put_object
+            For example:
+            *.json.gz file should be uploaded with the following configuration:
+                {
+                    "ContentEncoding": "gzip",
+                    "ContentType": "application/json"
+                }
+          codec: Codec to compress the object with, "gzip", or "zstd".
+            The object is compressed part by part with write_stream,
+            ContentEncoding is set to the codec unless configured.
+          verify: Compare the ETag of the stored object to the MD5 of the sent bytes.
+            The objects encrypted with SSE-KMS, or SSE-C are not verified.
+
+        Raises:
+          ValueError: Raised when unknown codec provided.
+          ConnectionError: Raised when connection error occured.
+          TypeError: Raised when provided attributes have wrong types.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the stored object is corrupted.
+        """
+        if codec is not None:
+            self.write_stream(
+                bucket=bucket,
+                path=path,
+                source=obj,
+                configuration=configuration,
+                codec=codec,
+                verify=verify,
+            )
+            return
+
+        configuration = configuration if configuration else {}
+        try:
+            with self._slot(len(obj)):
+                resp = self.client.put_object(Body=obj, Bucket=bucket, Key=path, **configuration)
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except Exception as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            if type(ex).__name__ == "ParamValidationError":
+                raise TypeError("Provided function attributes have wrong type.")
+            raise Exception(ex) # pragma: no cover
+        finally:
+            self.metadata_cache.invalidate(bucket, path)
+
+        etag = _verifiable_etag(resp) if verify else None
+        if etag is not None:
+            checksums.check(hashlib.md5(obj).hexdigest(), etag, f"s3://{bucket}/{path}")
+
+    def write_stream(
+        self,
+        bucket: str,
+        path: str,
+        source: Union[Iterable[bytes], BinaryIO],
+        configuration: dict = None,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+        codec: str = None,
+        verify: bool = False,
+    ) -> None:
+        """Function to write the object into a bucket from a stream using multipart upload.
+
+        At most max_concurrency parts are buffered at a time, so the peak memory
+        is about part_size * max_concurrency regardless of the object size.
+        The upload is aborted if the source, or the upload of any part fails.
+        If the codec is set, the source is compressed chunk by chunk
+        and the parts are cut from the compressed stream.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to store the object to.
+          source: Iterator of bytes chunks, or readable binary file object.
+          configuration: Extra configurations.
+            See: https://boto3.amazonaws.com/v1/documentation/api/1.14.3/reference/services/s3.html#S3.Client.create_multipart_upload
+          part_size: Size of the uploaded parts, 5 MB min.
+          max_concurrency: Max number of parts uploaded at the same time.
+          codec: Codec to compress the object with, "gzip", or "zstd".
+            ContentEncoding is set to the codec unless configured.
+          verify: Compare the ETag of every uploaded part and of the stored object
+            to the ones computed from the sent parts. The upload is aborted
+            if a part is corrupted. The objects encrypted with SSE-KMS, or SSE-C are not verified.
+
+        Raises:
+          ValueError: Raised when the part size is out of the multipart upload limits,
+            or unknown codec provided.
+          ConnectionError: Raised when connection error occured.
+          TypeError: Raised when provided attributes have wrong types.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the stored object is corrupted.
+        """
+        if part_size < Client.MULTIPART_PART_SIZE_MIN:
+            raise ValueError(f"Part size must be at least {Client.MULTIPART_PART_SIZE_MIN} bytes.")
+
+        configuration = dict(configuration) if configuration else {}
+        if codec is not None:
+            source = codecs.encode(_iter_chunks(source, Client.READ_CHUNK_SIZE), codec)
+            configuration.setdefault("ContentEncoding", codecs.CONTENT_ENCODING[codec])
+        parts = _iter_parts(source, part_size)
+
+        # the first two parts are peeked to skip multipart upload for small objects
+        head = deque([next(parts, b""), next(parts, None)])
+        if head[1] is None:
+            self.write(
+                head[0], bucket=bucket, path=path, configuration=configuration, verify=verify
+            )
+            return
+
+        def _parts() -> Iterator[bytes]:
+            while head:
+                yield head.popleft()
+            yield from parts
+
+        upload_id = self._create_multipart_upload(bucket=bucket, path=path, **configuration)
+
+        digests = {}
+        caller = get_ident()
+
+        def _upload_part(part_number: int, body: bytes) -> dict:
+            with self._slot(len(body), caller=caller):
+                resp = self.client.upload_part(
+                    Bucket=bucket, Key=path, UploadId=upload_id, PartNumber=part_number, Body=body,
+                )
+            etag = _verifiable_etag(resp) if verify else None
+            if etag is not None:
+                digest = hashlib.md5(body)
+                checksums.check(
+                    digest.hexdigest(), etag, f"s3://{bucket}/{path} part {part_number}"
+                )
+                digests[part_number] = digest.digest()
+            return {"ETag": resp["ETag"], "PartNumber": part_number}
+
+        uploaded = []
+        pending = set()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+                for part_number, part in enumerate(_parts(), 1):
+                    if part_number > Client.MULTIPART_PARTS_MAX:
+                        raise ValueError(
+                            f"Object exceeds {Client.MULTIPART_PARTS_MAX} parts, "
+                            "increase the part size."
+                        )
+                    pending.add(executor.submit(_upload_part, part_number, part))
+                    # the next part is read once there is a free upload slot
+                    while len(pending) >= max_concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        uploaded.extend(future.result() for future in done)
+
+                done, pending = wait(pending)
+                uploaded.extend(future.result() for future in done)
+
+            resp = self.client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=path,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": sorted(uploaded, key=lambda i: i["PartNumber"])},
+            )
+        except BaseException:
+            self.client.abort_multipart_upload(Bucket=bucket, Key=path, UploadId=upload_id)
+            raise
+        finally:
+            self.metadata_cache.invalidate(bucket, path)
+
+        etag = _verifiable_etag(resp) if digests else None
+        if etag is not None:
+            checksums.check(
+                checksums.multipart_etag([digests[i] for i in sorted(digests)]),
+                etag,
+                f"s3://{bucket}/{path}",
+            )
+
+    def _create_multipart_upload(self, bucket: str, path: str, **kwargs) -> str:
+        """Function to initiate the multipart upload.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to store the object to.
+          kwargs: Extra create_multipart_upload request parameters.
+
+        Returns:
+          Upload ID.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          TypeError: Raised when provided attributes have wrong types.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        try:
+            resp = self.client.create_multipart_upload(Bucket=bucket, Key=path, **kwargs)
+            return resp["UploadId"]
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except Exception as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            if type(ex).__name__ == "ParamValidationError":
+                raise TypeError("Provided function attributes have wrong type.")
+            raise Exception(ex) # pragma: no cover
+
+    def upload(
+        self,
+        bucket: str,
+        path_source: str,
+        path_destination: str = None,
+        configuration: dict = None,
+        verify: bool = False,
+    ) -> None:
+        """Function to upload the object from disk into a bucket.
+
+        Args:
+          bucket: Bucket name.
+          path_source: Path to locate the object on fs.
+          path_destination: Path to store the object to.
+          configuration: Transfer config parameters.
+            See: https://boto3.amazonaws.com/v1/documentation/api/1.14.2/reference/customizations/s3.html#boto3.s3.transfer.TransferConfig
+          verify: Compare the ETag of the stored object to the one computed from the sent bytes.
+            The file is read once and streamed with write_stream, so the parts digests
+            are computed as the parts are read. The multipart threshold, chunk size
+            and concurrency of the transfer configuration apply.
+
+        Raises:
+          FileNotFoundError: Raised when file path_source not found.
+          exceptions.ConfigurationError: Raised when provided transfer configuration is wrong.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the stored object is corrupted.
+        """
+        configuration = _transfer_configuration(configuration)
+
+        if not os.path.exists(path_source):
+            raise FileNotFoundError(f"{path_source} not found")
+
+        path_destination = path_destination if path_destination else path_source
+        if verify or self.scheduler is not None:
+            with open(path_source, "rb") as fread:
+                if os.path.getsize(path_source) < configuration["multipart_threshold"]:
+                    self.write(fread.read(), bucket=bucket, path=path_destination, verify=verify)
+                else:
+                    self.write_stream(
+                        bucket=bucket,
+                        path=path_destination,
+                        source=fread,
+                        part_size=max(
+                            configuration["multipart_chunksize"], Client.MULTIPART_PART_SIZE_MIN
+                        ),
+                        max_concurrency=configuration["max_concurrency"],
+                        verify=verify,
+                    )
+            return
+
+        try:
+            self._transfer(configuration).upload_file(
+                filename=path_source, bucket=bucket, key=path_destination
+            )
+        except Exception as ex:
+            if type(ex).__name__ == "S3UploadFailedError":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            raise Exception(ex) # pragma: no cover
+        finally:
+            self.metadata_cache.invalidate(bucket, path_destination)
+
+    def upload_dir(
+        self,
+        local_dir: str,
+        bucket: str,
+        prefix: str = "",
+        compare: str = "size_mtime",
+        max_concurrency: int = 10,
+        progress: Callable[[str, int], None] = None,
+        configuration: dict = None,
+    ) -> TRANSFER_SUMMARY_TUPLE:
+        """Function to upload the directory from disk into a bucket skipping unchanged files.
+
+        The files are compared against the objects listed under the prefix:
+          size_mtime: the file is skipped if the object has the same size
+            and was modified after the file.
+          etag: the file is skipped if the object ETag matches the ETag computed locally
+            for the multipart settings of upload.
+
+        Args:
+          local_dir: Path to the directory on fs.
+          bucket: Bucket name.
+          prefix: Prefix to store the objects to, the relative files path is appended to it.
+          compare: Method to detect unchanged files, "size_mtime", or "etag".
+          max_concurrency: Max number of files uploaded at the same time.
+          progress: Function called with the file path and its size once the file is uploaded.
+            It is called from the worker threads.
+          configuration: Transfer config parameters of upload.
+
+        Returns:
+          Number of uploaded files and bytes, number of skipped files
+            and the exceptions per path of the files which failed to upload.
+
+        Raises:
+          ValueError: Raised when unknown compare method provided.
+          NotADirectoryError: Raised when local_dir is not a directory.
+          exceptions.ConfigurationError: Raised when provided transfer configuration is wrong.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        if compare not in ["size_mtime", "etag"]:
+            raise ValueError(f"Unknown compare method '{compare}'.")
+
+        configuration = _transfer_configuration(configuration)
+
+        if not os.path.isdir(local_dir):
+            raise NotADirectoryError(f"{local_dir} is not a directory")
+
+        prefix_dir = prefix.rstrip("/") + "/" if prefix else ""
+        remote = {
+            obj["Key"]: (obj["Size"], obj["LastModified"].timestamp(), obj["ETag"].strip('"'))
+            for obj in self.iter_objects(bucket=bucket, prefix=prefix_dir)
+        }
+
+        def _files() -> Iterator[Tuple[str, str]]:
+            for root, _, files in os.walk(local_dir):
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    key = os.path.relpath(path, local_dir).replace(os.sep, "/")
+                    yield path, prefix_dir + key
+
+        def _upload(item: Tuple[str, str]) -> int:
+            path, key = item
+            stat = os.stat(path)
+            if key in remote:
+                size, modified, etag = remote[key]
+                if size == stat.st_size:
+                    # LastModified is truncated to seconds
+                    if compare == "size_mtime" and modified >= int(stat.st_mtime):
+                        return -1
+                    if compare == "etag" and etag == _local_etag(
+                            path,
+                            configuration["multipart_threshold"],
+                            configuration["multipart_chunksize"],
+                    ):
+                        return -1
+            self.upload(
+                bucket=bucket, path_source=path, path_destination=key, configuration=configuration
+            )
+            if progress:
+                progress(path, stat.st_size)
+            return stat.st_size
+
+        files, size, skipped, failed = 0, 0, 0, {}
+        for (path, _), uploaded, exception in bounded_map(
+            _upload, _files(), max_concurrency=max_concurrency
+        ):
+            if exception is not None:
+                failed[path] = exception
+            elif uploaded < 0:
+                skipped += 1
+            else:
+                files += 1
+                size += uploaded
+        return Client.TRANSFER_SUMMARY_TUPLE(
+            files=files, bytes=size, skipped=skipped, failed=failed
+        )
+
+    def download(
+        self,
+        bucket: str,
+        path_source: str,
+        path_destination: str,
+        configuration: dict = None,
+        verify: bool = False,
+    ) -> None:
+        """Function to download the object from a bucket to disk.
+
+        The object is copied from the disk cache if the client has it,
+        the transfer configuration doesn't apply in that case.
+
+        Args:
+          bucket: Bucket name.
+          path_source: Path to locate the object in bucket.
+          path_destination: Fs path to store the object to.
+          configuration: Transfer config parameters.
+            See: https://boto3.amazonaws.com/v1/documentation/api/1.14.2/reference/customizations/s3.html#boto3.s3.transfer.TransferConfig
+          verify: Compare the object ETag to the one computed from the received bytes.
+            The byte ranges follow the parts the object was uploaded with and are written
+            into the memory mapped file, every range digest is computed as it's received.
+            The file is removed if the object is corrupted.
+
+        Raises:
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.DestinationPathError: Raised when cannot save object to provided location.
+          exceptions.DestinationPathPermissionsError: Raised when cannot save object to provided
+            location due to lack of permissons.
+          exceptions.ChecksumMismatch: Raised when the received object is corrupted.
+        """
+        configuration = _transfer_configuration(configuration)
+
+        try:
+            if self.disk_cache is not None:
+                with self._open_cached(bucket=bucket, path=path_source, verify=verify) as obj, \
+                        open(path_destination, "wb") as destination:
+                    shutil.copyfileobj(obj, destination, Client.READ_CHUNK_SIZE)
+            elif verify or self.scheduler is not None:
+                mapping = self._download_into_mapping(
+                    bucket=bucket,
+                    path_source=path_source,
+                    path_destination=path_destination,
+                    part_size=configuration["multipart_chunksize"],
+                    max_concurrency=configuration["max_concurrency"],
+                    verify=verify,
+                )
+                if isinstance(mapping, mmap.mmap):
+                    mapping.close()
+            else:
+                self._transfer(configuration).download_file(
+                    bucket=bucket, key=path_source, filename=path_destination
+                )
+        except (NotADirectoryError, FileNotFoundError):
+            raise exceptions.DestinationPathError(
+                f"Cannot download file to {path_destination}"
+            )
+        except PermissionError:
+            raise exceptions.DestinationPathPermissionsError(
+                f"Cannot download file to {path_destination}"
+            )
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            if ex.response["Error"]["Code"] == "404":
+                raise exceptions.ObjectNotFound(
+                    f"Object '{path_source}' not found in bucket '{bucket}'"
+                )
+            raise Exception(ex) # pragma: no cover
+
+    def download_mmap(
+        self,
+        bucket: str,
+        path_source: str,
+        path_destination: str,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 10,
+        as_memoryview: bool = False,
+        verify: bool = False,
+    ) -> Union[mmap.mmap, memoryview]:
+        """Function to download the object from a bucket into the memory mapped file.
+
+        The destination file is preallocated at the object size and mapped into memory,
+        the byte ranges are fetched concurrently and written straight into the mapping,
+        so the object is copied once from the connection and can be consumed without copies,
+        e.g. with numpy.frombuffer. The disk cache is not used.
+
+        Args:
+          bucket: Bucket name.
+          path_source: Path to locate the object in bucket.
+          path_destination: Fs path to store the object to.
+          part_size: Size of the byte range fetched by a single request.
+          max_concurrency: Max number of ranges fetched at the same time.
+          as_memoryview: Return the memoryview of the mapping.
+            The mapping is closed once the memoryview is released and garbage collected.
+          verify: Compare the object ETag to the one computed from the received bytes,
+            see read_parallel. The file is removed if the object is corrupted.
+
+        Returns:
+          Writable mapping of the downloaded file, or its memoryview.
+            Empty objects cannot be mapped, the empty bytearray is returned for them.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.DestinationPathError: Raised when cannot save object to provided location.
+          exceptions.DestinationPathPermissionsError: Raised when cannot save object to provided
+            location due to lack of permissons.
+          exceptions.ChecksumMismatch: Raised when the received object is corrupted.
+        """
+        try:
+            mapping = self._download_into_mapping(
+                bucket=bucket,
+                path_source=path_source,
+                path_destination=path_destination,
+                part_size=part_size,
+                max_concurrency=max_concurrency,
+                verify=verify,
+            )
+        except (NotADirectoryError, FileNotFoundError):
+            raise exceptions.DestinationPathError(
+                f"Cannot download file to {path_destination}"
+            )
+        except PermissionError:
+            raise exceptions.DestinationPathPermissionsError(
+                f"Cannot download file to {path_destination}"
+            )
+        return memoryview(mapping) if as_memoryview else mapping
+
+    def _download_into_mapping(
+        self,
+        bucket: str,
+        path_source: str,
+        path_destination: str,
+        part_size: int,
+        max_concurrency: int,
+        verify: bool = False,
+    ) -> Union[mmap.mmap, bytearray]:
+        """Function to download the object into the memory mapped file.
+
+        Args:
+          bucket: Bucket name.
+          path_source: Path to locate the object in bucket.
+          path_destination: Fs path to store the object to.
+          part_size: Size of the byte range fetched by a single request,
+            the ranges follow the uploaded parts if the object ETag is verified.
+          max_concurrency: Max number of ranges fetched at the same time.
+          verify: Compare the object ETag to the one computed from the received bytes.
+
+        Returns:
+          Mapping of the downloaded file, the empty bytearray for the empty object.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the received object is corrupted.
+        """
+        head = self._head_object(bucket=bucket, path=path_source)
+        size = head["ContentLength"]
+
+        with open(path_destination, "w+b") as destination:
+            try:
+                destination.truncate(size)
+                # empty files cannot be mapped
+                mapping = mmap.mmap(destination.fileno(), size) if size else bytearray()
+                try:
+                    with memoryview(mapping) as view:
+                        self._read_parts_into(
+                            bucket=bucket,
+                            path=path_source,
+                            view=view,
+                            head=head,
+                            part_size=part_size,
+                            max_concurrency=max_concurrency,
+                            verify=verify,
+                        )
+                except BaseException:
+                    if size:
+                        mapping.close()
+                    raise
+            except BaseException:
+                destination.close()
+                os.remove(path_destination)
+                raise
+        return mapping
+
+    def _transfer(self, configuration: dict) -> "boto3_transfer.S3Transfer":
+        """Function to get the transfer manager for the transfer configuration.
+
+        The transfer managers are created once per configuration and reused,
+        so their thread pools are not rebuilt for every upload, or download.
+
+        Args:
+          configuration: Transfer config parameters validated with the defaults filled in.
+
+        Returns:
+          Transfer manager.
+        """
+        key = json.dumps(configuration, sort_keys=True)
+        transfer = self.transfers.get(key)
+        if transfer is None:
+            with self.transfers_lock:
+                transfer = self.transfers.get(key)
+                if transfer is None:
+                    # the connection pool fits the transfer concurrency
+                    client = registry.get_client(
+                        "s3", self.configuration, max_concurrency=configuration["max_concurrency"]
+                    )
+                    transfer = boto3_transfer.S3Transfer(
+                        client=client, config=boto3_transfer.TransferConfig(**configuration)
+                    )
+                    self.transfers[key] = transfer
+        return transfer
+
+    def download_prefix(
+        self,
+        bucket: str,
+        prefix: str,
+        local_dir: str,
+        compare: str = "size",
+        max_concurrency: int = 10,
+        configuration: dict = None,
+        progress: Callable[[str, int], None] = None,
+    ) -> TRANSFER_SUMMARY_TUPLE:
+        """Function to download the objects with the prefix from a bucket to a directory.
+
+        Every object is downloaded into a temporary file which is then renamed,
+        so interrupted downloads leave no partial files and re-runs fetch only missing objects.
+        The objects are compared against the files present in the directory:
+          size: the object is skipped if the file has the same size.
+          etag: the object is skipped if the file ETag computed locally
+            for the multipart settings of upload matches the object ETag.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Prefix of the objects to download, it is stripped from the files path.
+          local_dir: Path to the directory on fs.
+          compare: Method to detect present files, "size", or "etag".
+          max_concurrency: Max number of objects downloaded at the same time.
+          configuration: Transfer config parameters, see download.
+          progress: Function called with the object path and its size once it is downloaded.
+            It is called from the worker threads.
+
+        Returns:
+          Number of downloaded files and bytes, number of skipped files
+            and the exceptions per path of the objects which failed to download.
+
+        Raises:
+          ValueError: Raised when unknown compare method provided.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        if compare not in ["size", "etag"]:
+            raise ValueError(f"Unknown compare method '{compare}'.")
+
+        prefix_dir = prefix.rstrip("/") + "/" if prefix else ""
+        local_dir = os.path.abspath(local_dir)
+
+        def _download(obj: dict) -> int:
+            path = os.path.abspath(os.path.join(local_dir, obj["Key"][len(prefix_dir):]))
+            if not path.startswith(local_dir + os.sep):
+                raise ValueError(f"Object '{obj['Key']}' path is outside of {local_dir}")
+
+            if os.path.isfile(path) and os.path.getsize(path) == obj["Size"]:
+                if compare == "size" or obj["ETag"].strip('"') == _local_etag(
+                        path,
+                        Client.S3_TRANSFER_SCHEMA["properties"]["multipart_threshold"]["default"],
+                        Client.S3_TRANSFER_SCHEMA["properties"]["multipart_chunksize"]["default"],
+                ):
+                    return -1
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, path_temp = tempfile.mkstemp(
+                dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix=".part"
+            )
+            os.close(fd)
+            try:
+                self.download(
+                    bucket=bucket,
+                    path_source=obj["Key"],
+                    path_destination=path_temp,
+                    configuration=configuration,
+                )
+                os.replace(path_temp, path)
+            finally:
+                if os.path.exists(path_temp):
+                    os.remove(path_temp)
+
+            if progress:
+                progress(obj["Key"], obj["Size"])
+            return obj["Size"]
+
+        # "directory" placeholder objects have no files to download into
+        objects = (
+            obj for obj in self.iter_objects(bucket=bucket, prefix=prefix_dir)
+            if not obj["Key"].endswith("/")
+        )
+
+        files, size, skipped, failed = 0, 0, 0, {}
+        for obj, downloaded, exception in bounded_map(
+            _download, objects, max_concurrency=max_concurrency
+        ):
+            if exception is not None:
+                failed[obj["Key"]] = exception
+            elif downloaded < 0:
+                skipped += 1
+            else:
+                files += 1
+                size += downloaded
+        return Client.TRANSFER_SUMMARY_TUPLE(
+            files=files, bytes=size, skipped=skipped, failed=failed
+        )
+
+    def copy(
+        self,
+        bucket_source: str,
+        bucket_destination: str,
+        path_source: str,
+        path_destination: str = None,
+        configuration: dict = None,
+        multipart_threshold: int = None,
+        part_size: int = 64 * 1024 * 1024,
+        max_concurrency: int = 10,
+    ) -> None:
+        """Function to copy the object from bucket to bucket.
+
+        The object is copied server side, only its metadata is requested.
+        Objects larger than multipart_threshold are copied as byte-range parts in parallel.
+
+        Args:
+          bucket_source: Bucket name source.
+          bucket_destination: Bucket name destination.
+          path_source: Initial path to locate the object in bucket.
+          path_destination: Final path to locate the object in bucket.
+          configuration: Extra configurations.
+            #S3.Client.copy_object
+            See: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html?highlight=copy_object
+          multipart_threshold: Object size to switch to multipart copy at,
+            5 GB, the copy_object limit, by default.
+          part_size: Size of the parts copied by a single request for multipart copy.
+          max_concurrency: Max number of parts copied at the same time for multipart copy.
+
+        Raises:
+          ConnectionError: Raised when a connection error to s3 occurred.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        configuration = dict(configuration) if configuration else {}
+        path_destination = path_destination if path_destination else path_source
+        if (bucket_destination, path_destination) == (bucket_source, path_source):
+            configuration["MetadataDirective"] = "REPLACE"
+
+        # the copy path depends on the object size, so the metadata is not taken from the cache
+        head = self._head_object(bucket=bucket_source, path=path_source)
+        head.pop("ResponseMetadata", None)
+        self.metadata_cache.put(bucket_source, path_source, head)
+        configuration["ContentType"] = head["ContentType"]
+
+        multipart_threshold = multipart_threshold if multipart_threshold \
+            else Client.COPY_OBJECT_SIZE_MAX
+        if head["ContentLength"] > multipart_threshold:
+            self._copy_multipart(
+                bucket_source=bucket_source,
+                bucket_destination=bucket_destination,
+                path_source=path_source,
+                path_destination=path_destination,
+                head=head,
+                configuration=configuration,
+                part_size=part_size,
+                max_concurrency=max_concurrency,
+            )
+            return
+
+        try:
+            # the bytes are copied server side, the request holds a connection only
+            with self._slot():
+                self.client.copy_object(
+                    Bucket=bucket_destination,
+                    CopySource={"Bucket": bucket_source, "Key": path_source,},
+                    Key=path_destination,
+                    **configuration,
+                )
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(
+                    f"Bucket '{bucket_destination}' not found."
+                )
+            raise Exception(ex) # pragma: no cover
+        finally:
+            self.metadata_cache.invalidate(bucket_destination, path_destination)
+
+    def _copy_multipart(
+        self,
+        bucket_source: str,
+        bucket_destination: str,
+        path_source: str,
+        path_destination: str,
+        head: dict,
+        configuration: dict,
+        part_size: int,
+        max_concurrency: int,
+    ) -> None:
+        """Function to copy the object as byte-range parts using multipart upload.
+
+        The metadata and the tags of the source object are copied unless replaced,
+        like copy_object does. The destination is encrypted with the bucket default
+        unless the encryption is set in the configuration, like copy_object does.
+
+        Args:
+          bucket_source: Bucket name source.
+          bucket_destination: Bucket name destination.
+          path_source: Initial path to locate the object in bucket.
+          path_destination: Final path to locate the object in bucket.
+          head: Source object metadata.
+          configuration: copy_object configurations.
+          part_size: Size of the parts copied by a single request.
+          max_concurrency: Max number of parts copied at the same time.
+
+        Raises:
+          ConnectionError: Raised when a connection error to s3 occurred.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        size = head["ContentLength"]
+        # the part size grows to fit the object into the max number of parts
+        part_size = max(
+            part_size, Client.MULTIPART_PART_SIZE_MIN, -(-size // Client.MULTIPART_PARTS_MAX)
+        )
+
+        copy_source = {"Bucket": bucket_source, "Key": path_source}
+        part_configuration = {"CopySourceIfMatch": head["ETag"]}
+        upload_configuration = {}
+        for key, value in configuration.items():
+            if key.startswith("CopySource"):
+                part_configuration[key] = value
+            elif key not in ["MetadataDirective", "TaggingDirective"]:
+                upload_configuration[key] = value
+
+        if configuration.get("MetadataDirective") != "REPLACE":
+            # copy_object copies the source metadata by default
+            for key in Client.COPY_METADATA_KEYS:
+                if key in head:
+                    upload_configuration.setdefault(key, head[key])
+
+        if configuration.get("TaggingDirective") != "REPLACE":
+            # copy_object copies the source tags by default
+            try:
+                tags = self.client.get_object_tagging(Bucket=bucket_source, Key=path_source)[
+                    "TagSet"
+                ]
+            except ClientError as ex:
+                if type(ex).__name__ == "NoSuchBucket":
+                    raise exceptions.BucketNotFound(f"Bucket '{bucket_source}' not found.")
+                if ex.response["Error"]["Code"] in ["404", "NoSuchKey"]:
+                    raise exceptions.ObjectNotFound(
+                        f"Object '{path_source}' not found in bucket '{bucket_source}'"
+                    )
+                raise Exception(ex) # pragma: no cover
+            if tags:
+                upload_configuration["Tagging"] = urlencode(
+                    [(tag["Key"], tag["Value"]) for tag in tags]
+                )
+
+        upload_id = self._create_multipart_upload(
+            bucket=bucket_destination, path=path_destination, **upload_configuration
+        )
+
+        caller = get_ident()
+
+        def _copy_part(part_number: int) -> dict:
+            start = (part_number - 1) * part_size
+            end = min(start + part_size, size) - 1
+            # the part is copied server side, the request holds a connection only
+            with self._slot(caller=caller):
+                resp = self.client.upload_part_copy(
+                    Bucket=bucket_destination,
+                    Key=path_destination,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    CopySource=copy_source,
+                    CopySourceRange=f"bytes={start}-{end}",
+                    **part_configuration,
+                )
+            return {"ETag": resp["CopyPartResult"]["ETag"], "PartNumber": part_number}
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+                parts = list(executor.map(_copy_part, range(1, -(-size // part_size) + 1)))
+
+            self.client.complete_multipart_upload(
+                Bucket=bucket_destination,
+                Key=path_destination,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            self.client.abort_multipart_upload(
+                Bucket=bucket_destination, Key=path_destination, UploadId=upload_id
+            )
+            raise
+        finally:
+            self.metadata_cache.invalidate(bucket_destination, path_destination)
+
+    def move(
+        self,
+        bucket_source: str,
         bucket_destination: str,
         path_source: str,
         path_destination: str = None,
         configuration: dict = None,
+        multipart_threshold: int = None,
+        part_size: int = 64 * 1024 * 1024,
+        max_concurrency: int = 10,
     ) -> None:
         """Function to move/rename the object.
 
@@ -609,6 +2458,9 @@ class Client(ClientCommon):
           path_destination: Final path to locate the object in bucket.
           configuration: Extra configurations.
             See: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html?highlight=copy_object#S3.Client.copy_object
+          multipart_threshold: Object size to switch to multipart copy at.
+          part_size: Size of the parts copied by a single request for multipart copy.
+          max_concurrency: Max number of parts copied at the same time for multipart copy.
 
         Raises:
           ConnectionError: Raised when a connection error to s3 occurred.
@@ -621,10 +2473,184 @@ class Client(ClientCommon):
             path_source=path_source,
             path_destination=path_destination,
             configuration=configuration if configuration else {},
+            multipart_threshold=multipart_threshold,
+            part_size=part_size,
+            max_concurrency=max_concurrency,
         )
 
         self.delete_object(bucket=bucket_source, path=path_source)
 
+    def copy_many(
+        self,
+        bucket_source: str,
+        bucket_destination: str,
+        pairs: Iterable[Tuple[str, str]] = None,
+        prefix: str = None,
+        rewrite: Callable[[str], str] = None,
+        configuration: dict = None,
+        max_concurrency: int = 10,
+    ) -> BATCH_RESULT_TUPLE:
+        """Function to copy many objects from bucket to bucket concurrently.
+
+        Args:
+          bucket_source: Bucket name source.
+          bucket_destination: Bucket name destination.
+          pairs: Source and destination paths of the objects to copy.
+          prefix: Prefix of the objects to copy, an alternative to pairs.
+          rewrite: Function to get the destination path from the source path of the objects
+            listed by prefix. The path is not changed if not set.
+          configuration: Extra configurations, see copy.
+          max_concurrency: Max number of objects copied at the same time.
+
+        Returns:
+          Source paths of the copied objects and the exceptions per failed source path.
+
+        Raises:
+          ValueError: Raised when neither, or both pairs and prefix are provided.
+          exceptions.BucketNotFound: Raised when the source bucket not found for prefix.
+        """
+        result = Client.BATCH_RESULT_TUPLE(succeeded=[], failed={})
+        for path_source, exception in self._copy_many(
+            bucket_source=bucket_source,
+            bucket_destination=bucket_destination,
+            pairs=pairs,
+            prefix=prefix,
+            rewrite=rewrite,
+            configuration=configuration,
+            max_concurrency=max_concurrency,
+        ):
+            if exception is None:
+                result.succeeded.append(path_source)
+            else:
+                result.failed[path_source] = exception
+        return result
+
+    def move_many(
+        self,
+        bucket_source: str,
+        bucket_destination: str,
+        pairs: Iterable[Tuple[str, str]] = None,
+        prefix: str = None,
+        rewrite: Callable[[str], str] = None,
+        configuration: dict = None,
+        max_concurrency: int = 10,
+    ) -> BATCH_RESULT_TUPLE:
+        """Function to move/rename many objects concurrently.
+
+        The source objects are deleted in batches once they are copied.
+
+        Args:
+          bucket_source: Bucket name source.
+          bucket_destination: Bucket name destination.
+          pairs: Source and destination paths of the objects to move.
+          prefix: Prefix of the objects to move, an alternative to pairs.
+          rewrite: Function to get the destination path from the source path of the objects
+            listed by prefix. The path is not changed if not set.
+          configuration: Extra configurations, see copy.
+          max_concurrency: Max number of objects copied at the same time.
+
+        Returns:
+          Source paths of the moved objects and the exceptions per failed source path.
+
+        Raises:
+          ValueError: Raised when neither, or both pairs and prefix are provided.
+          exceptions.BucketNotFound: Raised when the source bucket not found for prefix.
+        """
+        result = Client.BATCH_RESULT_TUPLE(succeeded=[], failed={})
+
+        def _delete(paths: List[str]) -> None:
+            errors = self._delete_batch(bucket=bucket_source, paths=paths)
+            for path in paths:
+                if path in errors:
+                    result.failed[path] = Exception(
+                        f"Copied, but not deleted from '{bucket_source}': {errors[path]}"
+                    )
+                else:
+                    result.succeeded.append(path)
+
+        batch = []
+        for path_source, exception in self._copy_many(
+            bucket_source=bucket_source,
+            bucket_destination=bucket_destination,
+            pairs=pairs,
+            prefix=prefix,
+            rewrite=rewrite,
+            configuration=configuration,
+            max_concurrency=max_concurrency,
+            move=True,
+        ):
+            if exception is not None:
+                result.failed[path_source] = exception
+                continue
+            batch.append(path_source)
+            if len(batch) == Client.DELETE_BATCH_SIZE_MAX:
+                _delete(batch)
+                batch = []
+        if batch:
+            _delete(batch)
+        return result
+
+    def _copy_many(
+        self,
+        bucket_source: str,
+        bucket_destination: str,
+        pairs: Iterable[Tuple[str, str]] = None,
+        prefix: str = None,
+        rewrite: Callable[[str], str] = None,
+        configuration: dict = None,
+        max_concurrency: int = 10,
+        move: bool = False,
+    ) -> Iterator[Tuple[str, Optional[Exception]]]:
+        """Function to copy many objects concurrently.
+
+        Args:
+          bucket_source: Bucket name source.
+          bucket_destination: Bucket name destination.
+          pairs: Source and destination paths of the objects to copy.
+          prefix: Prefix of the objects to copy, an alternative to pairs.
+          rewrite: Function to get the destination path from the source path.
+          configuration: Extra configurations, see copy.
+          max_concurrency: Max number of objects copied at the same time.
+          move: Objects are copied to be moved, so they cannot be copied onto themselves.
+
+        Returns:
+          Iterator over the source paths and exceptions in the completion order.
+
+        Raises:
+          ValueError: Raised when neither, or both pairs and prefix are provided.
+          exceptions.BucketNotFound: Raised when the source bucket not found for prefix.
+        """
+        if (pairs is None) == (prefix is None):
+            raise ValueError("Either pairs, or prefix must be provided.")
+
+        if prefix is not None:
+            rewrite = rewrite if rewrite else lambda path: path
+            pairs = (
+                (obj["Key"], rewrite(obj["Key"]))
+                for obj in self.iter_objects(bucket=bucket_source, prefix=prefix)
+            )
+
+        def _copy(pair: Tuple[str, str]) -> None:
+            path_source, path_destination = pair
+            if move and (bucket_source, path_source) == (bucket_destination, path_destination):
+                raise ValueError(f"Cannot move '{path_source}' onto itself.")
+            if prefix is not None and bucket_source == bucket_destination \
+                    and path_destination.startswith(prefix):
+                # the copy would be listed and copied again
+                raise ValueError(
+                    f"Destination '{path_destination}' is under the listed prefix '{prefix}'."
+                )
+            self.copy(
+                bucket_source=bucket_source,
+                bucket_destination=bucket_destination,
+                path_source=path_source,
+                path_destination=path_destination,
+                configuration=configuration,
+            )
+
+        for pair, _, exception in bounded_map(_copy, pairs, max_concurrency=max_concurrency):
+            yield pair[0], exception
+
     def delete_object(self, bucket: str, path: str) -> None:
         """Function to delete the object from a bucket.
 
@@ -643,27 +2669,127 @@ class Client(ClientCommon):
             if type(ex).__name__ == "NoSuchBucket":
                 raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
             raise Exception(ex) # pragma: no cover
+        finally:
+            self.metadata_cache.invalidate(bucket, path)
 
-    def delete_objects(self, bucket: str, paths: List[str]) -> None:
+    def delete_objects(
+        self, bucket: str, paths: Iterable[str], max_concurrency: int = 4
+    ) -> Dict[str, str]:
         """Function to delete the objects from a bucket.
 
+        The paths are split into batches of up to 1000 keys, the S3 limit per request,
+        the batches are sent concurrently.
+
+        Args:
+          bucket: Bucket name.
+          paths: Paths to locate the objects in bucket, a list or an iterator of any size.
+          max_concurrency: Max number of delete requests sent at the same time.
+
+        Returns:
+          Error codes per path of the objects which were not deleted.
+
+        Raises:
+          ConnectionError: Raised when a connection error to s3 occurred.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        def _batches() -> Iterator[List[str]]:
+            batch = []
+            for path in paths:
+                batch.append(path)
+                if len(batch) == Client.DELETE_BATCH_SIZE_MAX:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        errors = {}
+        for _, batch_errors, exception in bounded_map(
+            partial(self._delete_batch, bucket), _batches(), max_concurrency=max_concurrency
+        ):
+            if exception is not None:
+                raise exception
+            errors.update(batch_errors)
+        return errors
+
+    def delete_prefix(
+        self,
+        bucket: str,
+        prefix: str,
+        dry_run: bool = False,
+        max_concurrency: int = 4,
+        allow_bucket_wipe: bool = False,
+    ) -> DELETE_RESULT_TUPLE:
+        """Function to delete all objects with the prefix from a bucket.
+
+        Every listed page is deleted with a single request while the listing continues,
+        so the memory use does not depend on the number of objects.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Prefix of the objects to delete.
+          dry_run: Only count the objects which would be deleted.
+          max_concurrency: Max number of delete requests sent at the same time.
+          allow_bucket_wipe: Allow the empty prefix to delete all objects in the bucket.
+
+        Returns:
+          Number of deleted, or matched objects for dry run,
+            and the error codes per path of the objects which were not deleted.
+
+        Raises:
+          ValueError: Raised when the prefix is empty and the bucket wipe is not allowed.
+          ConnectionError: Raised when a connection error to s3 occurred.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        if not prefix and not allow_bucket_wipe:
+            raise ValueError(
+                "Empty prefix matches all objects in the bucket, "
+                "set allow_bucket_wipe to delete them."
+            )
+
+        pages = ([obj["Key"] for obj in page] for page in self._iter_pages(bucket, prefix))
+
+        if dry_run:
+            return Client.DELETE_RESULT_TUPLE(count=sum(len(page) for page in pages), failed={})
+
+        count = 0
+        failed = {}
+        for page, errors, exception in bounded_map(
+            partial(self._delete_batch, bucket), pages, max_concurrency=max_concurrency
+        ):
+            if exception is not None:
+                raise exception
+            count += len(page) - len(errors)
+            failed.update(errors)
+        return Client.DELETE_RESULT_TUPLE(count=count, failed=failed)
+
+    def _delete_batch(self, bucket: str, paths: List[str]) -> Dict[str, str]:
+        """Function to delete up to 1000 objects from a bucket with a single request.
+
         Args:
           bucket: Bucket name.
           paths: Paths to locate the objects in bucket.
 
+        Returns:
+          Error codes per path of the objects which were not deleted.
+
         Raises:
           ConnectionError: Raised when a connection error to s3 occurred.
-          cloud_connectors.cloud_storage.exceptions.ObjectNotFound:
-            Raised when the object not found.
-          cloud_connectors.cloud_storage.exceptions.BucketNotFound:
-            Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
         """
         try:
-            self.client.delete_objects(
+            resp = self.client.delete_objects(
                 Bucket=bucket,
                 Delete={"Objects": [{"Key": v} for v in paths], "Quiet": True,},
             )
-        except Exception as ex:
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except ClientError as ex:
             if type(ex).__name__ == "NoSuchBucket":
                 raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            # the request level error, e.g. throttling, applies to every path in the batch
+            return {path: ex.response["Error"]["Code"] for path in paths}
+        except Exception as ex:
             raise Exception(ex) # pragma: no cover
+        finally:
+            self.metadata_cache.invalidate_many(bucket, paths)
+        return {error["Key"]: error["Code"] for error in resp.get("Errors", [])}
@@ -0,0 +1,607 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+import os
+import asyncio
+from contextlib import AsyncExitStack
+from typing import AsyncIterator, Dict, Iterable, List, Tuple
+from botocore.exceptions import ClientError, NoCredentialsError, ParamValidationError
+from cloud_connectors.aws.s3 import Client
+from cloud_connectors import exceptions
+from cloud_connectors.lazy import lazy_import
+from cloud_connectors.validators import validate
+
+try:
+    from aiobotocore.session import get_session
+    from aiobotocore.config import AioConfig
+    from aiobotocore.client import AioBaseClient
+except ImportError as ex: # pragma: no cover
+    raise ImportError(
+        "AsyncClient requires aiobotocore, install it with 'pip install cloud-connectors[async]'"
+    ) from ex
+
+fastjsonschema = lazy_import("fastjsonschema")
+
+
+def _read_file_range(path: str, start: int, size: int) -> bytes:
+    """Function to read the byte range of a file.
+
+    Args:
+      path: Path to the file.
+      start: Range start.
+      size: Range size.
+
+    Returns:
+      File range.
+    """
+    with open(path, "rb") as fread:
+        fread.seek(start)
+        return fread.read(size)
+
+
+class AsyncClient:
+    """AWS s3 asyncio client.
+
+    The client must be connected before use, e.g.
+        async with AsyncClient(configuration) as client:
+            data = await client.read(bucket, path)
+
+    Args:
+      configuration (dict): Connection configuration, see aws.s3.Client.
+      max_connections: Max number of connections in the pool,
+        it caps the number of concurrent requests.
+
+    Raises:
+      exceptions.ConfigurationError: Raised when provided connection configuration is wrong.
+    """
+
+    __slots__ = ["configuration", "client", "stack"]
+
+    def __init__(self, configuration: dict = None, max_connections: int = 10) -> None:
+        if configuration:
+            try:
+                _ = validate(Client.CLIENT_CONFIG_SCHEMA, configuration)
+            except fastjsonschema.JsonSchemaException as ex:
+                raise exceptions.ConfigurationError(ex)
+        configuration = dict(configuration) if configuration else {}
+
+        configuration["config"] = AioConfig(
+            **{**(configuration.get("config") or {}), "max_pool_connections": max_connections}
+        )
+        self.configuration = configuration
+        self.client = None
+        self.stack = None
+
+    async def __aenter__(self) -> "AsyncClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Function to open the connections pool."""
+        if self.client is None:
+            stack = AsyncExitStack()
+            self.client = await stack.enter_async_context(
+                get_session().create_client("s3", **self.configuration)
+            )
+            self.stack = stack
+
+    async def close(self) -> None:
+        """Function to close the connections pool."""
+        if self.client is not None:
+            stack = self.stack
+            self.client, self.stack = None, None
+            await stack.aclose()
+
+    async def list_buckets(self) -> List[str]:
+        """Function to list buckets.
+
+        Returns:
+          List of buckets.
+
+        Raises:
+          ConnectionError: Raised when connection cannot be established.
+        """
+        try:
+            resp = await self._client().list_buckets()
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] == "InvalidAccessKeyId":
+                raise ConnectionError("Invalid access key")
+            raise Exception(ex) # pragma: no cover
+        return [bucket["Name"] for bucket in resp.get("Buckets", [])]
+
+    async def list_objects(
+        self, bucket: str, prefix: str = "", max_objects: int = None
+    ) -> List[str]:
+        """Function to list objects in a bucket.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix to restrict the list of results.
+          max_objects: Max number of keys to output.
+
+        Returns:
+          List of objects path in the bucket.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        return [obj["Key"] async for obj in self.iter_objects(
+            bucket=bucket, prefix=prefix, max_objects=max_objects
+        )]
+
+    async def list_objects_size(
+        self, bucket: str, prefix: str = "", max_objects: int = None
+    ) -> List[Tuple[str, int]]:
+        """Function to list objects in a bucket with their size.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix to restrict the list of results.
+          max_objects: Max number of keys to output.
+
+        Returns:
+          List of tuples with objects path and size in bytes.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        return [(obj["Key"], obj["Size"]) async for obj in self.iter_objects(
+            bucket=bucket, prefix=prefix, max_objects=max_objects
+        )]
+
+    async def iter_objects(
+        self,
+        bucket: str,
+        prefix: str = "",
+        max_objects: int = None,
+        page_size: int = None,
+        start_after: str = None,
+    ) -> AsyncIterator[dict]:
+        """Function to iterate over objects in a bucket page by page.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix to restrict the list of results.
+          max_objects: Max number of objects to output.
+          page_size: Max number of objects to fetch per LIST request (up to 1000).
+          start_after: Path to start listing after.
+
+        Returns:
+          Async iterator over objects attributes in the bucket.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        page_size = min(page_size, Client.LIST_PAGE_SIZE_MAX) if page_size \
+            else Client.LIST_PAGE_SIZE_MAX
+        remaining = max_objects
+        kwargs = {"Bucket": bucket, "Prefix": prefix}
+        if start_after:
+            kwargs["StartAfter"] = start_after
+
+        while remaining is None or remaining > 0:
+            kwargs["MaxKeys"] = page_size if remaining is None else min(page_size, remaining)
+            try:
+                page = await self._client().list_objects_v2(**kwargs)
+            except ParamValidationError as ex:
+                raise exceptions.BucketNotFound(ex)
+            except ClientError as ex:
+                if type(ex).__name__ == "NoSuchBucket":
+                    raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+                raise Exception(ex) # pragma: no cover
+
+            for obj in page.get("Contents", []):
+                yield obj
+            if remaining is not None:
+                remaining -= len(page.get("Contents", []))
+
+            if not page.get("IsTruncated"):
+                break
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    async def read(self, bucket: str, path: str) -> bytes:
+        """Function to read the object from a bucket into memory.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+
+        Returns:
+          Bytes encoded object.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        obj = await self._get_object(bucket=bucket, path=path)
+        async with obj["Body"] as body:
+            return await body.read()
+
+    async def write(
+        self, obj: bytes, bucket: str, path: str, configuration: dict = None
+    ) -> None:
+        """Function to write the object from memory into bucket.
+
+        Args:
+          obj: Object data to store in a bucket.
+          bucket: Bucket name.
+          path: Path to store the object to.
+          configuration: Extra configurations, see aws.s3.Client.write.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          TypeError: Raised when provided attributes have wrong types.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        configuration = configuration if configuration else {}
+        try:
+            await self._client().put_object(Body=obj, Bucket=bucket, Key=path, **configuration)
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except ParamValidationError:
+            raise TypeError("Provided function attributes have wrong type.")
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            raise Exception(ex) # pragma: no cover
+
+    async def upload(
+        self,
+        bucket: str,
+        path_source: str,
+        path_destination: str = None,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Function to upload the object from disk into a bucket.
+
+        Files larger than part_size are uploaded in parts using multipart upload.
+
+        Args:
+          bucket: Bucket name.
+          path_source: Path to locate the object on fs.
+          path_destination: Path to store the object to.
+          part_size: Size of the uploaded parts, 5 MB min.
+          max_concurrency: Max number of parts read and uploaded at the same time.
+
+        Raises:
+          ValueError: Raised when the part size is out of the multipart upload limits.
+          FileNotFoundError: Raised when file path_source not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        if part_size < Client.MULTIPART_PART_SIZE_MIN:
+            raise ValueError(f"Part size must be at least {Client.MULTIPART_PART_SIZE_MIN} bytes.")
+        if not os.path.exists(path_source):
+            raise FileNotFoundError(f"{path_source} not found")
+
+        path_destination = path_destination if path_destination else path_source
+        loop = asyncio.get_running_loop()
+        size = os.path.getsize(path_source)
+        if size <= part_size:
+            body = await loop.run_in_executor(None, _read_file_range, path_source, 0, size)
+            await self.write(body, bucket=bucket, path=path_destination)
+            return
+
+        # the part size grows to fit the file into the max number of parts
+        part_size = max(part_size, -(-size // Client.MULTIPART_PARTS_MAX))
+        try:
+            resp = await self._client().create_multipart_upload(Bucket=bucket, Key=path_destination)
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            raise Exception(ex) # pragma: no cover
+        upload_id = resp["UploadId"]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _upload_part(part_number: int) -> dict:
+            async with semaphore:
+                body = await loop.run_in_executor(
+                    None, _read_file_range, path_source, (part_number - 1) * part_size, part_size
+                )
+                resp = await self._client().upload_part(
+                    Bucket=bucket,
+                    Key=path_destination,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+            return {"ETag": resp["ETag"], "PartNumber": part_number}
+
+        tasks = [
+            asyncio.ensure_future(_upload_part(part_number))
+            for part_number in range(1, -(-size // part_size) + 1)
+        ]
+        try:
+            parts = await asyncio.gather(*tasks)
+            await self._client().complete_multipart_upload(
+                Bucket=bucket,
+                Key=path_destination,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await self._client().abort_multipart_upload(
+                Bucket=bucket, Key=path_destination, UploadId=upload_id
+            )
+            raise
+
+    async def download(self, bucket: str, path_source: str, path_destination: str) -> None:
+        """Function to download the object from a bucket to disk.
+
+        Args:
+          bucket: Bucket name.
+          path_source: Path to locate the object in bucket.
+          path_destination: Fs path to store the object to.
+
+        Raises:
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.DestinationPathError: Raised when cannot save object to provided location.
+          exceptions.DestinationPathPermissionsError: Raised when cannot save object to provided
+            location due to lack of permissons.
+        """
+        obj = await self._get_object(bucket=bucket, path=path_source)
+        loop = asyncio.get_running_loop()
+        async with obj["Body"] as body:
+            try:
+                fwrite = open(path_destination, "wb")
+            except (NotADirectoryError, FileNotFoundError):
+                raise exceptions.DestinationPathError(
+                    f"Cannot download file to {path_destination}"
+                )
+            except PermissionError:
+                raise exceptions.DestinationPathPermissionsError(
+                    f"Cannot download file to {path_destination}"
+                )
+            with fwrite:
+                while True:
+                    chunk = await body.read(Client.READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    await loop.run_in_executor(None, fwrite.write, chunk)
+
+    async def copy(
+        self,
+        bucket_source: str,
+        bucket_destination: str,
+        path_source: str,
+        path_destination: str = None,
+        configuration: dict = None,
+    ) -> None:
+        """Function to copy the object from bucket to bucket.
+
+        The object is copied server side with a single request, so up to 5 GB.
+
+        Args:
+          bucket_source: Bucket name source.
+          bucket_destination: Bucket name destination.
+          path_source: Initial path to locate the object in bucket.
+          path_destination: Final path to locate the object in bucket.
+          configuration: Extra configurations, see aws.s3.Client.copy.
+
+        Raises:
+          ConnectionError: Raised when a connection error to s3 occurred.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        configuration = dict(configuration) if configuration else {}
+        path_destination = path_destination if path_destination else path_source
+        if (bucket_destination, path_destination) == (bucket_source, path_source):
+            configuration["MetadataDirective"] = "REPLACE"
+            # the replaced metadata is reset unless set, so the source one is kept
+            head = await self._head_object(bucket=bucket_source, path=path_source)
+            for key in ["ContentType"] + Client.COPY_METADATA_KEYS:
+                if key in head:
+                    configuration.setdefault(key, head[key])
+
+        try:
+            await self._client().copy_object(
+                Bucket=bucket_destination,
+                CopySource={"Bucket": bucket_source, "Key": path_source},
+                Key=path_destination,
+                **configuration,
+            )
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket_destination}' not found.")
+            if type(ex).__name__ == "NoSuchKey":
+                raise exceptions.ObjectNotFound(
+                    f"Object '{path_source}' not found in bucket '{bucket_source}'"
+                )
+            raise Exception(ex) # pragma: no cover
+
+    async def move(
+        self,
+        bucket_source: str,
+        bucket_destination: str,
+        path_source: str,
+        path_destination: str = None,
+        configuration: dict = None,
+    ) -> None:
+        """Function to move the object from bucket to bucket.
+
+        Args:
+          bucket_source: Bucket name source.
+          bucket_destination: Bucket name destination.
+          path_source: Initial path to locate the object in bucket.
+          path_destination: Final path to locate the object in bucket.
+          configuration: Extra configurations, see aws.s3.Client.copy.
+
+        Raises:
+          ConnectionError: Raised when a connection error to s3 occurred.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        await self.copy(
+            bucket_source=bucket_source,
+            bucket_destination=bucket_destination,
+            path_source=path_source,
+            path_destination=path_destination,
+            configuration=configuration,
+        )
+        await self.delete_object(bucket=bucket_source, path=path_source)
+
+    async def delete_object(self, bucket: str, path: str) -> None:
+        """Function to delete the object from a bucket.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in bucket.
+
+        Raises:
+          ConnectionError: Raised when a connection error to s3 occurred.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        try:
+            await self._client().delete_object(Bucket=bucket, Key=path)
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            raise Exception(ex) # pragma: no cover
+
+    async def delete_objects(self, bucket: str, paths: Iterable[str]) -> Dict[str, str]:
+        """Function to delete the objects from a bucket.
+
+        The paths are deleted in batches of up to 1000 sent concurrently,
+        the concurrency is capped by the connections pool.
+
+        Args:
+          bucket: Bucket name.
+          paths: Paths to locate the objects in bucket.
+
+        Returns:
+          Error codes per path of the objects which were not deleted.
+
+        Raises:
+          ConnectionError: Raised when a connection error to s3 occurred.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        paths = list(paths)
+        failed = {}
+        for errors in await asyncio.gather(*[
+                self._delete_batch(bucket, paths[i:i + Client.DELETE_BATCH_SIZE_MAX])
+                for i in range(0, len(paths), Client.DELETE_BATCH_SIZE_MAX)
+        ]):
+            failed.update(errors)
+        return failed
+
+    async def _delete_batch(self, bucket: str, paths: List[str]) -> Dict[str, str]:
+        """Function to delete up to 1000 objects from a bucket with a single request.
+
+        Args:
+          bucket: Bucket name.
+          paths: Paths to locate the objects in bucket.
+
+        Returns:
+          Error codes per path of the objects which were not deleted.
+
+        Raises:
+          ConnectionError: Raised when a connection error to s3 occurred.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        try:
+            resp = await self._client().delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": v} for v in paths], "Quiet": True},
+            )
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            # the request level error, e.g. throttling, applies to every path in the batch
+            return {path: ex.response["Error"]["Code"] for path in paths}
+        return {error["Key"]: error["Code"] for error in resp.get("Errors", [])}
+
+    async def _get_object(self, bucket: str, path: str, **kwargs) -> dict:
+        """Function to send the GET object request.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          kwargs: Extra get_object request parameters.
+
+        Returns:
+          get_object response with the streaming body.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        try:
+            return await self._client().get_object(Bucket=bucket, Key=path, **kwargs)
+        except ParamValidationError as ex:
+            raise exceptions.BucketNotFound(ex)
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchKey":
+                raise exceptions.ObjectNotFound(
+                    f"Object '{path}' not found in bucket '{bucket}'"
+                )
+            if type(ex).__name__ in ["NoSuchBucket", "InvalidBucketName"]:
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found: {ex}")
+            raise Exception(ex) # pragma: no cover
+
+    async def _head_object(self, bucket: str, path: str) -> dict:
+        """Function to send the HEAD object request.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+
+        Returns:
+          head_object response.
+
+        Raises:
+          ConnectionError: Raised when connection error occured.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        try:
+            return await self._client().head_object(Bucket=bucket, Key=path)
+        except ParamValidationError as ex:
+            raise exceptions.BucketNotFound(ex)
+        except NoCredentialsError: # pragma: no cover
+            raise ConnectionError("Cannot connect, no credentials provided")
+        except ClientError as ex:
+            if type(ex).__name__ == "NoSuchBucket":
+                raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+            # HEAD responses have no body to tell a missing bucket from a missing key
+            if ex.response["Error"]["Code"] in ["404", "NoSuchKey"]:
+                try:
+                    await self._client().head_bucket(Bucket=bucket)
+                except ClientError:
+                    raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+                raise exceptions.ObjectNotFound(
+                    f"Object '{path}' not found in bucket '{bucket}'"
+                )
+            raise Exception(ex) # pragma: no cover
+
+    def _client(self) -> AioBaseClient:
+        """Function to get the connected aiobotocore client.
+
+        Returns:
+          aiobotocore s3 client.
+
+        Raises:
+          ConnectionError: Raised when the client is not connected.
+        """
+        if self.client is None:
+            raise ConnectionError(
+                "Client is not connected, use 'async with AsyncClient(...)', or 'await connect()'"
+            )
+        return self.client
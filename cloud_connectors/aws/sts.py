@@ -1,10 +1,13 @@
-from fastjsonschema import validate, JsonSchemaException
-import boto3  # type: ignore
 from botocore.exceptions import (PartialCredentialsError,  # type: ignore
                                  CredentialRetrievalError,  # type: ignore
                                  NoCredentialsError,  # type: ignore
                                  ClientError)  # type: ignore
 from cloud_connectors.exceptions import ConfigurationError
+from cloud_connectors.lazy import lazy_import
+from cloud_connectors.validators import validate
+
+boto3 = lazy_import("boto3")
+fastjsonschema = lazy_import("fastjsonschema")
 
 
 # fmt: off
@@ -98,7 +101,7 @@ def assume_role(configuration: dict) -> dict:
     """
     try:
         _ = validate(CONFIG_SCHEMA, configuration)
-    except JsonSchemaException as ex:
+    except fastjsonschema.JsonSchemaException as ex:
         raise ConfigurationError(ex)
 
     role_arn = configuration.pop("role_arn")
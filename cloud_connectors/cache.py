@@ -0,0 +1,354 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+import os
+import time
+import hashlib
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Tuple
+from urllib.parse import quote, unquote
+
+try:
+    import fcntl
+except ImportError: # pragma: no cover
+    # the cache is not locked across processes on platforms without fcntl
+    fcntl = None
+
+
+class MetadataCache:
+    """Bounded in-process cache of objects metadata with LRU eviction and TTL.
+
+    Entries are either complete, e.g. filled from HEAD responses,
+    or partial, e.g. filled from listing pages which lack some attributes.
+
+    Args:
+      max_size: Max number of entries, 0 to disable the cache.
+      ttl: Entries lifetime in seconds.
+    """
+
+    __slots__ = ["max_size", "ttl", "entries", "lock"]
+
+    def __init__(self, max_size: int = 10000, ttl: float = 60) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: "OrderedDict[Tuple[str, str], Tuple[float, bool, Any]]" = OrderedDict()
+        self.lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, bucket: str, path: str, complete: bool = True) -> Optional[Any]:
+        """Function to get the object metadata.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          complete: Skip partial entries.
+
+        Returns:
+          Object metadata, None if it's not cached, or expired.
+        """
+        key = (bucket, path)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, entry_complete, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            if complete and not entry_complete:
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, bucket: str, path: str, value: Any, complete: bool = True) -> None:
+        """Function to cache the object metadata.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          value: Object metadata.
+          complete: The metadata is complete.
+        """
+        self.put_many(bucket, [(path, value)], complete=complete)
+
+    def put_many(
+        self, bucket: str, items: Iterable[Tuple[str, Any]], complete: bool = True
+    ) -> None:
+        """Function to cache the metadata of many objects from a bucket.
+
+        Args:
+          bucket: Bucket name.
+          items: Paths to locate the objects in a bucket and their metadata.
+          complete: The metadata is complete.
+        """
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl
+        with self.lock:
+            for path, value in items:
+                key = (bucket, path)
+                self.entries[key] = (expires_at, complete, value)
+                self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, bucket: str, path: str) -> None:
+        """Function to drop the object metadata.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+        """
+        with self.lock:
+            self.entries.pop((bucket, path), None)
+
+    def invalidate_many(self, bucket: str, paths: Iterable[str]) -> None:
+        """Function to drop the metadata of many objects from a bucket.
+
+        Args:
+          bucket: Bucket name.
+          paths: Paths to locate the objects in a bucket.
+        """
+        with self.lock:
+            for path in paths:
+                self.entries.pop((bucket, path), None)
+
+    def clear(self) -> None:
+        """Function to drop all entries."""
+        with self.lock:
+            self.entries.clear()
+
+
+class DiskCache:
+    """Local disk cache of objects content shared by processes.
+
+    Objects are stored by bucket, path and ETag, the least recently used objects
+    are evicted once the total size exceeds the budget. Files are written to temporary
+    locations and renamed atomically, eviction is serialized with a file lock.
+    The total size is tracked in a file updated on every put, the cached files
+    are scanned only to evict them, which corrects the tracked size as well.
+
+    Args:
+      path: Path to the cache directory.
+      max_bytes: Total size budget in bytes.
+    """
+
+    __slots__ = ["path", "max_bytes"]
+
+    LOCK_FILE = ".lock"
+    SIZE_FILE = ".size"
+    TMP_DIR = ".tmp"
+
+    def __init__(self, path: str, max_bytes: int = 1024 ** 3) -> None:
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(self.path, DiskCache.TMP_DIR), exist_ok=True)
+
+    def get(self, bucket: str, path: str) -> Optional[Tuple[str, BinaryIO]]:
+        """Function to open the cached object.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+
+        Returns:
+          Object ETag and the opened file, None if the object is not cached.
+        """
+        try:
+            versions = list(os.scandir(self._directory(bucket, path)))
+        except FileNotFoundError:
+            return None
+
+        # the previous versions are removed on put, so there is normally a single one
+        for version in versions:
+            try:
+                # the caller closes the file
+                obj = open(version.path, "rb") # pylint: disable=consider-using-with
+            except FileNotFoundError:
+                continue
+            # mtime tracks the last access for eviction
+            try:
+                os.utime(version.path)
+            except FileNotFoundError:
+                pass
+            return unquote(version.name), obj
+        return None
+
+    def put(self, bucket: str, path: str, etag: str, chunks: Iterable[bytes]) -> BinaryIO:
+        """Function to store the object.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          etag: Object ETag.
+          chunks: Object content.
+
+        Returns:
+          Opened cached file positioned at the start.
+        """
+        directory = self._directory(bucket, path)
+        os.makedirs(directory, exist_ok=True)
+        destination = os.path.join(directory, quote(etag, safe=""))
+
+        # the caller closes the file, it stays readable if the object is evicted meanwhile
+        obj = tempfile.NamedTemporaryFile( # pylint: disable=consider-using-with
+            dir=os.path.join(self.path, DiskCache.TMP_DIR), delete=False
+        )
+        try:
+            for chunk in chunks:
+                obj.write(chunk)
+            obj.flush()
+            size = obj.tell()
+
+            with self._lock():
+                # the replaced version of the same ETag is not counted twice
+                size -= _size(destination)
+                os.replace(obj.name, destination)
+                for version in os.scandir(directory):
+                    if version.path != destination:
+                        size -= _remove(version.path)
+                total = self._read_size()
+                total = total + size if total is not None else None
+                if total is None or total > self.max_bytes:
+                    total = self._evict()
+                self._write_size(total)
+        except BaseException:
+            obj.close()
+            _remove(obj.name)
+            raise
+        obj.seek(0)
+        return obj
+
+    def clear(self) -> None:
+        """Function to remove all cached objects."""
+        with self._lock():
+            for entry in self._files():
+                _remove(entry.path)
+            self._write_size(0)
+
+    def _directory(self, bucket: str, path: str) -> str:
+        """Function to define the directory of the object versions.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+
+        Returns:
+          Path to the directory.
+        """
+        digest = hashlib.sha256(f"{bucket}/{path}".encode("utf-8")).hexdigest()
+        return os.path.join(self.path, digest[:2], digest)
+
+    def _files(self) -> Iterator[os.DirEntry]:
+        """Function to iterate over the cached files.
+
+        Returns:
+          Iterator over the cached files.
+        """
+        for shard in os.scandir(self.path):
+            if shard.name.startswith(".") or not shard.is_dir():
+                continue
+            for directory in os.scandir(shard.path):
+                try:
+                    yield from os.scandir(directory.path)
+                except FileNotFoundError:
+                    continue
+
+    def _read_size(self) -> Optional[int]:
+        """Function to read the tracked total size of the cached files.
+
+        Must be called with the lock held.
+
+        Returns:
+          Total size in bytes, None if it's not tracked yet.
+        """
+        try:
+            with open(os.path.join(self.path, DiskCache.SIZE_FILE), encoding="utf-8") as fread:
+                return int(fread.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_size(self, size: int) -> None:
+        """Function to write the tracked total size of the cached files.
+
+        Must be called with the lock held.
+
+        Args:
+          size: Total size in bytes.
+        """
+        with open(os.path.join(self.path, DiskCache.SIZE_FILE), "w", encoding="utf-8") as fwrite:
+            fwrite.write(str(size))
+
+    def _evict(self) -> int:
+        """Function to remove the least recently used files over the size budget.
+
+        Must be called with the lock held.
+
+        Returns:
+          Total size of the files left in bytes.
+        """
+        files = []
+        for entry in self._files():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(i[1] for i in files)
+        for _, file_size, path in sorted(files):
+            if size <= self.max_bytes:
+                break
+            _remove(path)
+            size -= file_size
+        return size
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Context manager to hold the exclusive cache lock."""
+        with open(os.path.join(self.path, DiskCache.LOCK_FILE), "ab") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def _size(path: str) -> int:
+    """Function to get the file size.
+
+    Args:
+      path: Path to the file.
+
+    Returns:
+      Size of the file in bytes, 0 if it doesn't exist.
+    """
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _remove(path: str) -> int:
+    """Function to remove the file if it exists.
+
+    Args:
+      path: Path to the file.
+
+    Returns:
+      Size of the removed file in bytes, 0 if it doesn't exist.
+    """
+    try:
+        size = os.stat(path).st_size
+        os.remove(path)
+    except FileNotFoundError:
+        return 0
+    return size
@@ -0,0 +1,150 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+import hashlib
+from typing import Iterable, Iterator, List, Union
+from cloud_connectors import exceptions
+from cloud_connectors.lazy import lazy_import
+
+google_crc32c = lazy_import("google_crc32c")
+
+
+def etag_parts_count(etag: str) -> int:
+    """Function to get the number of parts from the S3 ETag.
+
+    Args:
+      etag: Object ETag, with or without the quotes.
+
+    Returns:
+      Number of parts of the multipart uploaded object, 0 for a single part upload.
+    """
+    _, _, parts = etag.strip('"').partition("-")
+    return int(parts) if parts.isdigit() else 0
+
+
+def multipart_etag(digests: List[bytes]) -> str:
+    """Function to compute the S3 ETag of the multipart uploaded object.
+
+    Args:
+      digests: MD5 digests of the parts.
+
+    Returns:
+      MD5 hex digest of the parts digests suffixed with the number of parts.
+    """
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+class ETag:
+    """Incremental S3 ETag of a stream.
+
+    Args:
+      part_size: Size of the multipart upload parts, the plain MD5 is computed if not set.
+    """
+
+    def __init__(self, part_size: int = None):
+        self.part_size = part_size
+        self.digests = []
+        self.part = hashlib.md5()
+        self.part_position = 0
+
+    def update(self, data: Union[bytes, memoryview]) -> None:
+        """Function to feed the next chunk of the stream.
+
+        Args:
+          data: Chunk of the stream.
+        """
+        if self.part_size is None:
+            self.part.update(data)
+            return
+
+        view = memoryview(data)
+        while view:
+            size = min(len(view), self.part_size - self.part_position)
+            self.part.update(view[:size])
+            self.part_position += size
+            view = view[size:]
+            if self.part_position == self.part_size:
+                self.digests.append(self.part.digest())
+                self.part = hashlib.md5()
+                self.part_position = 0
+
+    def hexdigest(self) -> str:
+        """Function to get the ETag of the stream fed so far.
+
+        Returns:
+          MD5 hex digest, or the multipart ETag if the part size is set.
+        """
+        if self.part_size is None:
+            return self.part.hexdigest()
+        digests = self.digests + [self.part.digest()] if self.part_position else self.digests
+        return multipart_etag(digests)
+
+
+class CRC32C:
+    """Incremental CRC32C of a stream, the checksum Cloud Storage keeps for every object."""
+
+    def __init__(self):
+        self.checksum = google_crc32c.Checksum()
+
+    def update(self, data: Union[bytes, memoryview]) -> None:
+        """Function to feed the next chunk of the stream.
+
+        Args:
+          data: Chunk of the stream.
+        """
+        self.checksum.update(bytes(data) if isinstance(data, memoryview) else data)
+
+    def hexdigest(self) -> str:
+        """Function to get the CRC32C of the stream fed so far.
+
+        Returns:
+          Big-endian CRC32C hex digest.
+        """
+        return self.checksum.digest().hex()
+
+
+def check(got: str, expected: str, name: str) -> None:
+    """Function to compare the computed checksum to the remote one.
+
+    Args:
+      got: Checksum computed locally.
+      expected: Checksum of the remote object.
+      name: Object name to report.
+
+    Raises:
+      exceptions.ChecksumMismatch: Raised when the checksums differ.
+    """
+    expected = expected.strip('"')
+    if got != expected:
+        raise exceptions.ChecksumMismatch(
+            f"Checksum mismatch of '{name}': computed {got}, expected {expected}"
+        )
+
+
+def verify(
+    chunks: Iterable[bytes],
+    checksum: Union[ETag, CRC32C],
+    expected: str,
+    name: str,
+) -> Iterator[bytes]:
+    """Function to pass the stream through computing its checksum.
+
+    The checksum is compared once the stream is exhausted,
+    so the mismatch is raised by the consumer after the last chunk.
+
+    Args:
+      chunks: Iterator of bytes chunks.
+      checksum: Incremental checksum, ETag, or CRC32C.
+      expected: Checksum of the remote object.
+      name: Object name to report.
+
+    Returns:
+      Iterator over the chunks.
+
+    Raises:
+      exceptions.ChecksumMismatch: Raised when the checksums differ.
+    """
+    for chunk in chunks:
+        checksum.update(chunk)
+        yield chunk
+    check(checksum.hexdigest(), expected, name)
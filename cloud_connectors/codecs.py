@@ -0,0 +1,190 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+import gzip
+import zlib
+from functools import partial
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+from cloud_connectors.lazy import lazy_import
+
+zstandard = lazy_import("zstandard")
+
+
+CODECS = ["gzip", "zstd"]
+
+# Content-Encoding values of the codecs
+CONTENT_ENCODING = {"gzip": "gzip", "zstd": "zstd"}
+
+_ZSTD_MISSING = (
+    "zstd codec requires zstandard, install it with 'pip install cloud-connectors[zstd]'"
+)
+
+
+def check(codec: str) -> None:
+    """Function to check the codec is supported.
+
+    Args:
+      codec: Codec name.
+
+    Raises:
+      ValueError: Raised when unknown codec provided.
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec '{codec}', supported: {', '.join(CODECS)}.")
+
+
+def _compressor(codec: str, level: Optional[int]) -> Any:
+    """Function to create the streaming compressor.
+
+    Args:
+      codec: Codec name.
+      level: Compression level, the codec default if not set.
+
+    Returns:
+      Object with the compress and flush methods.
+
+    Raises:
+      ImportError: Raised when the codec library is not installed.
+    """
+    if codec == "gzip":
+        # wbits 16 + 15 writes the gzip header and trailer
+        return zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION if level is None else level, zlib.DEFLATED, 31
+        )
+    try:
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    except ImportError as ex:
+        raise ImportError(_ZSTD_MISSING) from ex
+
+
+def codec_from_encoding(content_encoding: Optional[str]) -> Optional[str]:
+    """Function to define the codec from the Content-Encoding value.
+
+    Args:
+      content_encoding: Content-Encoding of the object.
+
+    Returns:
+      Codec name, None if the content is not encoded with a supported codec.
+    """
+    if not content_encoding:
+        return None
+    for codec, encoding in CONTENT_ENCODING.items():
+        if content_encoding.strip().lower() == encoding:
+            return codec
+    return None
+
+
+def encode(chunks: Iterable[bytes], codec: str, level: int = None) -> Iterator[bytes]:
+    """Function to compress the stream chunk by chunk.
+
+    Args:
+      chunks: Iterator of bytes chunks.
+      codec: Codec name, "gzip", or "zstd".
+      level: Compression level, the codec default if not set.
+
+    Returns:
+      Iterator over the compressed chunks, empty chunks are skipped.
+
+    Raises:
+      ValueError: Raised when unknown codec provided.
+      ImportError: Raised when the codec library is not installed.
+    """
+    check(codec)
+    return _encode(chunks, _compressor(codec, level))
+
+
+def _encode(chunks: Iterable[bytes], compressor: Any) -> Iterator[bytes]:
+    """Function to compress the stream chunk by chunk.
+
+    Args:
+      chunks: Iterator of bytes chunks.
+      compressor: Streaming compressor.
+
+    Returns:
+      Iterator over the compressed chunks.
+    """
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    compressed = compressor.flush()
+    if compressed:
+        yield compressed
+
+
+class _ChunksReader:
+    """Minimal readable file object over an iterator of bytes chunks.
+
+    Args:
+      chunks: Iterator of bytes chunks.
+    """
+
+    __slots__ = ["chunks", "buffer"]
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.chunks = iter(chunks)
+        self.buffer = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        """Function to read up to size bytes.
+
+        Args:
+          size: Max number of bytes, all remaining bytes if negative.
+
+        Returns:
+          Bytes, empty at the end of the stream.
+        """
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        if size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+def decode(chunks: Iterable[bytes], codec: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+    """Function to decompress the stream chunk by chunk.
+
+    Concatenated gzip members, or zstd frames are decompressed one after another.
+
+    Args:
+      chunks: Iterator of compressed bytes chunks.
+      codec: Codec name, "gzip", or "zstd".
+      chunk_size: Max size of the decompressed chunks.
+
+    Returns:
+      Iterator over the decompressed chunks.
+
+    Raises:
+      ValueError: Raised when unknown codec provided.
+      EOFError: Raised when the gzip stream is truncated.
+      ImportError: Raised when the codec library is not installed.
+    """
+    check(codec)
+    reader = _ChunksReader(chunks)
+    if codec == "gzip":
+        stream = gzip.GzipFile(fileobj=reader, mode="rb")
+    else:
+        try:
+            stream = zstandard.ZstdDecompressor().stream_reader(reader, read_across_frames=True)
+        except ImportError as ex:
+            raise ImportError(_ZSTD_MISSING) from ex
+    return _decode(stream, chunk_size)
+
+
+def _decode(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Function to read the decompressing stream chunk by chunk.
+
+    Args:
+      stream: Decompressing file object.
+      chunk_size: Max size of the chunks.
+
+    Returns:
+      Iterator over the decompressed chunks.
+    """
+    with stream:
+        yield from iter(partial(stream.read, chunk_size), b"")
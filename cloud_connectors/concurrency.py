@@ -0,0 +1,205 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from queue import Queue, Full
+from threading import Event, Lock
+
+
+SHARED_EXECUTOR_MAX_WORKERS = 64
+
+_DONE = object()
+_SHARED_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SHARED_EXECUTOR_LOCK = Lock()
+
+
+class _Failure:
+    """Wrapper to pass an exception from a worker to the consumer."""
+
+    __slots__ = ["exception"]
+
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+def merge_iterators(
+    producers: List[Callable[[], Iterable[Any]]],
+    max_concurrency: int = 8,
+    ordered: bool = True,
+    buffer_size: int = 2,
+) -> Iterator[Any]:
+    """Function to consume several iterators concurrently and merge their output.
+
+    Every producer is run on a bounded thread pool, the produced items are buffered
+    in bounded queues, so a slow consumer throttles the producers.
+
+    Args:
+      producers: Functions returning the iterators to consume.
+      max_concurrency: Max number of producers to run at the same time.
+      ordered: Output items in the order of producers, otherwise as they arrive.
+      buffer_size: Max number of items to buffer per producer.
+
+    Returns:
+      Iterator over the items of all producers.
+
+    Raises:
+      Exception: Re-raised exception raised by a producer.
+    """
+    stop = Event()
+
+    def _put(queue: Queue, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _run(producer: Callable[[], Iterable[Any]], queue: Queue) -> None:
+        # the producers queued behind the running ones are not started after the consumer stops
+        if stop.is_set():
+            return
+        try:
+            for item in producer():
+                if not _put(queue, item):
+                    return
+        except BaseException as ex: # pylint: disable=broad-except
+            _put(queue, _Failure(ex))
+            return
+        _put(queue, _DONE)
+
+    if ordered:
+        queues = [Queue(maxsize=buffer_size) for _ in producers]
+    else:
+        queues = [Queue(maxsize=buffer_size * max_concurrency)] * len(producers)
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency))
+    futures = []
+    try:
+        # producers are started in order, so the one consumed next is always running
+        for producer, queue in zip(producers, queues):
+            futures.append(executor.submit(_run, producer, queue))
+
+        pending = len(producers)
+        position = 0
+        while pending:
+            item = queues[position].get()
+            if item is _DONE:
+                pending -= 1
+                if ordered:
+                    position += 1
+                continue
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield item
+    finally:
+        stop.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def shared_executor() -> ThreadPoolExecutor:
+    """Function to get the thread pool shared by the batch operations of all clients.
+
+    The threads are started on demand and kept for the next batches,
+    so batches issued per request don't pay for the pool start-up.
+
+    Returns:
+      Shared thread pool of SHARED_EXECUTOR_MAX_WORKERS workers.
+    """
+    global _SHARED_EXECUTOR  # pylint: disable=global-statement
+    if _SHARED_EXECUTOR is None:
+        with _SHARED_EXECUTOR_LOCK:
+            if _SHARED_EXECUTOR is None:
+                _SHARED_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=SHARED_EXECUTOR_MAX_WORKERS, thread_name_prefix="cloud_connectors"
+                )
+    return _SHARED_EXECUTOR
+
+
+def bounded_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: int = 8,
+    ordered: bool = False,
+    executor: Executor = None,
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """Function to apply a function to the items concurrently reporting every outcome.
+
+    The items are consumed lazily, at most 2 * max_concurrency of them are pending at a time,
+    or max_concurrency if the executor is provided.
+    Exceptions raised by the function are reported per item and do not stop the processing.
+
+    Args:
+      func: Function to apply.
+      items: Items to apply the function to.
+      max_concurrency: Max number of function calls running at the same time.
+      ordered: Output the outcomes in the items order, otherwise in the completion order.
+      executor: Executor to run the calls on, e.g. shared_executor().
+        The thread pool of max_concurrency workers is created for the call if not set.
+
+    Returns:
+      Iterator over (item, result, exception), exception is None for successful calls.
+
+    Raises:
+      Exception: Re-raised exception raised by the items iterator.
+    """
+    max_concurrency = max(1, max_concurrency)
+    if executor is not None:
+        yield from _bounded_map(func, items, max_concurrency, ordered, executor)
+        return
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor_call:
+        yield from _bounded_map(func, items, 2 * max_concurrency, ordered, executor_call)
+
+
+def _bounded_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_pending: int,
+    ordered: bool,
+    executor: Executor,
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """Function to apply a function to the items on the executor, see bounded_map.
+
+    Args:
+      func: Function to apply.
+      items: Items to apply the function to.
+      max_pending: Max number of calls submitted at a time.
+      ordered: Output the outcomes in the items order.
+      executor: Executor to run the calls on.
+
+    Returns:
+      Iterator over (item, result, exception).
+    """
+    def _outcome(future: Future) -> Tuple[Any, Optional[Exception]]:
+        exception = future.exception()
+        if exception is not None:
+            return None, exception
+        return future.result(), None
+
+    def _done() -> List[Future]:
+        if ordered:
+            # the dict keeps the submission order
+            future = next(iter(pending))
+            wait([future])
+            return [future]
+        return list(wait(pending, return_when=FIRST_COMPLETED)[0])
+
+    pending = {}
+    try:
+        for item in items:
+            pending[executor.submit(func, item)] = item
+            if len(pending) >= max_pending:
+                for future in _done():
+                    yield (pending.pop(future), *_outcome(future))
+
+        while pending:
+            for future in _done():
+                yield (pending.pop(future), *_outcome(future))
+    finally:
+        # the calls are not left behind on the shared executor if the consumer stops early
+        for future in pending:
+            future.cancel()
@@ -32,3 +32,7 @@ class DatabaseConnectionError(Exception):
 
 class DatabaseError(Exception):
     """Raise when DB backend/client error occurred."""
+
+
+class ChecksumMismatch(Exception):
+    """Raised when the checksum of the transferred data differs from the remote one."""
@@ -1,11 +1,21 @@
 # Dmitry Kisler © 2020-present
 # www.dkisler.com
 
-from typing import List, Tuple
-from fastjsonschema import validate, JsonSchemaException
-from google.cloud import storage
+import time
+import base64
+from datetime import datetime
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
 from cloud_connectors.template.cloud_storage import Client as ClientCommon
-from cloud_connectors import exceptions
+from cloud_connectors import checksums, codecs, exceptions, local_select
+from cloud_connectors.cache import MetadataCache
+from cloud_connectors.concurrency import bounded_map, shared_executor
+from cloud_connectors.lazy import lazy_import
+from cloud_connectors.validators import validate
+
+storage = lazy_import("google.cloud.storage")
+google_credentials = lazy_import("google.auth.credentials")
+google_client_info = lazy_import("google.api_core.client_info")
+fastjsonschema = lazy_import("fastjsonschema")
 
 
 class Client(ClientCommon):
@@ -17,7 +27,10 @@ class Client(ClientCommon):
         Dict structure with all options
           See details:
             https://googleapis.dev/python/storage/latest/client.html?highlight=list%20buckets#google.cloud.storage.client.Client
-
+      metadata_cache_size: Max number of objects metadata entries to cache, disabled by default.
+        The cached metadata is not revalidated, the changes by other clients are seen
+        once the entries expire.
+      metadata_cache_ttl: Lifetime of the cached objects metadata in seconds.
 
     Raises:
       exceptions.ConfigurationError: Raised when provided connection configuration is wrong.
@@ -133,11 +146,24 @@ class Client(ClientCommon):
     }
     # fmt: on
 
-    def __init__(self, configuration: dict = None):
+    OBJECT_METADATA_TUPLE = NamedTuple(
+        "object_metadata",
+        [("size", int), ("etag", str), ("content_type", str), ("last_modified", datetime)],
+    )
+    READ_RESULT_TUPLE = NamedTuple(
+        "read_result", [("path", str), ("data", bytes), ("exception", Exception)]
+    )
+
+    def __init__(
+        self,
+        configuration: dict = None,
+        metadata_cache_size: int = 0,
+        metadata_cache_ttl: float = 60,
+    ):
         if configuration:
             try:
                 _ = validate(Client.CLIENT_CONFIG_SCHEMA, configuration)
-            except JsonSchemaException as ex:
+            except fastjsonschema.JsonSchemaException as ex:
                 raise exceptions.ConfigurationError(ex)
 
             if "credentials" in configuration:
@@ -146,17 +172,18 @@ class Client(ClientCommon):
                         configuration['credentials']['expiry'] = time.strptime(
                             configuration['credentials']['expiry']
                         )
-                    configuration['credentials'] = google.auth.credentials.Credentials(
+                    configuration['credentials'] = google_credentials.Credentials(
                         **configuration['credentials']
                     )
 
             if "client_info" in configuration:
                 if configuration['client_info']:
-                    configuration['client_info'] = google.api_core.client_info.ClientInfo(
+                    configuration['client_info'] = google_client_info.ClientInfo(
                         **configuration['client_info']
                     )
 
         self.client = storage.Client(**configuration) if configuration else storage.Client()
+        self.metadata_cache = MetadataCache(max_size=metadata_cache_size, ttl=metadata_cache_ttl)
 
     def list_buckets(self) -> List[str]:
         """Function to list buckets.
@@ -184,7 +211,9 @@ class Client(ClientCommon):
         if not bucket_obj:
             raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
 
-        return [i.name for i in bucket_obj.list_blobs(prefix=prefix, max_results=max_objects)]
+        return [i.name for i in self._cache_blobs(
+            bucket, bucket_obj.list_blobs(prefix=prefix, max_results=max_objects)
+        )]
 
     def list_objects_size(
         self, bucket: str, prefix: str = "", max_objects: int = None
@@ -209,5 +238,292 @@ class Client(ClientCommon):
 
         return [
             (i.name, int(i._properties['size']))
-            for i in bucket_obj.list_blobs(prefix=prefix, max_results=max_objects)
+            for i in self._cache_blobs(
+                bucket, bucket_obj.list_blobs(prefix=prefix, max_results=max_objects)
+            )
         ]
+
+    def iter_objects_size(
+        self, bucket: str, prefix: str = "", start_after: str = None
+    ) -> Iterator[Tuple[str, int]]:
+        # pylint: disable=protected-access
+        """Function to iterate over objects in a bucket with their size.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix to restrict the list of results.
+          start_after: Path to start listing after.
+
+        Returns:
+          Iterator over tuples with objects path and size in bytes.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        bucket_obj = self.client.lookup_bucket(bucket)
+        if not bucket_obj:
+            raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+
+        # start_offset is inclusive
+        blobs = bucket_obj.list_blobs(prefix=prefix, start_offset=start_after)
+        for i in self._cache_blobs(bucket, blobs):
+            if i.name != start_after:
+                yield i.name, int(i._properties['size'])
+
+    def head(
+        self, bucket: str, path: str
+    ) -> OBJECT_METADATA_TUPLE:
+        """Function to get the object metadata.
+
+        The metadata is served from the client cache, the object is requested on a cache miss.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+
+        Returns:
+          Object size in bytes, ETag, content type and last modification time.
+
+        Raises:
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        metadata = self.metadata_cache.get(bucket, path)
+        if metadata is not None:
+            return metadata
+
+        bucket_obj = self.client.lookup_bucket(bucket)
+        if not bucket_obj:
+            raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+
+        blob = bucket_obj.get_blob(path)
+        if blob is None:
+            raise exceptions.ObjectNotFound(f"Object '{path}' not found in bucket '{bucket}'")
+
+        metadata = _blob_metadata(blob)
+        self.metadata_cache.put(bucket, path, metadata)
+        return metadata
+
+    def exists(self, bucket: str, path: str) -> bool:
+        """Function to check if the object exists.
+
+        The objects seen in the recent listings are found without requests.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+
+        Returns:
+          True if the object exists.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        try:
+            _ = self.head(bucket=bucket, path=path)
+        except exceptions.ObjectNotFound:
+            return False
+        return True
+
+    def read_stream(
+        self,
+        bucket: str,
+        path: str,
+        chunk_size: int = 8 * 1024 * 1024,
+        codec: str = None,
+        verify: bool = False,
+    ) -> Iterator[bytes]:
+        """Function to read the object from a bucket chunk by chunk.
+
+        The chunks are fetched with ranged requests pinned to the object generation,
+        and decompressed chunk by chunk if the codec is set.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          chunk_size: Max chunk size in bytes.
+          codec: Codec to decompress the object with, "gzip", or "zstd".
+            "auto" to define the codec from the object ContentEncoding.
+          verify: Compare the object CRC32C to the one computed from the received bytes,
+            the mismatch is raised after the last chunk.
+
+        Returns:
+          Iterator over the object chunks.
+
+        Raises:
+          ValueError: Raised when unknown codec provided.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+          exceptions.ChecksumMismatch: Raised when the received object is corrupted.
+        """
+        if codec not in [None, "auto"]:
+            codecs.check(codec)
+
+        bucket_obj = self.client.lookup_bucket(bucket)
+        if not bucket_obj:
+            raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+
+        blob = bucket_obj.get_blob(path)
+        if blob is None:
+            raise exceptions.ObjectNotFound(f"Object '{path}' not found in bucket '{bucket}'")
+
+        chunks = _iter_blob_chunks(blob, chunk_size)
+        if verify and blob.crc32c:
+            chunks = checksums.verify(
+                chunks,
+                checksums.CRC32C(),
+                base64.b64decode(blob.crc32c).hex(),
+                f"gs://{bucket}/{path}",
+            )
+        if codec == "auto":
+            codec = codecs.codec_from_encoding(blob.content_encoding)
+        if codec is None:
+            return chunks
+        return codecs.decode(chunks, codec, chunk_size=chunk_size)
+
+    def read_many(
+        self,
+        bucket: str,
+        paths: Iterable[str],
+        max_concurrency: int = 32,
+        ordered: bool = True,
+    ) -> Iterator[READ_RESULT_TUPLE]:
+        """Function to read many objects from a bucket into memory concurrently.
+
+        The GET requests are issued on the thread pool shared by all clients,
+        at most max_concurrency of them at a time.
+
+        Args:
+          bucket: Bucket name.
+          paths: Paths to locate the objects in a bucket.
+          max_concurrency: Max number of objects read at the same time.
+          ordered: Output the objects in the paths order, otherwise as they are read.
+
+        Returns:
+          Iterator over the path, the object and the exception per path, the exception is None
+            for the objects read successfully, e.g. exceptions.ObjectNotFound for missing ones.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        bucket_obj = self.client.lookup_bucket(bucket)
+        if not bucket_obj:
+            raise exceptions.BucketNotFound(f"Bucket '{bucket}' not found.")
+
+        def _read(path: str) -> bytes:
+            try:
+                return bucket_obj.blob(path).download_as_bytes()
+            except Exception as ex:
+                if type(ex).__name__ == "NotFound":
+                    raise exceptions.ObjectNotFound(
+                        f"Object '{path}' not found in bucket '{bucket}'"
+                    )
+                raise
+
+        for path, obj, exception in bounded_map(
+            _read,
+            paths,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            executor=shared_executor(),
+        ):
+            yield Client.READ_RESULT_TUPLE(path=path, data=obj, exception=exception)
+
+    def select(
+        self,
+        bucket: str,
+        path: str,
+        sql: str,
+        input_format: str = "JSON",
+        output_format: str = "JSON",
+        input_serialization: dict = None,
+        output_serialization: dict = None,
+        codec: str = None,
+    ) -> Iterator[bytes]:
+        """Function to filter the CSV, or JSON records of the object with the SQL expression.
+
+        Cloud Storage has no predicate pushdown, the object is streamed and filtered locally
+        with the S3 Select SQL subset, see local_select.select.
+
+        Args:
+          bucket: Bucket name.
+          path: Path to locate the object in a bucket.
+          sql: SQL expression, e.g. "SELECT * FROM S3Object s WHERE s.id > 100".
+          input_format: Object format, "CSV", or "JSON".
+          output_format: Output format, "CSV", or "JSON".
+          input_serialization: Input format parameters,
+            e.g. {"FileHeaderInfo": "USE"} for CSV, or {"Type": "LINES"} for JSON.
+          output_serialization: Output format parameters.
+          codec: Codec the object is compressed with, "gzip", or "zstd".
+
+        Returns:
+          Iterator over the matching records, each ends with the output records delimiter.
+
+        Raises:
+          ValueError: Raised when unknown format, or codec provided,
+            or the expression is not valid, or not supported.
+          exceptions.ObjectNotFound: Raised when the object not found.
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        for data_format in [input_format, output_format]:
+            if data_format not in local_select.FORMATS:
+                raise ValueError(
+                    f"Unknown format '{data_format}', "
+                    f"supported: {', '.join(local_select.FORMATS)}."
+                )
+        return local_select.select(
+            self.read_stream(bucket=bucket, path=path, codec=codec),
+            sql,
+            input_format=input_format,
+            output_format=output_format,
+            input_serialization=input_serialization,
+            output_serialization=output_serialization,
+        )
+
+    def _cache_blobs(
+        self, bucket: str, blobs: Iterable["storage.Blob"]
+    ) -> Iterator["storage.Blob"]:
+        """Function to cache the metadata of the listed objects.
+
+        Args:
+          bucket: Bucket name.
+          blobs: Listed objects.
+
+        Returns:
+          Iterator over the listed objects.
+        """
+        for blob in blobs:
+            self.metadata_cache.put(bucket, blob.name, _blob_metadata(blob))
+            yield blob
+
+
+def _iter_blob_chunks(blob: "storage.Blob", chunk_size: int) -> Iterator[bytes]:
+    """Function to fetch the object byte ranges one by one.
+
+    Args:
+      blob: Cloud Storage object with the size and generation.
+      chunk_size: Size of the byte range fetched by a single request.
+
+    Returns:
+      Iterator over the object chunks.
+    """
+    for start in range(0, blob.size, chunk_size):
+        # the stored bytes are fetched as is, the content encoding is decoded by the codec
+        # the end is inclusive
+        yield blob.download_as_bytes(
+            start=start, end=min(start + chunk_size, blob.size) - 1, raw_download=True
+        )
+
+
+def _blob_metadata(blob: "storage.Blob") -> Tuple[int, str, str, datetime]:
+    """Function to extract the object metadata.
+
+    Args:
+      blob: Cloud Storage object.
+
+    Returns:
+      Object size in bytes, ETag, content type and last modification time.
+    """
+    return Client.OBJECT_METADATA_TUPLE(
+        size=blob.size, etag=blob.etag, content_type=blob.content_type, last_modified=blob.updated,
+    )
@@ -0,0 +1,34 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+import sys
+import importlib
+from types import ModuleType
+
+
+class _LazyModule(ModuleType):
+    """Module placeholder importing the module on the first attribute access."""
+
+    def __getattr__(self, name: str):
+        module = importlib.import_module(self.__name__)
+        # the following lookups are served from the placeholder dict directly
+        self.__dict__.update(module.__dict__)
+        return getattr(module, name)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Function to import the module on its first use.
+
+    The heavy SDK modules are deferred until the first client is created,
+    so importing the connectors stays cheap.
+
+    Args:
+      name: Module name, e.g. boto3, or google.cloud.storage.
+
+    Returns:
+      Imported module, or its placeholder.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return _LazyModule(name)
@@ -0,0 +1,352 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+import os
+import time
+import sqlite3
+from itertools import islice
+from threading import Lock
+from typing import Iterator, List, Optional, Tuple
+from cloud_connectors.template.cloud_storage import Client as ClientCommon
+
+
+_INSERT_BATCH_SIZE = 10000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    bucket TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (bucket, path)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS scans (
+    bucket TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    scanned_at REAL NOT NULL,
+    last_path TEXT,
+    PRIMARY KEY (bucket, prefix)
+) WITHOUT ROWID;
+"""
+
+
+def _prefix_range(prefix: str) -> Tuple[str, str]:
+    """Function to define the paths range starting with the prefix.
+
+    Args:
+      prefix: Objects prefix.
+
+    Returns:
+      Lower (inclusive) and upper (exclusive) bounds of the range.
+    """
+    if not prefix:
+        return "", "\U0010ffff"
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _glob_prefix(pattern: str) -> str:
+    """Function to get the literal prefix of a glob pattern.
+
+    Args:
+      pattern: Glob pattern.
+
+    Returns:
+      Pattern part before the first wildcard.
+    """
+    for position, char in enumerate(pattern):
+        if char in "*?[":
+            return pattern[:position]
+    return pattern
+
+
+class ListingIndex:
+    """Local persistent index of the cloud storage objects listing.
+
+    The index answers prefix, glob and size-aggregate queries without network calls.
+    The listing of a prefix is fetched on the first query and refreshed once it's older than ttl:
+    append only prefixes are refreshed incrementally listing after the last indexed path,
+    the other prefixes are re-scanned fully.
+
+    Args:
+      client: Cloud storage client with the iter_objects_size method,
+        e.g. cloud_connectors.aws.s3.Client, or cloud_connectors.gcp.gcs.Client.
+      path: Path to the SQLite index file.
+      ttl: Max age of the listing in seconds.
+      append_only: Objects in the indexed prefixes are only added, never changed, or deleted.
+    """
+
+    __slots__ = ["client", "ttl", "append_only", "conn", "lock"]
+
+    def __init__(
+        self,
+        client: ClientCommon,
+        path: str = os.path.join(os.path.expanduser("~"), ".cache", "cloud_connectors.sqlite"),
+        ttl: float = 3600,
+        append_only: bool = False,
+    ) -> None:
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.client = client
+        self.ttl = ttl
+        self.append_only = append_only
+        self.lock = Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def refresh(self, bucket: str, prefix: str = "", full: bool = None) -> int:
+        """Function to refresh the listing of the prefix.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix.
+          full: Re-scan the prefix fully. By default, only append only prefixes
+            with the existing listing are refreshed incrementally.
+
+        Returns:
+          Number of listed objects.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        with self.lock:
+            scan = self._scan(bucket, prefix)
+            if full is None:
+                full = not (self.append_only and scan is not None and scan[0] == prefix)
+            if full:
+                return self._scan_full(bucket, prefix)
+            return self._scan_incremental(bucket, prefix, scan[2])
+
+    def list_objects(self, bucket: str, prefix: str = "", max_objects: int = None) -> List[str]:
+        """Function to list objects in a bucket.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix to restrict the list of results.
+          max_objects: Max number of keys to output.
+
+        Returns:
+          List of objects path in the bucket.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        return [path for path, _ in self.list_objects_size(bucket, prefix, max_objects)]
+
+    def list_objects_size(
+        self, bucket: str, prefix: str = "", max_objects: int = None
+    ) -> List[Tuple[str, int]]:
+        """Function to list objects in a bucket with their size.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix to restrict the list of results.
+          max_objects: Max number of keys to output.
+
+        Returns:
+          List of tuples with objects path and size in bytes.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        self._ensure(bucket, prefix)
+        lower, upper = _prefix_range(prefix)
+        return self._query(
+            "SELECT path, size FROM objects WHERE bucket = ? AND path >= ? AND path < ? "
+            "ORDER BY path LIMIT ?",
+            (bucket, lower, upper, -1 if max_objects is None else max_objects),
+        )
+
+    def glob(self, bucket: str, pattern: str) -> List[Tuple[str, int]]:
+        """Function to list objects in a bucket matching the glob pattern.
+
+        The wildcards match any characters including "/", e.g. "data/*.json".
+
+        Args:
+          bucket: Bucket name.
+          pattern: Glob pattern of the objects path.
+
+        Returns:
+          List of tuples with objects path and size in bytes.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        prefix = _glob_prefix(pattern)
+        self._ensure(bucket, prefix)
+        lower, upper = _prefix_range(prefix)
+        return self._query(
+            "SELECT path, size FROM objects WHERE bucket = ? AND path >= ? AND path < ? "
+            "AND path GLOB ? ORDER BY path",
+            (bucket, lower, upper, pattern),
+        )
+
+    def size(self, bucket: str, prefix: str = "") -> Tuple[int, int]:
+        """Function to aggregate the number and total size of objects.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix.
+
+        Returns:
+          Number of objects and their total size in bytes.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        self._ensure(bucket, prefix)
+        lower, upper = _prefix_range(prefix)
+        count, size = self._query(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects "
+            "WHERE bucket = ? AND path >= ? AND path < ?",
+            (bucket, lower, upper),
+        )[0]
+        return count, size
+
+    def close(self) -> None:
+        """Method to close the index."""
+        self.conn.close()
+
+    def _query(self, query: str, parameters: tuple) -> List[tuple]:
+        """Function to run the select query.
+
+        Args:
+          query: SQL statement.
+          parameters: Query parameters.
+
+        Returns:
+          Query results.
+        """
+        with self.lock:
+            return self.conn.execute(query, parameters).fetchall()
+
+    def _ensure(self, bucket: str, prefix: str) -> None:
+        """Function to make sure the prefix listing exists and is not older than ttl.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        with self.lock:
+            scan = self._scan(bucket, prefix)
+            if scan is None:
+                self._scan_full(bucket, prefix)
+                return
+
+            scan_prefix, scanned_at, last_path = scan
+            if time.time() - scanned_at <= self.ttl:
+                return
+            if self.append_only:
+                self._scan_incremental(bucket, scan_prefix, last_path)
+            else:
+                self._scan_full(bucket, scan_prefix)
+
+    def _scan(self, bucket: str, prefix: str) -> Optional[Tuple[str, float, str]]:
+        """Function to find the most recent listing covering the prefix.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix.
+
+        Returns:
+          Listing prefix, time and the last listed path.
+        """
+        for scan_prefix, scanned_at, last_path in self.conn.execute(
+            "SELECT prefix, scanned_at, last_path FROM scans WHERE bucket = ? "
+            "ORDER BY scanned_at DESC",
+            (bucket,),
+        ):
+            if prefix.startswith(scan_prefix):
+                return scan_prefix, scanned_at, last_path
+        return None
+
+    def _scan_full(self, bucket: str, prefix: str) -> int:
+        """Function to replace the prefix listing.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix.
+
+        Returns:
+          Number of listed objects.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        scanned_at = time.time()
+        lower, upper = _prefix_range(prefix)
+        self.conn.execute("BEGIN")
+        try:
+            self.conn.execute(
+                "DELETE FROM objects WHERE bucket = ? AND path >= ? AND path < ?",
+                (bucket, lower, upper),
+            )
+            # the listings of the sub-prefixes are replaced
+            self.conn.execute(
+                "DELETE FROM scans WHERE bucket = ? AND prefix >= ? AND prefix < ?",
+                (bucket, lower, upper),
+            )
+            count, last_path = self._insert(bucket, self.client.iter_objects_size(bucket, prefix))
+            self.conn.execute(
+                "INSERT INTO scans VALUES (?, ?, ?, ?)", (bucket, prefix, scanned_at, last_path)
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return count
+
+    def _scan_incremental(self, bucket: str, prefix: str, last_path: Optional[str]) -> int:
+        """Function to extend the prefix listing with the objects after the last listed path.
+
+        Args:
+          bucket: Bucket name.
+          prefix: Objects prefix.
+          last_path: Last listed path.
+
+        Returns:
+          Number of listed objects.
+
+        Raises:
+          exceptions.BucketNotFound: Raised when the bucket not found.
+        """
+        scanned_at = time.time()
+        self.conn.execute("BEGIN")
+        try:
+            count, last_path_new = self._insert(
+                bucket, self.client.iter_objects_size(bucket, prefix, start_after=last_path)
+            )
+            self.conn.execute(
+                "UPDATE scans SET scanned_at = ?, last_path = ? WHERE bucket = ? AND prefix = ?",
+                (scanned_at, last_path_new if last_path_new else last_path, bucket, prefix),
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return count
+
+    def _insert(self, bucket: str, objects: Iterator[Tuple[str, int]]) -> Tuple[int, str]:
+        """Function to insert the listed objects in batches.
+
+        Args:
+          bucket: Bucket name.
+          objects: Objects path and size in the listing order.
+
+        Returns:
+          Number of inserted objects and the last path.
+        """
+        count = 0
+        last_path = None
+        while True:
+            batch = [(bucket, path, size) for path, size in islice(objects, _INSERT_BATCH_SIZE)]
+            if not batch:
+                return count, last_path
+            self.conn.executemany("INSERT OR REPLACE INTO objects VALUES (?, ?, ?)", batch)
+            count += len(batch)
+            last_path = batch[-1][1]
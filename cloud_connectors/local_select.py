@@ -0,0 +1,1073 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+import re
+import csv
+import json
+from collections import namedtuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+FORMATS = ["CSV", "JSON"]
+
+INPUT_SERIALIZATION_DEFAULT = {
+    "CSV": {"FileHeaderInfo": "NONE", "FieldDelimiter": ",", "QuoteCharacter": '"',
+            "RecordDelimiter": "\n", "AllowQuotedRecordDelimiter": True},
+    "JSON": {"Type": "LINES"},
+}
+
+OUTPUT_SERIALIZATION_DEFAULT = {
+    "CSV": {"FieldDelimiter": ",", "QuoteCharacter": '"', "RecordDelimiter": "\n"},
+    "JSON": {"RecordDelimiter": "\n"},
+}
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+    (?P<string>'(?:[^']|'')*')
+    |(?P<quoted>"(?:[^"]|"")*")
+    |(?P<number>\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)
+    |(?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<op><=|>=|<>|!=|\|\||[=<>(),.*+\-/%\[\]])
+    )""",
+    re.VERBOSE,
+)
+
+_KEYWORDS = {
+    "SELECT", "FROM", "WHERE", "LIMIT", "AS", "AND", "OR", "NOT", "IS", "NULL", "LIKE",
+    "IN", "BETWEEN", "CAST", "TRUE", "FALSE", "MISSING",
+}
+
+_AGGREGATES = {"COUNT", "SUM", "AVG", "MIN", "MAX"}
+
+_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "LOWER": lambda v: None if v is None else str(v).lower(),
+    "UPPER": lambda v: None if v is None else str(v).upper(),
+    "TRIM": lambda v: None if v is None else str(v).strip(),
+    "CHAR_LENGTH": lambda v: None if v is None else len(str(v)),
+    "CHARACTER_LENGTH": lambda v: None if v is None else len(str(v)),
+    "COALESCE": lambda *v: next((i for i in v if i is not None), None),
+    "NULLIF": lambda a, b: None if a == b else a,
+}
+
+_CASTS: Dict[str, Callable[[Any], Any]] = {
+    "INT": lambda v: int(float(v)) if isinstance(v, str) else int(v),
+    "FLOAT": float,
+    "STRING": lambda v: json.dumps(v) if isinstance(v, bool) else str(v),
+    "BOOL": lambda v: v.strip().lower() in ["true", "1"] if isinstance(v, str) else bool(v),
+}
+_CASTS.update({
+    alias: _CASTS[cast] for alias, cast in [
+        ("INTEGER", "INT"), ("BIGINT", "INT"), ("SMALLINT", "INT"), ("DOUBLE", "FLOAT"),
+        ("REAL", "FLOAT"), ("DECIMAL", "FLOAT"), ("NUMERIC", "FLOAT"), ("VARCHAR", "STRING"),
+        ("CHAR", "STRING"), ("BOOLEAN", "BOOL"),
+    ]
+})
+
+_Token = namedtuple("token", ["kind", "value", "text"])
+
+# columns is None for "SELECT *", aggregates are the aggregate function and its argument
+_Query = namedtuple("query", ["columns", "where", "limit", "aggregates"])
+
+# the record is the fields list and the fields mapping
+_Record = Tuple[List[Any], Dict[str, Any]]
+
+# value of the columns absent from the record, unlike null values
+_MISSING = object()
+
+
+def _tokenize(sql: str) -> List[_Token]:
+    """Function to split the SQL expression into tokens.
+
+    Args:
+      sql: SQL expression.
+
+    Returns:
+      List of tokens ending with the "end" token.
+
+    Raises:
+      ValueError: Raised when the expression contains unknown characters.
+    """
+    tokens = []
+    position = 0
+    sql = sql.strip().rstrip(";")
+    while position < len(sql):
+        match = _TOKEN.match(sql, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Cannot parse SQL at position {position}: '{sql[position:]}'")
+        position = match.end()
+        kind = match.lastgroup
+        value = text = match.group(kind)
+        if kind == "string":
+            value = value[1:-1].replace("''", "'")
+        elif kind == "quoted":
+            kind, value = "name", value[1:-1].replace('""', '"')
+        elif kind == "number":
+            value = float(value) if any(i in value for i in ".eE") else int(value)
+        elif kind == "name" and value.upper() in _KEYWORDS:
+            kind, value = "keyword", value.upper()
+        tokens.append(_Token(kind, value, text))
+    tokens.append(_Token("end", None, ""))
+    return tokens
+
+
+def _number(value: Any) -> Optional[Union[int, float]]:
+    """Function to convert the value to a number.
+
+    Args:
+      value: Field value.
+
+    Returns:
+      Number, None if the value is not numeric.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return int(number) if number.is_integer() and "." not in str(value) else number
+
+
+def _compare(left: Any, right: Any, operator: str) -> Optional[bool]:
+    """Function to compare two values, strings are compared to numbers numerically.
+
+    Args:
+      left: Left operand.
+      right: Right operand.
+      operator: Comparison operator.
+
+    Returns:
+      Comparison result, None if either operand is null, or they are not comparable.
+    """
+    if left is None or right is None:
+        return None
+    if isinstance(left, str) != isinstance(right, str):
+        left, right = _number(left), _number(right)
+        if left is None or right is None:
+            return None
+    try:
+        if operator == "=":
+            return left == right
+        if operator in ["!=", "<>"]:
+            return left != right
+        if operator == "<":
+            return left < right
+        if operator == "<=":
+            return left <= right
+        if operator == ">":
+            return left > right
+        return left >= right
+    except TypeError:
+        return None
+
+
+def _arithmetic(left: Any, right: Any, operator: str) -> Any:
+    """Function to apply the arithmetic operator.
+
+    Args:
+      left: Left operand.
+      right: Right operand.
+      operator: Arithmetic, or concatenation operator.
+
+    Returns:
+      Result, None if either operand is null, or not numeric.
+    """
+    if left is None or right is None:
+        return None
+    if operator == "||":
+        return f"{left}{right}"
+    left, right = _number(left), _number(right)
+    if left is None or right is None:
+        return None
+    if operator == "+":
+        return left + right
+    if operator == "-":
+        return left - right
+    if operator == "*":
+        return left * right
+    if right == 0:
+        return None
+    return left / right if operator == "/" else left % right
+
+
+def _like(value: Any, pattern: Any) -> Optional[bool]:
+    """Function to match the value against the LIKE pattern.
+
+    Args:
+      value: Value.
+      pattern: Pattern with the "%" and "_" wildcards.
+
+    Returns:
+      True if the value matches, None if either operand is null.
+    """
+    if value is None or pattern is None:
+        return None
+    regex = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char) for char in str(pattern)
+    )
+    return re.fullmatch(regex, str(value), re.DOTALL) is not None
+
+
+class _Parser:
+    """Recursive descent parser of the S3 Select SQL subset.
+
+    The expressions are compiled into functions of the record.
+
+    Args:
+      sql: SQL expression.
+    """
+
+    __slots__ = ["tokens", "position", "alias", "aggregates"]
+
+    def __init__(self, sql: str) -> None:
+        self.tokens = _tokenize(sql)
+        self.position = 0
+        self.alias = None
+        self.aggregates = []
+
+    def _peek(self, kind: str, value: Any = None, offset: int = 0) -> bool:
+        """Function to check the kind and the value of the upcoming token.
+
+        Args:
+          kind: Token kind.
+          value: Token value, any if not set.
+          offset: Number of tokens to look ahead past the current one.
+
+        Returns:
+          True if the token matches.
+        """
+        token = self.tokens[min(self.position + offset, len(self.tokens) - 1)]
+        return token.kind == kind and (value is None or token.value == value)
+
+    def _peek_operator(self, operators: List[str]) -> bool:
+        """Function to check if the current token is one of the operators.
+
+        Args:
+          operators: Operators to match.
+
+        Returns:
+          True if the token matches.
+        """
+        token = self.tokens[self.position]
+        return token.kind == "op" and token.value in operators
+
+    def _next(self) -> _Token:
+        """Function to consume the current token, the "end" token is never passed.
+
+        Returns:
+          Consumed token.
+        """
+        token = self.tokens[self.position]
+        self.position = min(self.position + 1, len(self.tokens) - 1)
+        return token
+
+    def _accept(self, kind: str, value: Any = None) -> bool:
+        """Function to consume the current token if it matches.
+
+        Args:
+          kind: Token kind.
+          value: Token value, any if not set.
+
+        Returns:
+          True if the token is consumed.
+        """
+        if self._peek(kind, value):
+            self._next()
+            return True
+        return False
+
+    def _expect(self, kind: str, value: Any = None) -> _Token:
+        """Function to consume the current token which must match.
+
+        Args:
+          kind: Token kind.
+          value: Token value, any if not set.
+
+        Returns:
+          Consumed token.
+
+        Raises:
+          ValueError: Raised when the token doesn't match.
+        """
+        if not self._peek(kind, value):
+            raise ValueError(
+                f"Expected {value if value else kind}, got '{self.tokens[self.position].value}'."
+            )
+        return self._next()
+
+    def parse(self) -> _Query:
+        """Function to parse the SELECT statement.
+
+        Returns:
+          Parsed query.
+
+        Raises:
+          ValueError: Raised when the statement is not valid, or not supported.
+        """
+        self._expect("keyword", "SELECT")
+        # the FROM clause defines the alias used in the projection, so it's parsed first
+        start = self.position
+        depth = 0
+        while depth or not self._peek("keyword", "FROM"):
+            if self._peek("end"):
+                raise ValueError("Expected FROM.")
+            if self._peek_operator(["("]):
+                depth += 1
+            elif self._peek_operator([")"]):
+                depth -= 1
+            self._next()
+        self._parse_from()
+
+        where = None
+        if self._accept("keyword", "WHERE"):
+            where = self._parse_expression()
+            if self.aggregates:
+                raise ValueError("Aggregates are not supported in WHERE.")
+        limit = self._expect("number").value if self._accept("keyword", "LIMIT") else None
+        self._expect("end")
+        end = self.position
+
+        self.position = start
+        columns = self._parse_columns()
+        self.position = end
+        return _Query(columns, where, limit, self.aggregates)
+
+    def _parse_from(self) -> None:
+        """Function to parse the FROM clause and the source alias.
+
+        Raises:
+          ValueError: Raised when the source is not S3Object.
+        """
+        self._expect("keyword", "FROM")
+        if self._expect("name").value.upper() != "S3OBJECT":
+            raise ValueError("Unknown source, only S3Object is supported.")
+        if self._accept("op", "["):
+            self._expect("op", "*")
+            self._expect("op", "]")
+        if self._accept("keyword", "AS") or self._peek("name"):
+            self.alias = self._expect("name").value.lower()
+
+    def _parse_columns(self) -> Optional[List[Tuple[str, Optional[int], Callable]]]:
+        """Function to parse the projection.
+
+        Returns:
+          List of the column name, aggregate index and value function, None for "*".
+
+        Raises:
+          ValueError: Raised when the projection is not valid.
+        """
+        if self._accept("op", "*"):
+            self._expect("keyword", "FROM")
+            return None
+
+        columns = []
+        while True:
+            start, aggregates = self.position, len(self.aggregates)
+            value = self._parse_expression()
+            tokens = self.tokens[start:self.position]
+
+            aggregate = None
+            if len(self.aggregates) > aggregates:
+                if len(self.aggregates) - aggregates > 1 or tokens[-1].value != ")" \
+                        or str(tokens[0].value).upper() not in _AGGREGATES:
+                    raise ValueError("Aggregates cannot be used in expressions.")
+                aggregate = aggregates
+
+            name = f"_{len(columns) + 1}"
+            if all(token.kind == "name" or token.value == "." for token in tokens):
+                name = tokens[-1].value
+            if self._accept("keyword", "AS") or self._peek("name"):
+                name = self._expect("name").value
+            columns.append((name, aggregate, value))
+            if not self._accept("op", ","):
+                break
+
+        if self.aggregates and any(column[1] is None for column in columns):
+            raise ValueError("Aggregate and non-aggregate columns cannot be mixed.")
+        self._expect("keyword", "FROM")
+        return columns
+
+    def _parse_path(self) -> List[str]:
+        """Function to parse the column reference without the source alias.
+
+        Returns:
+          Column name, or the nested JSON path.
+        """
+        path = [self._expect("name").value]
+        while self._accept("op", "."):
+            # keywords are valid nested names, e.g. s.limit
+            if self._peek("keyword"):
+                path.append(self._next().text)
+            else:
+                path.append(self._expect("name").value)
+        if len(path) > 1 and self.alias is not None and path[0].lower() == self.alias:
+            path = path[1:]
+        return path
+
+    def _parse_expression(self) -> Callable[[_Record], Any]:
+        """Function to parse the OR expression, the lowest precedence level.
+
+        Returns:
+          Function of the record returning the expression value.
+        """
+        left = self._parse_and()
+        while self._accept("keyword", "OR"):
+            right = self._parse_and()
+            left = _combine(_or, left, right)
+        return left
+
+    def _parse_and(self) -> Callable[[_Record], Any]:
+        """Function to parse the AND expression.
+
+        Returns:
+          Function of the record returning the expression value.
+        """
+        left = self._parse_not()
+        while self._accept("keyword", "AND"):
+            right = self._parse_not()
+            left = _combine(_and, left, right)
+        return left
+
+    def _parse_not(self) -> Callable[[_Record], Any]:
+        """Function to parse the NOT expression.
+
+        Returns:
+          Function of the record returning the expression value.
+        """
+        if self._accept("keyword", "NOT"):
+            value = self._parse_not()
+            return lambda r: _negate(value(r), True)
+        return self._parse_predicate()
+
+    def _parse_predicate(self) -> Callable[[_Record], Any]:
+        """Function to parse the comparison, IS, LIKE, IN, or BETWEEN predicate.
+
+        Returns:
+          Function of the record returning the predicate value.
+
+        Raises:
+          ValueError: Raised when NOT is not followed by LIKE, IN, or BETWEEN.
+        """
+        left = self._parse_additive()
+
+        if self._peek_operator(["=", "!=", "<>", "<", "<=", ">", ">="]):
+            operator = self._next().value
+            right = self._parse_additive()
+            return lambda r: _compare(left(r), right(r), operator)
+
+        if self._accept("keyword", "IS"):
+            negate = self._accept("keyword", "NOT")
+            if self._accept("keyword", "MISSING"):
+                # null column values are not missing, the other expressions are missing if null
+                if isinstance(left, _Column):
+                    return lambda r: (left.get(r) is _MISSING) != negate
+                return lambda r: (left(r) is None) != negate
+            # the missing columns are null too
+            self._expect("keyword", "NULL")
+            return lambda r: (left(r) is None) != negate
+
+        negate = self._accept("keyword", "NOT")
+        if self._accept("keyword", "LIKE"):
+            pattern = self._parse_additive()
+            return lambda r: _negate(_like(left(r), pattern(r)), negate)
+
+        if self._accept("keyword", "IN"):
+            self._expect("op", "(")
+            values = [self._parse_additive()]
+            while self._accept("op", ","):
+                values.append(self._parse_additive())
+            self._expect("op", ")")
+            return lambda r: _negate(
+                _any([_compare(left(r), value(r), "=") for value in values]), negate
+            )
+
+        if self._accept("keyword", "BETWEEN"):
+            lower = self._parse_additive()
+            self._expect("keyword", "AND")
+            upper = self._parse_additive()
+            return lambda r: _negate(
+                _and(_compare(left(r), lower(r), ">="), _compare(left(r), upper(r), "<=")),
+                negate,
+            )
+
+        if negate:
+            raise ValueError("Expected LIKE, IN, or BETWEEN after NOT.")
+        return left
+
+    def _parse_additive(self) -> Callable[[_Record], Any]:
+        """Function to parse the addition, subtraction, or concatenation.
+
+        Returns:
+          Function of the record returning the expression value.
+        """
+        left = self._parse_multiplicative()
+        while self._peek_operator(["+", "-", "||"]):
+            operator = self._next().value
+            right = self._parse_multiplicative()
+            left = _combine(_arithmetic, left, right, operator)
+        return left
+
+    def _parse_multiplicative(self) -> Callable[[_Record], Any]:
+        """Function to parse the multiplication, division, or modulo.
+
+        Returns:
+          Function of the record returning the expression value.
+        """
+        left = self._parse_unary()
+        while self._peek_operator(["*", "/", "%"]):
+            operator = self._next().value
+            right = self._parse_unary()
+            left = _combine(_arithmetic, left, right, operator)
+        return left
+
+    def _parse_unary(self) -> Callable[[_Record], Any]:
+        """Function to parse the unary minus.
+
+        Returns:
+          Function of the record returning the expression value.
+        """
+        if self._accept("op", "-"):
+            value = self._parse_unary()
+            return lambda r: _arithmetic(0, value(r), "-")
+        return self._parse_primary()
+
+    def _parse_primary(self) -> Callable[[_Record], Any]:
+        """Function to parse the literal, column, function call, CAST, or parenthesized expression.
+
+        Returns:
+          Function of the record returning the expression value.
+
+        Raises:
+          ValueError: Raised when the expression is not valid, or not supported.
+        """
+        token = self.tokens[self.position]
+
+        if token.kind in ["string", "number"]:
+            self._next()
+            return lambda r: token.value
+
+        if token.kind == "keyword" and token.value in ["TRUE", "FALSE", "NULL", "MISSING"]:
+            self._next()
+            value = {"TRUE": True, "FALSE": False}.get(token.value)
+            return lambda r: value
+
+        if self._accept("op", "("):
+            value = self._parse_expression()
+            self._expect("op", ")")
+            return value
+
+        if self._accept("keyword", "CAST"):
+            self._expect("op", "(")
+            value = self._parse_expression()
+            self._expect("keyword", "AS")
+            type_name = self._expect("name").value.upper()
+            if type_name not in _CASTS:
+                raise ValueError(f"Unsupported CAST type '{type_name}'.")
+            self._expect("op", ")")
+            return lambda r: _cast(value(r), type_name)
+
+        if token.kind == "name" and self._peek("op", "(", 1):
+            name = token.value.upper()
+            self._next()
+            self._next()
+            if name in _AGGREGATES:
+                return self._parse_aggregate(name)
+            if name not in _FUNCTIONS:
+                raise ValueError(f"Unsupported function '{name}'.")
+            args = []
+            if not self._peek("op", ")"):
+                args.append(self._parse_expression())
+                while self._accept("op", ","):
+                    args.append(self._parse_expression())
+            self._expect("op", ")")
+            function = _FUNCTIONS[name]
+            return lambda r: function(*(arg(r) for arg in args))
+
+        if token.kind == "name":
+            return _Column(self._parse_path())
+
+        if token.kind == "end":
+            raise ValueError("Unexpected end of the SQL expression.")
+        raise ValueError(f"Unexpected '{token.text}'.")
+
+    def _parse_aggregate(self, name: str) -> Callable[[_Record], Any]:
+        """Function to parse the aggregate function argument.
+
+        Args:
+          name: Aggregate function.
+
+        Returns:
+          Function of the record returning None, the aggregate is collected separately.
+        """
+        value = None if name == "COUNT" and self._accept("op", "*") else self._parse_expression()
+        self._expect("op", ")")
+        self.aggregates.append((name, value))
+        # aggregates are computed over all records, the value is not used per record
+        return lambda r: None
+
+
+def _combine(
+    function: Callable[..., Any],
+    left: Callable[[_Record], Any],
+    right: Callable[[_Record], Any],
+    *args: Any,
+) -> Callable[[_Record], Any]:
+    """Function to compile the binary operation of two expressions.
+
+    Args:
+      function: Operation applied to the operands values.
+      left: Function of the record returning the left operand.
+      right: Function of the record returning the right operand.
+      args: Extra operation arguments, e.g. the operator.
+
+    Returns:
+      Function of the record returning the operation result.
+    """
+    return lambda r: function(left(r), right(r), *args)
+
+
+def _negate(value: Optional[bool], negate: bool) -> Optional[bool]:
+    """Function to negate the three-valued logic value.
+
+    Args:
+      value: Value.
+      negate: Negate the value.
+
+    Returns:
+      Negated value if negate is set, None for null.
+    """
+    return None if value is None else bool(value) != negate
+
+
+def _and(left: Any, right: Any) -> Optional[bool]:
+    """Function to apply AND with the three-valued logic.
+
+    Args:
+      left: Left operand.
+      right: Right operand.
+
+    Returns:
+      False if either operand is false, None if either is null, True otherwise.
+    """
+    if (left is not None and not left) or (right is not None and not right):
+        return False
+    return None if left is None or right is None else True
+
+
+def _or(left: Any, right: Any) -> Optional[bool]:
+    """Function to apply OR with the three-valued logic.
+
+    Args:
+      left: Left operand.
+      right: Right operand.
+
+    Returns:
+      True if either operand is true, None if either is null, False otherwise.
+    """
+    if left or right:
+        return True
+    return None if left is None or right is None else False
+
+
+def _any(values: List[Optional[bool]]) -> Optional[bool]:
+    """Function to apply OR over the values with the three-valued logic.
+
+    Args:
+      values: Values.
+
+    Returns:
+      True if any value is true, None if any is null, False otherwise.
+    """
+    if any(values):
+        return True
+    return None if None in values else False
+
+
+def _cast(value: Any, type_name: str) -> Any:
+    """Function to cast the value.
+
+    Args:
+      value: Value.
+      type_name: Target type.
+
+    Returns:
+      Casted value, None for null.
+
+    Raises:
+      ValueError: Raised when the value cannot be casted.
+    """
+    if value is None:
+        return None
+    try:
+        return _CASTS[type_name](value)
+    except (TypeError, ValueError) as ex:
+        raise ValueError(f"Cannot cast '{value}' as {type_name}.") from ex
+
+
+class _Column:
+    """Column reference, the missing columns evaluate to null.
+
+    Args:
+      path: Column name, or the nested JSON path. "_N" refers to the N-th CSV field.
+    """
+
+    __slots__ = ["head", "tail", "position", "head_lower"]
+
+    def __init__(self, path: List[str]) -> None:
+        self.head, self.tail = path[0], path[1:]
+        self.position = int(self.head[1:]) - 1 if re.fullmatch(r"_\d+", self.head) else None
+        self.head_lower = self.head.lower()
+
+    def __call__(self, record: _Record) -> Any:
+        value = self.get(record)
+        return None if value is _MISSING else value
+
+    def get(self, record: _Record) -> Any:
+        """Function to get the column value.
+
+        Args:
+          record: CSV fields and the JSON, or CSV header mapping.
+
+        Returns:
+          Column value, _MISSING if the record has no such column.
+        """
+        fields, mapping = record
+        if self.head in mapping:
+            value = mapping[self.head]
+        elif self.position is not None and self.position < len(fields):
+            value = fields[self.position]
+        else:
+            value = next(
+                (v for k, v in mapping.items() if k.lower() == self.head_lower), _MISSING
+            )
+        for key in self.tail:
+            if not isinstance(value, dict):
+                return _MISSING
+            value = value.get(key, _MISSING)
+        return value
+
+
+class _Aggregate:
+    """Running aggregate of the expression values, null values are skipped.
+
+    Args:
+      name: Aggregate function, COUNT, SUM, AVG, MIN, or MAX.
+    """
+
+    __slots__ = ["name", "count", "total", "numbers", "extreme"]
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.count = 0
+        self.total = 0
+        self.numbers = 0
+        self.extreme = None
+
+    def add(self, value: Any) -> None:
+        """Function to add the value to the aggregate.
+
+        Args:
+          value: Expression value.
+        """
+        if value is None:
+            return
+        self.count += 1
+        number = _number(value)
+        if number is not None:
+            self.total += number
+            self.numbers += 1
+            value = number
+        if self.extreme is None:
+            self.extreme = value
+            return
+        try:
+            if (value < self.extreme) if self.name == "MIN" else (value > self.extreme):
+                self.extreme = value
+        except TypeError:
+            pass
+
+    def result(self) -> Any:
+        """Function to get the aggregate value.
+
+        Returns:
+          Aggregate value, None if there are no values to aggregate.
+        """
+        if self.name == "COUNT":
+            return self.count
+        if self.name in ["SUM", "AVG"]:
+            if not self.numbers:
+                return None
+            return self.total if self.name == "SUM" else self.total / self.numbers
+        return self.extreme
+
+
+def split_records(
+    chunks: Iterable[bytes],
+    delimiter: bytes = b"\n",
+    keep_delimiter: bool = False,
+    quote: bytes = None,
+) -> Iterator[bytes]:
+    """Function to split the stream into records.
+
+    Args:
+      chunks: Iterator of bytes chunks.
+      delimiter: Records delimiter.
+      keep_delimiter: End the records with the delimiter.
+      quote: Quote character, the delimiters between the quotes don't split the records,
+        e.g. the CSV fields spanning multiple lines. The quotes are not tracked if not set.
+
+    Returns:
+      Iterator over the records, empty records are skipped.
+    """
+    suffix = delimiter if keep_delimiter else b""
+    buffer = b""
+    if quote is None:
+        for chunk in chunks:
+            buffer += chunk
+            records = buffer.split(delimiter)
+            buffer = records.pop()
+            for record in records:
+                if record.strip():
+                    yield record + suffix
+        if buffer.strip():
+            yield buffer + suffix
+        return
+
+    # the escaped quote is doubled, so the quotes parity defines if the delimiter is quoted
+    quoted = False
+    position = 0
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while True:
+            end = buffer.find(delimiter, position)
+            if end < 0:
+                break
+            quoted ^= buffer.count(quote, position, end) % 2 == 1
+            position = end + len(delimiter)
+            if not quoted:
+                record = buffer[start:end]
+                start = position
+                if record.strip():
+                    yield record + suffix
+        buffer = buffer[start:]
+        position -= start
+    if buffer.strip():
+        yield buffer + suffix
+
+
+def _iter_records(
+    chunks: Iterable[bytes], input_format: str, serialization: dict
+) -> Iterator[_Record]:
+    """Function to parse the input records.
+
+    Args:
+      chunks: Iterator of bytes chunks.
+      input_format: "CSV", or "JSON".
+      serialization: Input serialization parameters.
+
+    Returns:
+      Iterator over the records.
+
+    Raises:
+      ValueError: Raised when the input cannot be parsed.
+    """
+    if input_format == "JSON":
+        json_type = serialization.get("Type", "LINES").upper()
+        if json_type == "LINES":
+            lines = (line.decode("utf-8") for line in split_records(chunks, b"\n"))
+        elif json_type == "DOCUMENT":
+            lines = [b"".join(chunks).decode("utf-8")]
+        else:
+            raise ValueError(f"Unknown JSON type '{json_type}'.")
+
+        decoder = json.JSONDecoder()
+        for line in lines:
+            position = 0
+            while True:
+                while position < len(line) and line[position].isspace():
+                    position += 1
+                if position == len(line):
+                    break
+                value, position = decoder.raw_decode(line, position)
+                for item in value if isinstance(value, list) else [value]:
+                    yield [], item if isinstance(item, dict) else {"_1": item}
+        return
+
+    header_info = serialization.get("FileHeaderInfo", "NONE").upper()
+    comments = serialization.get("Comments")
+    quote = serialization.get("QuoteCharacter", '"')
+    reader = csv.reader(
+        (
+            line.decode("utf-8") for line in split_records(
+                chunks,
+                serialization.get("RecordDelimiter", "\n").encode("utf-8"),
+                quote=quote.encode("utf-8")
+                if serialization.get("AllowQuotedRecordDelimiter") else None,
+            )
+            if not comments or not line.decode("utf-8").startswith(comments)
+        ),
+        delimiter=serialization.get("FieldDelimiter", ","),
+        quotechar=quote,
+    )
+
+    header = None
+    if header_info in ["USE", "IGNORE"]:
+        header = next(reader, None)
+        if header_info == "IGNORE":
+            header = None
+    for fields in reader:
+        fields = [field.rstrip("\r") for field in fields]
+        yield fields, dict(zip(header, fields)) if header else {}
+
+
+def _serialize(
+    columns: List[Tuple[str, Any]], output_format: str, serialization: dict
+) -> bytes:
+    """Function to serialize the output record.
+
+    Args:
+      columns: Columns name and value.
+      output_format: "CSV", or "JSON".
+      serialization: Output serialization parameters.
+
+    Returns:
+      Serialized record with the records delimiter.
+    """
+    delimiter = serialization.get("RecordDelimiter", "\n")
+    if output_format == "JSON":
+        return (json.dumps(dict(columns), separators=(",", ":")) + delimiter).encode("utf-8")
+
+    quote = serialization.get("QuoteCharacter", '"')
+    field_delimiter = serialization.get("FieldDelimiter", ",")
+    fields = []
+    for _, value in columns:
+        if value is None:
+            value = ""
+        elif isinstance(value, (dict, list, bool)):
+            value = json.dumps(value)
+        else:
+            value = str(value)
+        if field_delimiter in value or quote in value or "\n" in value or delimiter in value:
+            value = quote + value.replace(quote, quote * 2) + quote
+        fields.append(value)
+    return (field_delimiter.join(fields) + delimiter).encode("utf-8")
+
+
+def _record_columns(record: _Record) -> List[Tuple[str, Any]]:
+    """Function to list all columns of the record for "SELECT *".
+
+    Args:
+      record: Input record.
+
+    Returns:
+      Columns name and value.
+    """
+    fields, mapping = record
+    if mapping:
+        return list(mapping.items())
+    return [(f"_{position}", field) for position, field in enumerate(fields, 1)]
+
+
+def select(
+    chunks: Iterable[bytes],
+    sql: str,
+    input_format: str = "JSON",
+    output_format: str = "JSON",
+    input_serialization: dict = None,
+    output_serialization: dict = None,
+) -> Iterator[bytes]:
+    """Function to filter the CSV, or JSON records with the S3 Select SQL expression locally.
+
+    The records are parsed, filtered and serialized one by one as the chunks stream in.
+    The supported SQL subset:
+      SELECT *, columns, expressions, or aggregates (COUNT, SUM, AVG, MIN, MAX)
+      FROM S3Object[*] with an optional alias,
+      WHERE with comparisons, AND, OR, NOT, IS [NOT] NULL, LIKE, IN, BETWEEN,
+      arithmetic, CAST and the LOWER, UPPER, TRIM, CHAR_LENGTH, COALESCE, NULLIF functions,
+      LIMIT.
+    CSV fields are strings, they are compared to numbers numerically.
+    The quoted CSV fields can span multiple records delimiters, unless
+    AllowQuotedRecordDelimiter is set to False, then every delimiter ends the record like
+    in S3 Select.
+
+    Args:
+      chunks: Iterator of the object bytes chunks.
+      sql: SQL expression.
+      input_format: Input format, "CSV", or "JSON".
+      output_format: Output format, "CSV", or "JSON".
+      input_serialization: Input format parameters, see S3 SelectObjectContent InputSerialization,
+        e.g. {"FileHeaderInfo": "USE"} for CSV, or {"Type": "LINES"} for JSON.
+      output_serialization: Output format parameters,
+        see S3 SelectObjectContent OutputSerialization.
+
+    Returns:
+      Iterator over the matching records, each ends with the output records delimiter.
+
+    Raises:
+      ValueError: Raised when unknown format provided, the SQL expression is not valid,
+        or not supported.
+    """
+    for data_format in [input_format, output_format]:
+        if data_format not in FORMATS:
+            raise ValueError(f"Unknown format '{data_format}', supported: {', '.join(FORMATS)}.")
+
+    query = _Parser(sql).parse()
+    input_serialization = {
+        **INPUT_SERIALIZATION_DEFAULT[input_format], **(input_serialization or {})
+    }
+    output_serialization = {
+        **OUTPUT_SERIALIZATION_DEFAULT[output_format], **(output_serialization or {})
+    }
+    return _select(
+        _iter_records(chunks, input_format, input_serialization),
+        query,
+        output_format,
+        output_serialization,
+    )
+
+
+def _select(
+    records: Iterator[_Record], query: _Query, output_format: str, serialization: dict
+) -> Iterator[bytes]:
+    """Function to filter and serialize the records.
+
+    Args:
+      records: Input records.
+      query: Parsed query.
+      output_format: "CSV", or "JSON".
+      serialization: Output serialization parameters.
+
+    Returns:
+      Iterator over the serialized records.
+    """
+    if query.limit is not None and query.limit <= 0:
+        return
+
+    if query.where is not None:
+        records = (record for record in records if query.where(record))
+
+    if query.aggregates:
+        aggregates = [_Aggregate(name) for name, _ in query.aggregates]
+        for record in records:
+            for aggregate, (_, value) in zip(aggregates, query.aggregates):
+                aggregate.add(1 if value is None else value(record))
+        yield _serialize(
+            [(name, aggregates[index].result()) for name, index, _ in query.columns],
+            output_format,
+            serialization,
+        )
+        return
+
+    count = 0
+    for record in records:
+        if query.columns is None:
+            columns = _record_columns(record)
+        else:
+            columns = [(name, value(record)) for name, _, value in query.columns]
+        yield _serialize(columns, output_format, serialization)
+        count += 1
+        if query.limit is not None and count >= query.limit:
+            return
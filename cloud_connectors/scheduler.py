@@ -0,0 +1,320 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+import time
+from collections import OrderedDict, deque
+from threading import Event, Lock, get_ident
+from typing import Dict, Hashable, NamedTuple, Optional
+
+
+PRIORITIES = ["interactive", "bulk"]
+
+
+class _Request:
+    """Pending request of a connection and bytes."""
+
+    __slots__ = ["connections", "size", "priority", "caller", "granted", "created"]
+
+    def __init__(self, connections: int, size: int, priority: str, caller: Hashable) -> None:
+        self.connections = connections
+        self.size = size
+        self.priority = priority
+        self.caller = caller
+        self.granted = Event()
+        self.created = time.perf_counter()
+
+
+class TransferScheduler:
+    """Scheduler capping the bytes and the connections in flight across the transfers.
+
+    The scheduler is shared by the clients, every transfer holds a slot with one connection
+    and its size in bytes while the data is sent, or received.
+
+    The requests of the interactive priority class are granted before the bulk ones,
+    and the bulk transfers hold at most the bulk share of the budget, so an interactive
+    transfer doesn't wait for the bulk ones to finish.
+    The callers of the same priority class take turns, so a caller with many pending
+    transfers doesn't delay the others. The requests which don't fit the budget block
+    the ones queued after them, so large transfers are not starved by small ones.
+    The bytes reserved for the slots holding a connection already are granted first.
+
+    Args:
+      max_bytes: Max number of bytes in flight. A larger transfer is granted alone.
+      max_connections: Max number of transfers in flight.
+      bulk_share: Max share of the bytes and the connections the bulk transfers can hold.
+
+    Raises:
+      ValueError: Raised when the limits are not positive, or the bulk share is not in (0, 1].
+    """
+
+    STATS_TUPLE = NamedTuple(
+        "scheduler_stats",
+        [
+            ("in_flight_bytes", int),
+            ("in_flight_connections", int),
+            ("queue_depth", Dict[str, int]),
+            ("granted", Dict[str, int]),
+            ("wait_time", Dict[str, float]),
+            ("wait_time_max", Dict[str, float]),
+        ],
+    )
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_connections: int = 64,
+        bulk_share: float = 0.75,
+    ) -> None:
+        if max_bytes < 1 or max_connections < 1:
+            raise ValueError("The bytes and the connections limits must be positive.")
+        if not 0 < bulk_share <= 1:
+            raise ValueError("The bulk share must be in (0, 1].")
+
+        self.max_bytes = max_bytes
+        self.max_connections = max_connections
+        self.limits = {
+            "interactive": (max_bytes, max_connections),
+            "bulk": (
+                max(1, int(max_bytes * bulk_share)), max(1, int(max_connections * bulk_share))
+            ),
+        }
+        self.in_flight_bytes = 0
+        self.in_flight_connections = 0
+        self.in_flight = {priority: [0, 0] for priority in PRIORITIES}
+        # the requests per caller in the turns order, per priority class
+        self.reserving = {priority: OrderedDict() for priority in PRIORITIES}
+        self.pending = {priority: OrderedDict() for priority in PRIORITIES}
+        self.granted = dict.fromkeys(PRIORITIES, 0)
+        self.wait_time = dict.fromkeys(PRIORITIES, 0.)
+        self.wait_time_max = dict.fromkeys(PRIORITIES, 0.)
+        self.lock = Lock()
+
+    def slot(
+        self, size: int = 0, priority: str = "interactive", caller: Hashable = None
+    ) -> "TransferSlot":
+        """Function to get the slot for a transfer.
+
+        Args:
+          size: Number of bytes to transfer, 0 if not known before the request.
+          priority: Priority class, "interactive", or "bulk".
+          caller: Caller to queue the request for, the current thread if not set.
+
+        Returns:
+          Slot to enter before the transfer.
+        """
+        return TransferSlot(self, size=size, priority=priority, caller=caller)
+
+    def acquire(
+        self,
+        size: int,
+        connections: int = 1,
+        priority: str = "interactive",
+        caller: Hashable = None,
+        timeout: float = None,
+    ) -> int:
+        """Function to wait until the bytes and the connections are granted.
+
+        Args:
+          size: Number of bytes to transfer, capped to max_bytes.
+          connections: Number of connections, 0 to add bytes to a granted connection.
+          priority: Priority class, "interactive", or "bulk".
+          caller: Caller to queue the request for, the current thread if not set.
+          timeout: Max time to wait in seconds, no limit if not set.
+
+        Returns:
+          Granted number of bytes to release.
+
+        Raises:
+          ValueError: Raised when unknown priority class provided.
+          TimeoutError: Raised when the request is not granted within the timeout.
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}', use one of {PRIORITIES}.")
+
+        request = _Request(
+            connections=connections,
+            size=min(max(size, 0), self.limits[priority][0]),
+            priority=priority,
+            caller=caller if caller is not None else get_ident(),
+        )
+        queues = self.pending if connections else self.reserving
+        with self.lock:
+            queues[priority].setdefault(request.caller, deque()).append(request)
+            self._dispatch()
+
+        if not request.granted.wait(timeout):
+            with self.lock:
+                if not request.granted.is_set():
+                    requests = queues[priority][request.caller]
+                    requests.remove(request)
+                    if not requests:
+                        del queues[priority][request.caller]
+                    # the request could block the ones queued after it
+                    self._dispatch()
+                    raise TimeoutError(f"Transfer of {size} bytes not scheduled in {timeout}s.")
+        return request.size
+
+    def release(self, size: int, connections: int = 1, priority: str = "interactive") -> None:
+        """Function to return the granted bytes and connections.
+
+        Args:
+          size: Number of granted bytes.
+          connections: Number of granted connections.
+          priority: Priority class of the grant.
+        """
+        with self.lock:
+            self.in_flight_bytes -= size
+            self.in_flight_connections -= connections
+            self.in_flight[priority][0] -= size
+            self.in_flight[priority][1] -= connections
+            self._dispatch()
+
+    def stats(self) -> STATS_TUPLE:
+        """Function to get the scheduler counters.
+
+        Returns:
+          Bytes and connections in flight; number of queued requests, number of granted
+            requests, their total and max wait time in seconds per priority class.
+        """
+        with self.lock:
+            return TransferScheduler.STATS_TUPLE(
+                in_flight_bytes=self.in_flight_bytes,
+                in_flight_connections=self.in_flight_connections,
+                queue_depth={
+                    priority: sum(
+                        len(requests)
+                        for queues in (self.reserving, self.pending)
+                        for requests in queues[priority].values()
+                    )
+                    for priority in PRIORITIES
+                },
+                granted=dict(self.granted),
+                wait_time=dict(self.wait_time),
+                wait_time_max=dict(self.wait_time_max),
+            )
+
+    def _dispatch(self) -> None:
+        """Function to grant the queued requests in turns while they fit the budget.
+
+        Must be called with the lock held.
+        """
+        # the lower priority classes wait while a higher one is blocked
+        priorities = PRIORITIES
+        # slots waiting for bytes hold connections, they go first not to deadlock the new ones
+        for queues in (self.reserving, self.pending):
+            for index, priority in enumerate(priorities):
+                callers = queues[priority]
+                while callers:
+                    caller, requests = next(iter(callers.items()))
+                    request = requests[0]
+                    if not self._fits(request):
+                        break
+                    requests.popleft()
+                    if requests:
+                        callers.move_to_end(caller)
+                    else:
+                        del callers[caller]
+                    self._grant(request)
+                if callers:
+                    priorities = priorities[:index + 1]
+                    break
+
+    def _fits(self, request: _Request) -> bool:
+        """Function to check if the request fits the budget.
+
+        Args:
+          request: Queued request.
+
+        Returns:
+          True if the request can be granted.
+        """
+        if self.in_flight_connections + request.connections > self.max_connections:
+            return False
+        if self.in_flight_bytes + request.size > self.max_bytes:
+            return False
+        max_bytes, max_connections = self.limits[request.priority]
+        in_flight_bytes, in_flight_connections = self.in_flight[request.priority]
+        return in_flight_connections + request.connections <= max_connections \
+            and in_flight_bytes + request.size <= max_bytes
+
+    def _grant(self, request: _Request) -> None:
+        """Function to grant the request.
+
+        Args:
+          request: Queued request.
+        """
+        self.in_flight_bytes += request.size
+        self.in_flight_connections += request.connections
+        self.in_flight[request.priority][0] += request.size
+        self.in_flight[request.priority][1] += request.connections
+        wait_time = time.perf_counter() - request.created
+        self.granted[request.priority] += 1
+        self.wait_time[request.priority] += wait_time
+        self.wait_time_max[request.priority] = max(
+            self.wait_time_max[request.priority], wait_time
+        )
+        request.granted.set()
+
+
+class TransferSlot:
+    """Connection and bytes granted by the scheduler for a single transfer.
+
+    The slot is the context manager holding the grant while the data is transferred.
+
+    Args:
+      scheduler: Transfer scheduler, the slot doesn't limit anything if not set.
+      size: Number of bytes to transfer, 0 if not known before the request.
+      priority: Priority class, "interactive", or "bulk".
+      caller: Caller to queue the request for, the current thread if not set.
+    """
+
+    def __init__(
+        self,
+        scheduler: Optional[TransferScheduler],
+        size: int = 0,
+        priority: str = "interactive",
+        caller: Hashable = None,
+    ) -> None:
+        self.scheduler = scheduler
+        self.size = size
+        self.priority = priority
+        self.caller = caller if caller is not None else get_ident()
+        self.acquired = False
+
+    def __enter__(self) -> "TransferSlot":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+    def acquire(self) -> None:
+        """Function to wait until the connection and the bytes are granted."""
+        if self.scheduler is not None:
+            self.size = self.scheduler.acquire(
+                self.size, priority=self.priority, caller=self.caller
+            )
+            self.acquired = True
+
+    def reserve(self, size: int) -> None:
+        """Function to reserve the bytes once the transfer size is known, e.g. from the response.
+
+        Args:
+          size: Number of bytes to transfer.
+
+        Raises:
+          RuntimeError: Raised when the slot holds bytes already.
+        """
+        if not self.acquired:
+            return
+        if self.size:
+            raise RuntimeError("The slot bytes are reserved already.")
+        self.size = self.scheduler.acquire(
+            size, connections=0, priority=self.priority, caller=self.caller
+        )
+
+    def release(self) -> None:
+        """Function to return the grant to the scheduler, the repeated calls are ignored."""
+        if self.acquired:
+            self.acquired = False
+            self.scheduler.release(self.size, priority=self.priority)
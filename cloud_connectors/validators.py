@@ -0,0 +1,51 @@
+# Dmitry Kisler © 2020-present
+# www.dkisler.com
+
+from typing import Any, Callable, Dict, Tuple
+from threading import Lock
+from cloud_connectors.lazy import lazy_import
+
+fastjsonschema = lazy_import("fastjsonschema")
+
+
+_VALIDATORS: Dict[int, Tuple[dict, Callable[[Any], Any]]] = {}
+_LOCK = Lock()
+
+
+def get_validator(schema: dict) -> Callable[[Any], Any]:
+    """Function to get the compiled validator for a schema.
+
+    The schema is compiled on the first call and the validator is reused afterwards.
+    Schemas are expected to be module, or class level constants which are not mutated.
+
+    Args:
+      schema: JSON schema definition.
+
+    Returns:
+      Validation function.
+    """
+    entry = _VALIDATORS.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        with _LOCK:
+            entry = _VALIDATORS.get(id(schema))
+            if entry is None or entry[0] is not schema:
+                # the schema reference is kept to pin its id
+                entry = (schema, fastjsonschema.compile(schema))
+                _VALIDATORS[id(schema)] = entry
+    return entry[1]
+
+
+def validate(schema: dict, data: Any) -> Any:
+    """Function to validate data against a schema using the compiled validator.
+
+    Args:
+      schema: JSON schema definition.
+      data: Data to validate.
+
+    Returns:
+      Validated data with the default values filled in.
+
+    Raises:
+      fastjsonschema.JsonSchemaException: Raised when data is not valid.
+    """
+    return get_validator(schema)(data)
@@ -28,7 +28,8 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    packages=find_namespace_packages(where='.', exclude=('tests',)),
+    packages=find_namespace_packages(where='.', exclude=('tests', 'benchmarks')),
     install_requires=requirements,
+    extras_require={"async": ["aiobotocore==1.1.0"], "zstd": ["zstandard>=0.15.0"]},
     include_package_data=True,
 )
@@ -0,0 +1,85 @@
+# pylint: disable=missing-function-docstring
+import sys
+import warnings
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config  # type: ignore
+from cloud_connectors.aws import registry as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+FUNCTIONS = {"get_session", "get_client", "clear"}
+
+CONFIGURATION = {
+    "region_name": "eu-central-1",
+    "aws_access_key_id": "AKIAAAAAAAAAAAAA1111",
+    "aws_secret_access_key": "aaaaaaaaxxxxxxxx02330128skjjhasdg7723s!!",
+}
+
+
+def test_module_miss_functions() -> None:
+    missing = FUNCTIONS.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Function(s) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def test_get_client() -> None:
+    module.clear()
+
+    with ThreadPoolExecutor(8) as executor:
+        clients = list(executor.map(
+            lambda _: module.get_client("s3", dict(CONFIGURATION)), range(32)
+        ))
+    if len({id(client) for client in clients}) != 1:
+        LOGGER.error("Error sharing the client between threads")
+        sys.exit(1)
+
+    client = clients[0]
+    if client.meta.config.max_pool_connections != module.MAX_POOL_CONNECTIONS_DEFAULT:
+        LOGGER.error("Error setting the default connections pool size")
+        sys.exit(1)
+
+    if module.get_client("s3", CONFIGURATION, max_concurrency=4) is not client:
+        LOGGER.error("Error reusing the client with the large enough pool")
+        sys.exit(1)
+
+    client_large = module.get_client("s3", CONFIGURATION, max_concurrency=32)
+    if client_large is client or client_large.meta.config.max_pool_connections != 32:
+        LOGGER.error("Error growing the connections pool")
+        sys.exit(1)
+
+    if module.get_client("s3", CONFIGURATION) is not client_large:
+        LOGGER.error("Error reusing the client with the grown pool")
+        sys.exit(1)
+
+    if module.get_client("s3", {**CONFIGURATION, "region_name": "eu-west-1"}) is client_large:
+        LOGGER.error("Error separating clients by configuration")
+        sys.exit(1)
+
+    client_config = module.get_client(
+        "s3", {**CONFIGURATION, "config": {"connect_timeout": 5.0, "retries": None}}
+    )
+    if client_config.meta.config.connect_timeout != 5.0:
+        LOGGER.error("Error converting the config dict")
+        sys.exit(1)
+
+    if module.get_client(
+            "s3", {**CONFIGURATION, "config": Config(connect_timeout=5.0)}
+    ) is not client_config:
+        LOGGER.error("Error sharing the client configured with botocore Config")
+        sys.exit(1)
+
+    if module.get_session(CONFIGURATION) is not module.get_session(
+            {**CONFIGURATION, "endpoint_url": "http://localhost"}
+    ):
+        LOGGER.error("Error sharing the session")
+        sys.exit(1)
+
+    module.clear()
+    if module.get_client("s3", CONFIGURATION) is client_large:
+        LOGGER.error("Error clearing the registry")
+        sys.exit(1)
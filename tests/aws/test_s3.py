@@ -1,13 +1,23 @@
 # pylint: disable=missing-function-docstring
 import os
 import sys
+import io
+import mmap
+import gzip
+import shutil
+import tempfile
 import json
 import inspect
 import warnings
 import logging
+from typing import Callable
 from moto import mock_s3  # type: ignore
 import boto3  # type: ignore
+from botocore.exceptions import ClientError  # type: ignore
+from botocore.response import StreamingBody  # type: ignore
 from cloud_connectors.aws import s3 as module
+from cloud_connectors.aws import registry
+from cloud_connectors.scheduler import TransferScheduler
 
 
 logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
@@ -22,17 +32,39 @@ CLASS_METHODS = {
     "list_buckets",
     "list_objects",
     "list_objects_size",
+    "iter_objects",
+    "iter_objects_parallel",
+    "iter_objects_size",
+    "head",
+    "exists",
     "read",
+    "read_range",
+    "read_stream",
+    "read_parallel",
+    "read_many",
+    "select",
     "write",
+    "write_stream",
     "upload",
+    "upload_dir",
     "download",
+    "download_mmap",
+    "download_prefix",
     "copy",
     "move",
+    "copy_many",
+    "move_many",
     "delete_object",
     "delete_objects",
+    "delete_prefix",
 }
 
 
+def setup_function() -> None:
+    # tests patch the boto3 client, so it must not be shared between them
+    registry.clear()
+
+
 def test_module_miss_classes() -> None:
     missing = CLASSES.difference(set(module.__dir__()))
     if missing:
@@ -197,294 +229,1156 @@ def test_list_objects_size() -> None:
 
 
 @mock_s3
-def test_read() -> None:
-    path = "test.json"
-
+def test_iter_objects() -> None:
     mock_client = boto3.client("s3")
     mock_client.create_bucket(Bucket=BUCKET)
-
-    put_object(mock_client, path)
+    for i in range(25):
+        put_object(mock_client, f"test{i:02d}.json")
+    put_object(mock_client, "blah.json")
 
     client = module.Client()
 
+    calls = []
+    list_objects_v2 = client.client.list_objects_v2
+
+    def _list_objects_v2(**kwargs):
+        calls.append(kwargs)
+        return list_objects_v2(**kwargs)
+
+    client.client.list_objects_v2 = _list_objects_v2
+
+    tests = [
+        {"max_objects": None, "page_size": None, "want": 25, "calls": 1},
+        {"max_objects": None, "page_size": 10, "want": 25, "calls": 3},
+        {"max_objects": 12, "page_size": 5, "want": 12, "calls": 3},
+        {"max_objects": 5, "page_size": 5, "want": 5, "calls": 1},
+        {"max_objects": 0, "page_size": None, "want": 0, "calls": 0},
+    ]
+
+    for test in tests:
+        calls.clear()
+        objects = list(
+            client.iter_objects(
+                bucket=BUCKET,
+                prefix="test",
+                max_objects=test["max_objects"],
+                page_size=test["page_size"],
+            )
+        )
+        if [obj["Key"] for obj in objects] != [f"test{i:02d}.json" for i in range(test["want"])]:
+            LOGGER.error(f"Error iterating objects. got: {len(objects)}, want: {test['want']}")
+            sys.exit(1)
+
+        if len(calls) != test["calls"]:
+            LOGGER.error(f"Wrong number of LIST calls. got: {len(calls)}, want: {test['calls']}")
+            sys.exit(1)
+
+    calls.clear()
+    objects = client.iter_objects(bucket=BUCKET, prefix="test", page_size=10)
+    _ = next(objects)
+    if len(calls) != 1:
+        LOGGER.error("Objects are not listed lazily")
+        sys.exit(1)
+
+    if client.list_objects(bucket=BUCKET, prefix="test", max_objects=3) != [
+        "test00.json", "test01.json", "test02.json"
+    ]:
+        LOGGER.error("list_objects does not honor max_objects")
+        sys.exit(1)
+
+    if len(client.list_objects_size(bucket=BUCKET, prefix="test", max_objects=7)) != 7:
+        LOGGER.error("list_objects_size does not honor max_objects")
+        sys.exit(1)
+
     try:
-        _ = client.read(bucket=f"{BUCKET}_bar", path=path)
+        _ = next(client.iter_objects(bucket=f"{BUCKET}_bar"))
     except Exception as ex:
         if type(ex).__name__ != "BucketNotFound":
             LOGGER.error("Wrong error type to handle NoSuchBucket error")
             sys.exit(1)
 
-    try:
-        _ = client.read(bucket=BUCKET, path=f"{path}_bar")
-    except Exception as ex:
-        if type(ex).__name__ != "ObjectNotFound":
-            LOGGER.error("Wrong error type to handle NoSuchKey error")
+
+@mock_s3
+def test_iter_objects_parallel() -> None:
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    keys = sorted(
+        [f"data/{p}/{i:02d}.json" for p in ("a", "b", "c") for i in range(12)]
+        + ["data/a.json", "data/z.json", "blah.json"]
+    )
+    for key in keys:
+        put_object(mock_client, key)
+
+    want = [key for key in keys if key.startswith("data/")]
+
+    client = module.Client()
+
+    tests = [
+        {"shards": None, "ordered": True},
+        {"shards": None, "ordered": False},
+        {"shards": ["data/a/05.json", "data/b/11.json", "data/c"], "ordered": True},
+        {"shards": ["data/c", "data/a/05.json"], "ordered": False},
+    ]
+
+    for test in tests:
+        objects = [
+            obj["Key"] for obj in client.iter_objects_parallel(
+                bucket=BUCKET,
+                prefix="data/",
+                shards=test["shards"],
+                max_concurrency=2,
+                ordered=test["ordered"],
+                page_size=5,
+            )
+        ]
+        got = objects if test["ordered"] else sorted(objects)
+        if got != want:
+            LOGGER.error(f"Error listing objects in parallel. got: {got}, want: {want}")
             sys.exit(1)
 
-    obj = client.read(bucket=BUCKET, path=path)
-    if json.loads(obj) != OBJ_CONTENT:
-        LOGGER.error("Error reading object")
+    objects = client.iter_objects_parallel(bucket=BUCKET, prefix="data/", page_size=2)
+    if [next(objects)["Key"] for _ in range(3)] != want[:3]:
+        LOGGER.error("Error listing objects in parallel with early termination")
         sys.exit(1)
+    objects.close()
 
     try:
-        client.read("", "test.json")
+        _ = list(client.iter_objects_parallel(bucket=f"{BUCKET}_bar", shards=["a"]))
     except Exception as ex:
         if type(ex).__name__ != "BucketNotFound":
-            LOGGER.error("Wrong error type to handle InvalidBucketName error")
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
             sys.exit(1)
 
 
 @mock_s3
-def test_write() -> None:
+def test_read() -> None:
     path = "test.json"
 
     mock_client = boto3.client("s3")
     mock_client.create_bucket(Bucket=BUCKET)
 
+    put_object(mock_client, path)
+
     client = module.Client()
 
     try:
-        client.write(obj=json.dumps(OBJ_CONTENT), bucket=f"{BUCKET}_bar", path=path)
+        _ = client.read(bucket=f"{BUCKET}_bar", path=path)
     except Exception as ex:
         if type(ex).__name__ != "BucketNotFound":
             LOGGER.error("Wrong error type to handle NoSuchBucket error")
             sys.exit(1)
 
     try:
-        client.write(obj=OBJ_CONTENT, bucket=BUCKET, path=path)
+        _ = client.read(bucket=BUCKET, path=f"{path}_bar")
     except Exception as ex:
-        if type(ex).__name__ != "TypeError":
-            LOGGER.error("Wrong error type to handle ParamValidationError error")
+        if type(ex).__name__ != "ObjectNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchKey error")
             sys.exit(1)
 
-    client.write(obj=json.dumps(OBJ_CONTENT), bucket=BUCKET, path=path)
-
-    obj = mock_client.get_object(Bucket=BUCKET, Key=path)["Body"].read()
+    obj = client.read(bucket=BUCKET, path=path)
     if json.loads(obj) != OBJ_CONTENT:
-        LOGGER.error("Error writing object")
+        LOGGER.error("Error reading object")
         sys.exit(1)
 
+    try:
+        client.read("", "test.json")
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle InvalidBucketName error")
+            sys.exit(1)
+
 
 @mock_s3
-def test_upload() -> None:
+def test_read_range() -> None:
     path = "test.json"
-    path_os = f"/tmp/{path}"
+    content = json.dumps(OBJ_CONTENT).encode()
 
     mock_client = boto3.client("s3")
     mock_client.create_bucket(Bucket=BUCKET)
 
+    put_object(mock_client, path)
+
     client = module.Client()
 
-    try:
-        client.upload(bucket=BUCKET, path_source=path_os, path_destination=path)
-    except Exception as ex:
-        if type(ex).__name__ != "FileNotFoundError":
-            LOGGER.error("Wrong error type to handle FileNotFoundError error")
+    tests = [
+        {"start": 0, "end": 10, "want": content[0:10]},
+        {"start": 5, "end": None, "want": content[5:]},
+        {"start": -7, "end": None, "want": content[-7:]},
+        {"start": 10, "end": 1000, "want": content[10:]},
+        {"start": 10, "end": 10, "want": b""},
+    ]
+
+    for test in tests:
+        got = client.read_range(bucket=BUCKET, path=path, start=test["start"], end=test["end"])
+        if got != test["want"]:
+            LOGGER.error(f"Error reading range. got: {got}, want: {test['want']}")
             sys.exit(1)
 
-    with open(path_os, "w") as f:
-        json.dump(OBJ_CONTENT, f)
+    for start, end in ((1000, None), (-1, 10)):
+        try:
+            _ = client.read_range(bucket=BUCKET, path=path, start=start, end=end)
+        except Exception as ex:
+            if type(ex).__name__ != "ValueError":
+                LOGGER.error("Wrong error type to handle InvalidRange error")
+                sys.exit(1)
 
     try:
-        client.upload(bucket=f"{BUCKET}_bar", path_source=f"/tmp/{path}", path_destination=path)
+        _ = client.read_range(bucket=f"{BUCKET}_bar", path=path, start=0, end=10)
     except Exception as ex:
         if type(ex).__name__ != "BucketNotFound":
             LOGGER.error("Wrong error type to handle NoSuchBucket error")
             sys.exit(1)
 
-    client.upload(bucket=BUCKET, path_source=path_os, path_destination=path)
-
-    obj = mock_client.get_object(Bucket=BUCKET, Key=path)["Body"].read()
-    if json.loads(obj) != OBJ_CONTENT:
-        LOGGER.error("Error writing object")
-        sys.exit(1)
-
-    os.remove(path_os)
+    try:
+        _ = client.read_range(bucket=BUCKET, path=f"{path}_bar", start=0, end=10)
+    except Exception as ex:
+        if type(ex).__name__ != "ObjectNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchKey error")
+            sys.exit(1)
 
 
 @mock_s3
-def test_download() -> None:
+def test_read_stream() -> None:
     path = "test.json"
-    path_os = f"/tmp/{path}"
+    content = json.dumps(OBJ_CONTENT).encode()
 
     mock_client = boto3.client("s3")
     mock_client.create_bucket(Bucket=BUCKET)
+
     put_object(mock_client, path)
 
     client = module.Client()
 
+    chunks = list(client.read_stream(bucket=BUCKET, path=path, chunk_size=10))
+    if b"".join(chunks) != content or max(len(chunk) for chunk in chunks) != 10:
+        LOGGER.error(f"Error reading object chunks: {chunks}")
+        sys.exit(1)
+
     try:
-        client.download(bucket=f"{BUCKET}_bar", path_source=path, path_destination=path_os)
+        _ = client.read_stream(bucket=f"{BUCKET}_bar", path=path)
     except Exception as ex:
         if type(ex).__name__ != "BucketNotFound":
             LOGGER.error("Wrong error type to handle NoSuchBucket error")
             sys.exit(1)
 
     try:
-        client.download(bucket=BUCKET, path_source=f"{path}_bar", path_destination=path_os)
+        _ = client.read_stream(bucket=BUCKET, path=f"{path}_bar")
     except Exception as ex:
         if type(ex).__name__ != "ObjectNotFound":
             LOGGER.error("Wrong error type to handle NoSuchKey error")
             sys.exit(1)
 
-    try:
-        client.download(bucket=BUCKET, path_source=path, path_destination="/bin/test.json")
-    except Exception as ex:
-        if type(ex).__name__ != "DestinationPathPermissionsError":
-            LOGGER.error("Wrong error type to handle write permissoin error")
-            sys.exit(1)
-
-    try:
-        client.download(
-            bucket=BUCKET, path_source=path, path_destination="/tmp/s3_test____/test.json",
-        )
-    except Exception as ex:
-        if type(ex).__name__ != "DestinationPathError":
-            LOGGER.error("Wrong error type to handle desination directory error")
-            sys.exit(1)
-
-    client.download(bucket=BUCKET, path_source=path, path_destination=path_os)
-
-    with open(path_os, "r") as f:
-        if json.load(f) != OBJ_CONTENT:
-            LOGGER.error("Error downloading object - content")
-            sys.exit(1)
-
-    os.remove(path_os)
-
-    try:
-        client.download(
-            bucket=BUCKET, path_source=path, path_destination=path_os, configuration={"a": 1}
-        )
-    except Exception as ex:
-        if type(ex).__name__ != "ConfigurationError":
-            LOGGER.error("Wrong error type to handle download configuration error")
-            sys.exit(1)
-
 
 @mock_s3
-def test_copy() -> None:
-    path = "test.json"
+def test_read_parallel() -> None:
+    path = "test.bin"
+    content = os.urandom(100 * 1024 + 7)
 
     mock_client = boto3.client("s3")
     mock_client.create_bucket(Bucket=BUCKET)
-    mock_client.create_bucket(Bucket=f"{BUCKET}_destination")
-    put_object(mock_client, path)
+    mock_client.put_object(Bucket=BUCKET, Key=path, Body=content)
+    mock_client.put_object(Bucket=BUCKET, Key="empty.bin", Body=b"")
 
     client = module.Client()
 
+    tests = [
+        {"part_size": 10 * 1024, "max_concurrency": 4, "as_memoryview": False},
+        {"part_size": 1024 * 1024, "max_concurrency": 1, "as_memoryview": False},
+        {"part_size": 33 * 1024, "max_concurrency": 8, "as_memoryview": True},
+    ]
+
+    for test in tests:
+        got = client.read_parallel(bucket=BUCKET, path=path, **test)
+        want_type = memoryview if test["as_memoryview"] else bytearray
+        if not isinstance(got, want_type) or bytes(got) != content:
+            LOGGER.error(f"Error reading object in parallel with {test}")
+            sys.exit(1)
+
+    if client.read_parallel(bucket=BUCKET, path="empty.bin") != bytearray():
+        LOGGER.error("Error reading empty object in parallel")
+        sys.exit(1)
+
     try:
-        client.copy(
-            bucket_source=f"{BUCKET}_bar",
-            bucket_destination=f"{BUCKET}_destination",
-            path_source=path,
-        )
+        _ = client.read_parallel(bucket=f"{BUCKET}_bar", path=path)
     except Exception as ex:
         if type(ex).__name__ != "BucketNotFound":
             LOGGER.error("Wrong error type to handle NoSuchBucket error")
             sys.exit(1)
 
     try:
-        client.copy(
-            bucket_source=BUCKET,
-            bucket_destination=f"{BUCKET}_destination",
-            path_source=f"{path}_bar",
-        )
+        _ = client.read_parallel(bucket=BUCKET, path=f"{path}_bar")
     except Exception as ex:
         if type(ex).__name__ != "ObjectNotFound":
             LOGGER.error("Wrong error type to handle NoSuchKey error")
             sys.exit(1)
 
-    try:
-        client.copy(
-            bucket_source=BUCKET, bucket_destination=f"{BUCKET}_destination_bar", path_source=path,
-        )
-    except Exception as ex:
-        if type(ex).__name__ != "BucketNotFound":
-            LOGGER.error("Wrong error type to handle NoSuchBucket error")
-            sys.exit(1)
 
-    client.copy(
-        bucket_source=BUCKET, bucket_destination=f"{BUCKET}_destination", path_source=path,
-    )
+@mock_s3
+def test_read_many() -> None:
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    paths = [f"test{i}.json" for i in range(20)]
+    for path in paths:
+        mock_client.put_object(Bucket=BUCKET, Key=path, Body=path.encode("utf-8"))
 
-    obj = mock_client.get_object(Bucket=BUCKET, Key=path)
-    if json.loads(obj["Body"].read()) != OBJ_CONTENT:
-        LOGGER.error("Error copying object - content")
+    client = module.Client()
+    pool_client = client.client
+
+    got = list(client.read_many(
+        bucket=BUCKET, paths=paths[:10] + ["missing.json"] + paths[10:], max_concurrency=16
+    ))
+    if [i.path for i in got] != paths[:10] + ["missing.json"] + paths[10:]:
+        LOGGER.error("Error reading objects in the paths order")
         sys.exit(1)
 
-    if obj["ContentType"] != "application/json":
-        LOGGER.error("Error copying object - content type")
+    if client.client is not pool_client:
+        LOGGER.error("Client is replaced to grow the connection pool")
+        sys.exit(1)
+
+    for result in got:
+        if result.path == "missing.json":
+            if type(result.exception).__name__ != "ObjectNotFound" or result.data is not None:
+                LOGGER.error("Wrong error type to handle missing object")
+                sys.exit(1)
+        elif result.exception is not None or result.data != result.path.encode("utf-8"):
+            LOGGER.error(f"Error reading '{result.path}'")
+            sys.exit(1)
+
+    got = client.read_many(bucket=BUCKET, paths=paths, max_concurrency=4, ordered=False)
+    if sorted(i.path for i in got) != sorted(paths):
+        LOGGER.error("Error reading objects as completed")
         sys.exit(1)
 
-    # replace the object itself
     try:
-        client.copy(
-            bucket_source=BUCKET,
-            bucket_destination=BUCKET,
-            path_source=path,
-            path_destination=path,
-        )
-    except Exception as ex:
-        LOGGER.error(ex)
+        list(client.read_many(bucket=f"{BUCKET}_bar", paths=paths))
+        LOGGER.error("Missing bucket is not detected")
         sys.exit(1)
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
 
 
 @mock_s3
-def test_delete_object() -> None:
+def test_write() -> None:
     path = "test.json"
 
     mock_client = boto3.client("s3")
     mock_client.create_bucket(Bucket=BUCKET)
-    put_object(mock_client, path)
 
     client = module.Client()
 
     try:
-        client.delete_object(bucket=f"{BUCKET}_bar", path=path)
+        client.write(obj=json.dumps(OBJ_CONTENT), bucket=f"{BUCKET}_bar", path=path)
     except Exception as ex:
         if type(ex).__name__ != "BucketNotFound":
             LOGGER.error("Wrong error type to handle NoSuchBucket error")
             sys.exit(1)
 
     try:
-        client.delete_object(bucket=BUCKET, path=f"{path}_bar")
+        client.write(obj=OBJ_CONTENT, bucket=BUCKET, path=path)
     except Exception as ex:
-        if type(ex).__name__ != "ObjectNotFound":
-            LOGGER.error("Wrong error type to handle NoSuchKey error")
+        if type(ex).__name__ != "TypeError":
+            LOGGER.error("Wrong error type to handle ParamValidationError error")
             sys.exit(1)
 
-    client.delete_object(bucket=BUCKET, path=path)
+    client.write(obj=json.dumps(OBJ_CONTENT), bucket=BUCKET, path=path)
 
-    obj_list = mock_client.list_objects_v2(Bucket=BUCKET, Prefix=path)
-    if "Contents" in obj_list:
-        LOGGER.error("Error deleting object")
+    obj = mock_client.get_object(Bucket=BUCKET, Key=path)["Body"].read()
+    if json.loads(obj) != OBJ_CONTENT:
+        LOGGER.error("Error writing object")
         sys.exit(1)
 
 
 @mock_s3
-def test_delete_objects() -> None:
-    paths = ["test.json", "test1.json"]
+def test_write_stream() -> None:
+    path = "test.bin"
+    part_size = 5 * 1024 * 1024
+    content = os.urandom(2 * part_size + 1024)
+    path_os = "/tmp/test_write_stream.bin"
 
     mock_client = boto3.client("s3")
     mock_client.create_bucket(Bucket=BUCKET)
-    for path in paths:
-        put_object(mock_client, path)
 
     client = module.Client()
 
+    def _chunks(data: bytes, size: int):
+        for i in range(0, len(data), size):
+            yield data[i:i + size]
+
+    with open(path_os, "wb") as f:
+        f.write(content)
+
+    with open(path_os, "rb") as f:
+        tests = [
+            {"source": _chunks(content, 1024 * 1024 + 3), "want": content, "parts": 3},
+            {"source": f, "want": content, "parts": 3},
+            {"source": _chunks(content[:1000], 10), "want": content[:1000], "parts": 0},
+            {"source": iter([]), "want": b"", "parts": 0},
+        ]
+
+        for test in tests:
+            client.write_stream(
+                bucket=BUCKET,
+                path=path,
+                source=test["source"],
+                configuration={"ContentType": "application/octet-stream"},
+                part_size=part_size,
+                max_concurrency=2,
+            )
+            obj = mock_client.get_object(Bucket=BUCKET, Key=path)
+            if obj["Body"].read() != test["want"]:
+                LOGGER.error("Error writing object from stream")
+                sys.exit(1)
+
+            if obj["ContentType"] != "application/octet-stream":
+                LOGGER.error("Error writing object from stream - content type")
+                sys.exit(1)
+
+            parts = int(obj["ETag"].strip('"').split("-")[1]) if "-" in obj["ETag"] else 0
+            if parts != test["parts"]:
+                LOGGER.error(f"Wrong number of parts. got: {parts}, want: {test['parts']}")
+                sys.exit(1)
+
+    os.remove(path_os)
+
+    def _faulty():
+        yield from _chunks(content, 1024 * 1024)
+        raise IOError("test")
+
     try:
-        client.delete_objects(bucket=f"{BUCKET}_bar", paths=paths)
+        client.write_stream(bucket=BUCKET, path="faulty.bin", source=_faulty(), part_size=part_size)
+        LOGGER.error("Source error is not raised")
+        sys.exit(1)
+    except IOError:
+        pass
+
+    if mock_client.list_multipart_uploads(Bucket=BUCKET).get("Uploads"):
+        LOGGER.error("Failed multipart upload is not aborted")
+        sys.exit(1)
+
+    try:
+        client.write_stream(bucket=BUCKET, path=path, source=iter([]), part_size=1024)
     except Exception as ex:
-        if type(ex).__name__ != "BucketNotFound":
-            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+        if type(ex).__name__ != "ValueError":
+            LOGGER.error("Wrong error type to handle part size error")
             sys.exit(1)
 
     try:
-        client.delete_objects(bucket=BUCKET, paths=[*paths, "test_bar.json"])
+        client.write_stream(
+            bucket=f"{BUCKET}_bar", path=path, source=_chunks(content, part_size), part_size=part_size
+        )
     except Exception as ex:
-        if type(ex).__name__ != "ObjectNotFound":
-            LOGGER.error("Wrong error type to handle NoSuchKey error")
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+
+@mock_s3
+def test_write_codec() -> None:
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+
+    client = module.Client()
+
+    content = json.dumps(OBJ_CONTENT).encode("utf-8")
+    client.write(content, BUCKET, "test.json.gz", codec="gzip")
+
+    resp = mock_client.get_object(Bucket=BUCKET, Key="test.json.gz")
+    if resp["ContentEncoding"] != "gzip" or gzip.decompress(resp["Body"].read()) != content:
+        LOGGER.error("Error writing gzip encoded object")
+        sys.exit(1)
+
+    if b"".join(client.read_stream(BUCKET, "test.json.gz", codec="auto")) != content:
+        LOGGER.error("Error reading gzip encoded object")
+        sys.exit(1)
+
+    # multipart upload of the compressed stream
+    content = os.urandom(6 * 1024 * 1024) * 2
+    client.write_stream(
+        BUCKET, "test.bin.gz", io.BytesIO(content), part_size=5 * 1024 * 1024, codec="gzip"
+    )
+
+    if b"".join(client.read_stream(BUCKET, "test.bin.gz", chunk_size=1024, codec="gzip")) \
+            != content:
+        LOGGER.error("Error reading multipart gzip encoded object")
+        sys.exit(1)
+
+    if b"".join(client.read_stream(BUCKET, "test.bin.gz")) == content:
+        LOGGER.error("Object is decoded without codec")
+        sys.exit(1)
+
+    try:
+        client.write(content, BUCKET, "test.bin", codec="bz2")
+    except Exception as ex:
+        if type(ex).__name__ != "ValueError":
+            LOGGER.error("Wrong error type to handle unknown codec")
+            sys.exit(1)
+
+
+@mock_s3
+def test_select() -> None:
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+
+    client = module.Client()
+
+    content = b"".join(f'{{"id": {i}}}\n'.encode("utf-8") for i in range(100))
+    client.write(content, BUCKET, "test.json")
+    client.write(content, BUCKET, "test.json.gz", codec="gzip")
+
+    sql = "SELECT s.id FROM S3Object s WHERE s.id >= 98"
+    want = [b'{"id":98}\n', b'{"id":99}\n']
+    for path, codec in [("test.json", None), ("test.json.gz", "gzip")]:
+        got = list(client.select(BUCKET, path, sql, codec=codec, pushdown=False))
+        if got != want:
+            LOGGER.error(f"Error filtering records locally. got: {got}, want: {want}")
+            sys.exit(1)
+
+    try:
+        client.select(BUCKET, "test_missing.json", sql, pushdown=False)
+    except Exception as ex:
+        if type(ex).__name__ != "ObjectNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchKey error")
+            sys.exit(1)
+
+    calls = []
+
+    def _select_object_content(**kwargs) -> dict:
+        calls.append(kwargs)
+        # the event stream is closed with the records iterator
+        return {
+            "Payload": (event for event in [
+                {"Records": {"Payload": b'{"id":98}\n{"i'}},
+                {"Records": {"Payload": b'd":99}\n'}},
+                {"Stats": {"Details": {}}},
+                {"End": {}},
+            ])
+        }
+
+    client.client.select_object_content = _select_object_content
+    got = list(client.select(BUCKET, "test.json.gz", sql, codec="gzip"))
+    if got != want or calls[0]["InputSerialization"]["CompressionType"] != "GZIP":
+        LOGGER.error(f"Error streaming S3 Select records. got: {got}, want: {want}")
+        sys.exit(1)
+
+    # the CSV records are split outside of the quoted fields
+    def _select_object_content_csv(**kwargs) -> dict:
+        return {
+            "Payload": (event for event in [
+                {"Records": {"Payload": b'1,"multi\nli'}},
+                {"Records": {"Payload": b'ne"\n2,single\n'}},
+                {"End": {}},
+            ])
+        }
+
+    client.client.select_object_content = _select_object_content_csv
+    got = list(client.select(BUCKET, "test.csv", "SELECT * FROM S3Object", "CSV", "CSV"))
+    if got != [b'1,"multi\nline"\n', b"2,single\n"]:
+        LOGGER.error(f"Error splitting S3 Select CSV records. got: {got}")
+        sys.exit(1)
+
+    def _select_object_content_unsupported(**kwargs) -> dict:
+        raise ClientError({"Error": {"Code": "NotImplemented"}}, "SelectObjectContent")
+
+    client.client.select_object_content = _select_object_content_unsupported
+    if list(client.select(BUCKET, "test.json", sql)) != want:
+        LOGGER.error("Error falling back to the local filter")
+        sys.exit(1)
+
+    def _select_object_content_missing_route(**kwargs) -> dict:
+        raise ClientError(
+            {"Error": {"Code": "404"}, "ResponseMetadata": {"HTTPStatusCode": 404}},
+            "SelectObjectContent",
+        )
+
+    client.client.select_object_content = _select_object_content_missing_route
+    if list(client.select(BUCKET, "test.json", sql)) != want:
+        LOGGER.error("Error falling back to the local filter on the missing route")
+        sys.exit(1)
+
+    # the other errors are raised, the object is not read
+    reads = []
+
+    def _read(params: dict, **kwargs) -> None:
+        reads.append(params["Key"])
+
+    def _select_object_content_failed(code: str) -> Callable[..., dict]:
+        def _select_object_content(**kwargs) -> dict:
+            raise ClientError({"Error": {"Code": code}}, "SelectObjectContent")
+        return _select_object_content
+
+    client.client.meta.events.register("provide-client-params.s3.GetObject", _read)
+    for code in ["AccessDenied", "SlowDown", "ParseUnexpectedToken"]:
+        client.client.select_object_content = _select_object_content_failed(code)
+        try:
+            _ = list(client.select(BUCKET, "test.json", sql))
+            LOGGER.error(f"{code} error is masked by the local filter")
+            sys.exit(1)
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] != code or reads:
+                LOGGER.error(f"Wrong error to handle {code}: {ex}, reads: {reads}")
+                sys.exit(1)
+
+    # the registry client is shared by the clients with the same configuration
+    client.client.meta.events.unregister("provide-client-params.s3.GetObject", _read)
+    del client.client.select_object_content
+
+
+@mock_s3
+def test_upload() -> None:
+    path = "test.json"
+    path_os = f"/tmp/{path}"
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+
+    client = module.Client()
+
+    try:
+        client.upload(bucket=BUCKET, path_source=path_os, path_destination=path)
+    except Exception as ex:
+        if type(ex).__name__ != "FileNotFoundError":
+            LOGGER.error("Wrong error type to handle FileNotFoundError error")
+            sys.exit(1)
+
+    with open(path_os, "w") as f:
+        json.dump(OBJ_CONTENT, f)
+
+    try:
+        client.upload(bucket=f"{BUCKET}_bar", path_source=f"/tmp/{path}", path_destination=path)
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+    client.upload(bucket=BUCKET, path_source=path_os, path_destination=path)
+
+    obj = mock_client.get_object(Bucket=BUCKET, Key=path)["Body"].read()
+    if json.loads(obj) != OBJ_CONTENT:
+        LOGGER.error("Error writing object")
+        sys.exit(1)
+
+    os.remove(path_os)
+
+
+@mock_s3
+def test_upload_configuration() -> None:
+    path = "test.bin"
+    path_os = f"/tmp/{path}"
+    content = os.urandom(11 * 1024 * 1024)
+    with open(path_os, "wb") as f:
+        f.write(content)
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+
+    client = module.Client()
+
+    try:
+        client.upload(
+            bucket=BUCKET, path_source=path_os, path_destination=path, configuration={"foo": 1}
+        )
+    except Exception as ex:
+        if type(ex).__name__ != "ConfigurationError":
+            LOGGER.error("Wrong error type to handle ConfigurationError error")
+            sys.exit(1)
+
+    configuration = {"multipart_threshold": 5 * 1024 * 1024, "multipart_chunksize": 5 * 1024 * 1024}
+    client.upload(
+        bucket=BUCKET, path_source=path_os, path_destination=path, configuration=configuration
+    )
+
+    if not mock_client.head_object(Bucket=BUCKET, Key=path)["ETag"].endswith('-3"'):
+        LOGGER.error("Error applying the transfer configuration")
+        sys.exit(1)
+
+    if mock_client.get_object(Bucket=BUCKET, Key=path)["Body"].read() != content:
+        LOGGER.error("Error uploading object")
+        sys.exit(1)
+
+    # pylint: disable=protected-access
+    transfer = client._transfer(module._transfer_configuration(configuration))
+    client.download(
+        bucket=BUCKET, path_source=path, path_destination=path_os, configuration=dict(configuration)
+    )
+    if client._transfer(module._transfer_configuration(configuration)) is not transfer:
+        LOGGER.error("Error reusing the transfer manager")
+        sys.exit(1)
+
+    # the transfer manager is not built for the transfers by parts
+    verified = module.Client()
+    verified.upload(bucket=BUCKET, path_source=path_os, path_destination=path, verify=True)
+    verified.download(bucket=BUCKET, path_source=path, path_destination=path_os, verify=True)
+    if verified.transfers:
+        LOGGER.error("Transfer manager is built for the verified transfers")
+        sys.exit(1)
+
+    os.remove(path_os)
+
+
+@mock_s3
+def test_upload_dir() -> None:
+    local_dir = tempfile.mkdtemp()
+    files = {"a.json": b"{}", "b/c.json": b'{"c": 1}', "b/d/e.bin": os.urandom(1024)}
+    for path, content in files.items():
+        os.makedirs(os.path.dirname(os.path.join(local_dir, path)), exist_ok=True)
+        with open(os.path.join(local_dir, path), "wb") as f:
+            f.write(content)
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+
+    client = module.Client()
+
+    uploaded = []
+    summary = client.upload_dir(
+        local_dir=local_dir,
+        bucket=BUCKET,
+        prefix="build",
+        max_concurrency=2,
+        progress=lambda path, size: uploaded.append(path),
+    )
+    want = (3, sum(len(i) for i in files.values()), 0, {})
+    if tuple(summary) != want or len(uploaded) != 3:
+        LOGGER.error(f"Error uploading directory. got: {summary}, want: {want}")
+        sys.exit(1)
+
+    for path, content in files.items():
+        if mock_client.get_object(Bucket=BUCKET, Key=f"build/{path}")["Body"].read() != content:
+            LOGGER.error(f"Error uploading directory - content of {path}")
+            sys.exit(1)
+
+    for compare in ["size_mtime", "etag"]:
+        summary = client.upload_dir(local_dir=local_dir, bucket=BUCKET, prefix="build/", compare=compare)
+        if tuple(summary) != (0, 0, 3, {}):
+            LOGGER.error(f"Error skipping unchanged files, compare {compare}: {summary}")
+            sys.exit(1)
+
+    with open(os.path.join(local_dir, "b/c.json"), "wb") as f:
+        f.write(b'{"c": 2}')
+
+    summary = client.upload_dir(local_dir=local_dir, bucket=BUCKET, prefix="build", compare="etag")
+    if tuple(summary) != (1, 8, 2, {}):
+        LOGGER.error(f"Error uploading changed files: {summary}")
+        sys.exit(1)
+
+    summary = client.upload_dir(local_dir=local_dir, bucket=BUCKET, prefix="other")
+    if summary.files != 3:
+        LOGGER.error(f"Error uploading directory to new prefix: {summary}")
+        sys.exit(1)
+
+    for kwargs in ({"compare": "foo"}, {"local_dir": "/tmp/s3_test____"}):
+        try:
+            _ = client.upload_dir(**{"local_dir": local_dir, "bucket": BUCKET, **kwargs})
+            LOGGER.error("Arguments error is not raised")
+            sys.exit(1)
+        except (ValueError, NotADirectoryError):
+            pass
+
+    try:
+        _ = client.upload_dir(local_dir=local_dir, bucket=f"{BUCKET}_bar")
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+    shutil.rmtree(local_dir)
+
+
+@mock_s3
+def test_download() -> None:
+    path = "test.json"
+    path_os = f"/tmp/{path}"
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    put_object(mock_client, path)
+
+    client = module.Client()
+
+    try:
+        client.download(bucket=f"{BUCKET}_bar", path_source=path, path_destination=path_os)
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+    try:
+        client.download(bucket=BUCKET, path_source=f"{path}_bar", path_destination=path_os)
+    except Exception as ex:
+        if type(ex).__name__ != "ObjectNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchKey error")
+            sys.exit(1)
+
+    try:
+        client.download(bucket=BUCKET, path_source=path, path_destination="/bin/test.json")
+    except Exception as ex:
+        if type(ex).__name__ != "DestinationPathPermissionsError":
+            LOGGER.error("Wrong error type to handle write permissoin error")
+            sys.exit(1)
+
+    try:
+        client.download(
+            bucket=BUCKET, path_source=path, path_destination="/tmp/s3_test____/test.json",
+        )
+    except Exception as ex:
+        if type(ex).__name__ != "DestinationPathError":
+            LOGGER.error("Wrong error type to handle desination directory error")
+            sys.exit(1)
+
+    client.download(bucket=BUCKET, path_source=path, path_destination=path_os)
+
+    with open(path_os, "r") as f:
+        if json.load(f) != OBJ_CONTENT:
+            LOGGER.error("Error downloading object - content")
+            sys.exit(1)
+
+    os.remove(path_os)
+
+    try:
+        client.download(
+            bucket=BUCKET, path_source=path, path_destination=path_os, configuration={"a": 1}
+        )
+    except Exception as ex:
+        if type(ex).__name__ != "ConfigurationError":
+            LOGGER.error("Wrong error type to handle download configuration error")
+            sys.exit(1)
+
+
+@mock_s3
+def test_download_mmap() -> None:
+    content = os.urandom(11 * 1024 * 1024 + 7)
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    mock_client.put_object(Bucket=BUCKET, Key="empty.bin", Body=b"")
+
+    client = module.Client()
+    client.write_stream(
+        bucket=BUCKET, path="test.bin", source=io.BytesIO(content), part_size=5 * 1024 * 1024
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path_os = os.path.join(tmp, "test.bin")
+        tests = [
+            {"part_size": 3 * 1024 * 1024, "as_memoryview": False, "verify": False},
+            {"part_size": 1024 * 1024, "as_memoryview": True, "verify": True},
+        ]
+        for test in tests:
+            got = client.download_mmap(
+                bucket=BUCKET, path_source="test.bin", path_destination=path_os, **test
+            )
+            want_type = memoryview if test["as_memoryview"] else mmap.mmap
+            if not isinstance(got, want_type) or bytes(got) != content:
+                LOGGER.error(f"Error downloading object into mapping with {test}")
+                sys.exit(1)
+            if test["as_memoryview"]:
+                got.release()
+            else:
+                got.close()
+
+            with open(path_os, "rb") as fread:
+                if fread.read() != content:
+                    LOGGER.error(f"Error downloading object to disk with {test}")
+                    sys.exit(1)
+
+        got = client.download_mmap(
+            bucket=BUCKET, path_source="empty.bin", path_destination=path_os
+        )
+        if len(got) != 0 or os.path.getsize(path_os) != 0:
+            LOGGER.error("Error downloading empty object into mapping")
+            sys.exit(1)
+
+        tests = [
+            {"path_source": "test.bin", "path_destination": os.path.join(tmp, "foo", "bar.bin"),
+             "want": "DestinationPathError"},
+            {"path_source": "missing.bin", "path_destination": path_os, "want": "ObjectNotFound"},
+        ]
+        for test in tests:
+            try:
+                client.download_mmap(
+                    bucket=BUCKET,
+                    path_source=test["path_source"],
+                    path_destination=test["path_destination"],
+                )
+                LOGGER.error(f"Error is not raised for {test}")
+                sys.exit(1)
+            except Exception as ex:
+                if type(ex).__name__ != test["want"]:
+                    LOGGER.error(f"Wrong error type to handle {test['want']}")
+                    sys.exit(1)
+
+
+@mock_s3
+def test_download_prefix() -> None:
+    local_dir = tempfile.mkdtemp()
+    objects = {"a.json": b"{}", "b/c.json": b'{"c": 1}', "b/d/e.bin": os.urandom(1024)}
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    for path, content in objects.items():
+        mock_client.put_object(Bucket=BUCKET, Key=f"data/{path}", Body=content)
+    mock_client.put_object(Bucket=BUCKET, Key="data/b/", Body=b"")
+    mock_client.put_object(Bucket=BUCKET, Key="other.json", Body=b"{}")
+
+    client = module.Client()
+
+    downloaded = []
+    summary = client.download_prefix(
+        bucket=BUCKET,
+        prefix="data",
+        local_dir=local_dir,
+        max_concurrency=2,
+        progress=lambda path, size: downloaded.append(path),
+    )
+    want = (3, sum(len(i) for i in objects.values()), 0, {})
+    if tuple(summary) != want or len(downloaded) != 3:
+        LOGGER.error(f"Error downloading prefix. got: {summary}, want: {want}")
+        sys.exit(1)
+
+    for path, content in objects.items():
+        with open(os.path.join(local_dir, path), "rb") as f:
+            if f.read() != content:
+                LOGGER.error(f"Error downloading prefix - content of {path}")
+                sys.exit(1)
+
+    # resume after the interrupted download
+    os.remove(os.path.join(local_dir, "b/c.json"))
+    with open(os.path.join(local_dir, "a.json"), "wb") as f:
+        f.write(b"{ }")
+
+    summary = client.download_prefix(bucket=BUCKET, prefix="data/", local_dir=local_dir)
+    if tuple(summary) != (2, 10, 1, {}):
+        LOGGER.error(f"Error resuming download: {summary}")
+        sys.exit(1)
+
+    with open(os.path.join(local_dir, "a.json"), "wb") as f:
+        f.write(b"[]")
+
+    summary = client.download_prefix(
+        bucket=BUCKET, prefix="data/", local_dir=local_dir, compare="etag"
+    )
+    if tuple(summary) != (1, 2, 2, {}):
+        LOGGER.error(f"Error downloading changed objects: {summary}")
+        sys.exit(1)
+
+    if [i for _, _, files in os.walk(local_dir) for i in files if i.endswith(".part")]:
+        LOGGER.error("Temporary files are left")
+        sys.exit(1)
+
+    try:
+        _ = client.download_prefix(bucket=BUCKET, prefix="data", local_dir=local_dir, compare="foo")
+        LOGGER.error("Arguments error is not raised")
+        sys.exit(1)
+    except ValueError:
+        pass
+
+    try:
+        _ = client.download_prefix(bucket=f"{BUCKET}_bar", prefix="data", local_dir=local_dir)
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+    shutil.rmtree(local_dir)
+
+
+@mock_s3
+def test_copy() -> None:
+    path = "test.json"
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    mock_client.create_bucket(Bucket=f"{BUCKET}_destination")
+    put_object(mock_client, path)
+
+    client = module.Client()
+
+    try:
+        client.copy(
+            bucket_source=f"{BUCKET}_bar",
+            bucket_destination=f"{BUCKET}_destination",
+            path_source=path,
+        )
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+    try:
+        client.copy(
+            bucket_source=BUCKET,
+            bucket_destination=f"{BUCKET}_destination",
+            path_source=f"{path}_bar",
+        )
+    except Exception as ex:
+        if type(ex).__name__ != "ObjectNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchKey error")
+            sys.exit(1)
+
+    try:
+        client.copy(
+            bucket_source=BUCKET, bucket_destination=f"{BUCKET}_destination_bar", path_source=path,
+        )
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+    client.copy(
+        bucket_source=BUCKET, bucket_destination=f"{BUCKET}_destination", path_source=path,
+    )
+
+    obj = mock_client.get_object(Bucket=BUCKET, Key=path)
+    if json.loads(obj["Body"].read()) != OBJ_CONTENT:
+        LOGGER.error("Error copying object - content")
+        sys.exit(1)
+
+    if obj["ContentType"] != "application/json":
+        LOGGER.error("Error copying object - content type")
+        sys.exit(1)
+
+    # replace the object itself
+    try:
+        client.copy(
+            bucket_source=BUCKET,
+            bucket_destination=BUCKET,
+            path_source=path,
+            path_destination=path,
+        )
+    except Exception as ex:
+        LOGGER.error(ex)
+        sys.exit(1)
+
+
+@mock_s3
+def test_copy_multipart() -> None:
+    path = "test.bin"
+    part_size = 5 * 1024 * 1024
+    content = os.urandom(2 * part_size + 1024)
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    mock_client.create_bucket(Bucket=f"{BUCKET}_destination")
+    mock_client.put_object(
+        Bucket=BUCKET,
+        Key=path,
+        Body=content,
+        ContentType="application/octet-stream",
+        Metadata={"foo": "bar"},
+        Tagging="team=data&tier=hot",
+    )
+
+    client = module.Client()
+
+    client.copy(
+        bucket_source=BUCKET,
+        bucket_destination=f"{BUCKET}_destination",
+        path_source=path,
+        multipart_threshold=part_size,
+        part_size=part_size,
+        max_concurrency=2,
+    )
+
+    obj = mock_client.get_object(Bucket=f"{BUCKET}_destination", Key=path)
+    if obj["Body"].read() != content:
+        LOGGER.error("Error copying object in parts - content")
+        sys.exit(1)
+
+    if obj["ContentType"] != "application/octet-stream" or obj["Metadata"] != {"foo": "bar"}:
+        LOGGER.error("Error copying object in parts - metadata")
+        sys.exit(1)
+
+    tags = mock_client.get_object_tagging(Bucket=f"{BUCKET}_destination", Key=path)["TagSet"]
+    if sorted((tag["Key"], tag["Value"]) for tag in tags) != [("team", "data"), ("tier", "hot")]:
+        LOGGER.error(f"Error copying object in parts - tags: {tags}")
+        sys.exit(1)
+
+    if not obj["ETag"].endswith('-3"'):
+        LOGGER.error(f"Object is not copied in parts: {obj['ETag']}")
+        sys.exit(1)
+
+    client.move(
+        bucket_source=f"{BUCKET}_destination",
+        bucket_destination=BUCKET,
+        path_source=path,
+        path_destination="moved.bin",
+        multipart_threshold=part_size,
+        part_size=part_size,
+    )
+
+    if mock_client.get_object(Bucket=BUCKET, Key="moved.bin")["Body"].read() != content:
+        LOGGER.error("Error moving object in parts - content")
+        sys.exit(1)
+
+    try:
+        client.copy(
+            bucket_source=BUCKET,
+            bucket_destination=f"{BUCKET}_destination_bar",
+            path_source=path,
+            multipart_threshold=part_size,
+        )
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+
+@mock_s3
+def test_delete_object() -> None:
+    path = "test.json"
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    put_object(mock_client, path)
+
+    client = module.Client()
+
+    try:
+        client.delete_object(bucket=f"{BUCKET}_bar", path=path)
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+    try:
+        client.delete_object(bucket=BUCKET, path=f"{path}_bar")
+    except Exception as ex:
+        if type(ex).__name__ != "ObjectNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchKey error")
+            sys.exit(1)
+
+    client.delete_object(bucket=BUCKET, path=path)
+
+    obj_list = mock_client.list_objects_v2(Bucket=BUCKET, Prefix=path)
+    if "Contents" in obj_list:
+        LOGGER.error("Error deleting object")
+        sys.exit(1)
+
+
+@mock_s3
+def test_delete_objects() -> None:
+    paths = ["test.json", "test1.json"]
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    for path in paths:
+        put_object(mock_client, path)
+
+    client = module.Client()
+
+    try:
+        client.delete_objects(bucket=f"{BUCKET}_bar", paths=paths)
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+    try:
+        client.delete_objects(bucket=BUCKET, paths=[*paths, "test_bar.json"])
+    except Exception as ex:
+        if type(ex).__name__ != "ObjectNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchKey error")
             sys.exit(1)
 
     client.delete_objects(bucket=BUCKET, paths=paths)
@@ -496,6 +1390,116 @@ def test_delete_objects() -> None:
             sys.exit(1)
 
 
+@mock_s3
+def test_delete_objects_batches() -> None:
+    paths = [f"data/{i:04d}.json" for i in range(2005)]
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    for path in paths:
+        mock_client.put_object(Bucket=BUCKET, Key=path, Body=b"{}")
+
+    client = module.Client()
+
+    requests = []
+    delete_objects = client.client.delete_objects
+
+    def _delete_objects(**kwargs):
+        requests.append(len(kwargs["Delete"]["Objects"]))
+        return delete_objects(**kwargs)
+
+    client.client.delete_objects = _delete_objects
+
+    errors = client.delete_objects(bucket=BUCKET, paths=iter(paths), max_concurrency=3)
+    if errors or sorted(requests) != [5, 1000, 1000]:
+        LOGGER.error(f"Error deleting objects in batches: {requests}")
+        sys.exit(1)
+
+    if client.list_objects(bucket=BUCKET, prefix="data/"):
+        LOGGER.error("Error deleting objects in batches - objects are not deleted")
+        sys.exit(1)
+
+    requests.clear()
+    if client.delete_objects(bucket=BUCKET, paths=[]) or requests:
+        LOGGER.error("Error deleting empty list of objects")
+        sys.exit(1)
+
+    def _delete_objects_errors(**kwargs):
+        keys = [i["Key"] for i in kwargs["Delete"]["Objects"]]
+        if keys[0] == "b":
+            raise ClientError({"Error": {"Code": "SlowDown", "Message": "test"}}, "DeleteObjects")
+        return {"Errors": [{"Key": keys[0], "Code": "AccessDenied", "Message": "test"}]}
+
+    client.client.delete_objects = _delete_objects_errors
+    batch_size = module.Client.DELETE_BATCH_SIZE_MAX
+    module.Client.DELETE_BATCH_SIZE_MAX = 2
+    try:
+        errors = client.delete_objects(bucket=BUCKET, paths=["a", "a1", "b", "b1"])
+    finally:
+        module.Client.DELETE_BATCH_SIZE_MAX = batch_size
+    if errors != {"a": "AccessDenied", "b": "SlowDown", "b1": "SlowDown"}:
+        LOGGER.error(f"Error reporting failed objects: {errors}")
+        sys.exit(1)
+
+
+@mock_s3
+def test_delete_prefix() -> None:
+    paths = [f"data/{i:04d}.json" for i in range(1205)]
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    for path in [*paths, "other.json"]:
+        mock_client.put_object(Bucket=BUCKET, Key=path, Body=b"{}")
+
+    client = module.Client()
+
+    result = client.delete_prefix(bucket=BUCKET, prefix="data/", dry_run=True)
+    if result.count != len(paths) or result.failed:
+        LOGGER.error(f"Error counting objects to delete: {result}")
+        sys.exit(1)
+
+    if len(client.list_objects(bucket=BUCKET, prefix="data/")) != len(paths):
+        LOGGER.error("Objects are deleted in dry run")
+        sys.exit(1)
+
+    result = client.delete_prefix(bucket=BUCKET, prefix="data/", max_concurrency=2)
+    if result.count != len(paths) or result.failed:
+        LOGGER.error(f"Error deleting objects by prefix: {result}")
+        sys.exit(1)
+
+    if client.list_objects(bucket=BUCKET) != ["other.json"]:
+        LOGGER.error("Error deleting objects by prefix - objects left")
+        sys.exit(1)
+
+    if client.delete_prefix(bucket=BUCKET, prefix="data/").count != 0:
+        LOGGER.error("Error deleting empty prefix")
+        sys.exit(1)
+
+    for prefix in ["", None]:
+        try:
+            _ = client.delete_prefix(bucket=BUCKET, prefix=prefix, dry_run=True)
+            LOGGER.error("Empty prefix is not rejected")
+            sys.exit(1)
+        except ValueError:
+            pass
+
+    if client.list_objects(bucket=BUCKET) != ["other.json"]:
+        LOGGER.error("Objects are deleted with empty prefix")
+        sys.exit(1)
+
+    result = client.delete_prefix(bucket=BUCKET, prefix="", allow_bucket_wipe=True)
+    if result.count != 1 or client.list_objects(bucket=BUCKET):
+        LOGGER.error(f"Error wiping the bucket: {result}")
+        sys.exit(1)
+
+    try:
+        _ = client.delete_prefix(bucket=f"{BUCKET}_bar", prefix="data/")
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+
 @mock_s3
 def test_move() -> None:
     path = "test.json"
@@ -559,6 +1563,110 @@ def test_move() -> None:
         sys.exit(1)
 
 
+@mock_s3
+def test_copy_many() -> None:
+    paths = [f"data/{i:02d}.json" for i in range(12)]
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    mock_client.create_bucket(Bucket=f"{BUCKET}_destination")
+    for path in paths:
+        put_object(mock_client, path)
+
+    client = module.Client()
+
+    pairs = [(path, f"copy/{path}") for path in paths[:5]] + [("data/bar.json", "copy/bar.json")]
+    result = client.copy_many(
+        bucket_source=BUCKET, bucket_destination=BUCKET, pairs=pairs, max_concurrency=2
+    )
+    if sorted(result.succeeded) != paths[:5] or list(result.failed) != ["data/bar.json"]:
+        LOGGER.error(f"Error copying objects: {result}")
+        sys.exit(1)
+
+    if type(result.failed["data/bar.json"]).__name__ != "ObjectNotFound":
+        LOGGER.error("Wrong error type to report NoSuchKey error")
+        sys.exit(1)
+
+    result = client.copy_many(
+        bucket_source=BUCKET,
+        bucket_destination=f"{BUCKET}_destination",
+        prefix="data/",
+        rewrite=lambda path: path.replace("data/", "new/"),
+        max_concurrency=4,
+    )
+    if sorted(result.succeeded) != paths or result.failed:
+        LOGGER.error(f"Error copying objects by prefix: {result}")
+        sys.exit(1)
+
+    got = [i["Key"] for i in mock_client.list_objects_v2(
+        Bucket=f"{BUCKET}_destination")["Contents"]]
+    if got != [path.replace("data/", "new/") for path in paths]:
+        LOGGER.error(f"Error copying objects by prefix - destination: {got}")
+        sys.exit(1)
+
+    result = client.copy_many(
+        bucket_source=BUCKET,
+        bucket_destination=BUCKET,
+        prefix="data/",
+        rewrite=lambda path: f"{path}.copy",
+    )
+    if result.succeeded or len(result.failed) != len(paths):
+        LOGGER.error("Copies under the listed prefix are not prevented")
+        sys.exit(1)
+
+    for kwargs in ({}, {"pairs": pairs, "prefix": "data/"}):
+        try:
+            _ = client.copy_many(bucket_source=BUCKET, bucket_destination=BUCKET, **kwargs)
+            LOGGER.error("Arguments error is not raised")
+            sys.exit(1)
+        except ValueError:
+            pass
+
+
+@mock_s3
+def test_move_many() -> None:
+    paths = [f"data/{i:04d}.json" for i in range(1005)]
+
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    for path in paths:
+        mock_client.put_object(Bucket=BUCKET, Key=path, Body=b"{}")
+
+    client = module.Client()
+
+    result = client.move_many(
+        bucket_source=BUCKET,
+        bucket_destination=BUCKET,
+        prefix="data/",
+        rewrite=lambda path: path.replace("data/", "new/"),
+        max_concurrency=8,
+    )
+    if sorted(result.succeeded) != paths or result.failed:
+        LOGGER.error(f"Error moving objects: {result.failed}")
+        sys.exit(1)
+
+    if client.list_objects(bucket=BUCKET, prefix="data/"):
+        LOGGER.error("Error moving objects - source objects are not deleted")
+        sys.exit(1)
+
+    if len(client.list_objects(bucket=BUCKET, prefix="new/")) != len(paths):
+        LOGGER.error("Error moving objects - destination")
+        sys.exit(1)
+
+    result = client.move_many(
+        bucket_source=BUCKET,
+        bucket_destination=BUCKET,
+        pairs=[("new/0000.json", "new/0000.json"), ("new/0001.json", "data/0001.json")],
+    )
+    if result.succeeded != ["new/0001.json"] or list(result.failed) != ["new/0000.json"]:
+        LOGGER.error(f"Error moving objects onto themselves: {result}")
+        sys.exit(1)
+
+    if not client.list_objects(bucket=BUCKET, prefix="new/0000.json"):
+        LOGGER.error("Object moved onto itself is deleted")
+        sys.exit(1)
+
+
 def test_exceptions() -> None:
     client = module.Client()
 
@@ -581,3 +1689,338 @@ def test_exceptions() -> None:
         if type(ex).__name__ != "BucketNotFound":
             LOGGER.error("Wrong error type to handle NoSuchBucket error")
             sys.exit(1)
+
+
+@mock_s3
+def test_head_exists() -> None:
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    mock_client.put_object(Bucket=BUCKET, Key="listed.json", Body=b"{}")
+
+    if module.Client().metadata_cache.max_size != 0:
+        LOGGER.error("Metadata cache is enabled by default")
+        sys.exit(1)
+
+    client = module.Client(metadata_cache_size=10000)
+    heads = []
+    client.client.meta.events.register(
+        "provide-client-params.s3.HeadObject", lambda params, **kwargs: heads.append(params["Key"])
+    )
+
+    _ = client.list_objects(bucket=BUCKET)
+    if not client.exists(bucket=BUCKET, path="listed.json") or heads:
+        LOGGER.error("Error checking the listed object from cache")
+        sys.exit(1)
+
+    client.write(b"{}", bucket=BUCKET, path="test.json",
+                 configuration={"ContentType": "application/json"})
+    for _ in range(2):
+        head = client.head(bucket=BUCKET, path="test.json")
+    if head.size != 2 or head.content_type != "application/json" or heads != ["test.json"]:
+        LOGGER.error(f"Error getting the object metadata via cache: {head}, requests: {heads}")
+        sys.exit(1)
+
+    # copy picks the copy path by the fresh source metadata
+    mock_client.put_object(Bucket=BUCKET, Key="test.json", Body=b"{\"b\": 2}")
+    client.copy(
+        bucket_source=BUCKET,
+        bucket_destination=BUCKET,
+        path_source="test.json",
+        path_destination="copy.json",
+        multipart_threshold=8,
+    )
+    if heads != ["test.json", "test.json"] or client.head(bucket=BUCKET, path="test.json").size != 8:
+        LOGGER.error(f"Error copying with the fresh metadata: {heads}")
+        sys.exit(1)
+
+    client.write(b"{\"a\": 1}", bucket=BUCKET, path="test.json")
+    if client.head(bucket=BUCKET, path="test.json").size != 8:
+        LOGGER.error("Error invalidating the cache on write")
+        sys.exit(1)
+
+    client.move(
+        bucket_source=BUCKET,
+        bucket_destination=BUCKET,
+        path_source="test.json",
+        path_destination="moved.json",
+    )
+    if client.exists(bucket=BUCKET, path="test.json") \
+            or client.head(bucket=BUCKET, path="moved.json").size != 8:
+        LOGGER.error("Error invalidating the cache on move")
+        sys.exit(1)
+
+    _ = client.delete_objects(bucket=BUCKET, paths=["listed.json", "moved.json"])
+    if client.exists(bucket=BUCKET, path="listed.json") \
+            or client.exists(bucket=BUCKET, path="moved.json"):
+        LOGGER.error("Error invalidating the cache on delete")
+        sys.exit(1)
+
+    uncached = module.Client(metadata_cache_size=0)
+    _ = uncached.head(bucket=BUCKET, path="copy.json")
+    if len(uncached.metadata_cache) != 0:
+        LOGGER.error("Disabled cache stores entries")
+        sys.exit(1)
+
+    try:
+        _ = client.head(bucket=BUCKET, path="missing.json")
+    except Exception as ex:
+        if type(ex).__name__ != "ObjectNotFound":
+            LOGGER.error("Wrong error type to handle missing object")
+            sys.exit(1)
+
+    try:
+        _ = client.exists(bucket=f"{BUCKET}-bar", path="test.json")
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+
+@mock_s3
+def test_disk_cache() -> None:
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    mock_client.put_object(Bucket=BUCKET, Key="test.json", Body=b"{}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client = module.Client(disk_cache_dir=os.path.join(tmp, "cache"))
+        requests = []
+        client.client.meta.events.register(
+            "provide-client-params.s3.GetObject",
+            lambda params, **kwargs: requests.append(params.get("IfNoneMatch")),
+        )
+
+        for _ in range(2):
+            if client.read(bucket=BUCKET, path="test.json") != b"{}":
+                LOGGER.error("Error reading the object via disk cache")
+                sys.exit(1)
+
+        if requests[0] is not None or requests[1] is None:
+            LOGGER.error(f"Error revalidating the cached object: {requests}")
+            sys.exit(1)
+
+        mock_client.put_object(Bucket=BUCKET, Key="test.json", Body=b"{\"a\": 1}")
+        path = os.path.join(tmp, "test.json")
+        client.download(bucket=BUCKET, path_source="test.json", path_destination=path)
+        with open(path, "rb") as fread:
+            if fread.read() != b"{\"a\": 1}":
+                LOGGER.error("Error downloading the modified object via disk cache")
+                sys.exit(1)
+
+        if client.read(bucket=BUCKET, path="test.json") != b"{\"a\": 1}":
+            LOGGER.error("Error reading the downloaded object from disk cache")
+            sys.exit(1)
+
+        try:
+            client.read(bucket=BUCKET, path="missing.json")
+        except Exception as ex:
+            if type(ex).__name__ != "ObjectNotFound":
+                LOGGER.error("Wrong error type to handle missing object")
+                sys.exit(1)
+
+        try:
+            client.download(
+                bucket=BUCKET,
+                path_source="test.json",
+                path_destination=os.path.join(tmp, "missing", "test.json"),
+            )
+        except Exception as ex:
+            if type(ex).__name__ != "DestinationPathError":
+                LOGGER.error("Wrong error type to handle missing destination directory")
+                sys.exit(1)
+
+
+@mock_s3
+def test_verify() -> None:
+    content = os.urandom(11 * 1024 * 1024)
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+
+    client = module.Client()
+    client.write(content[:1024], bucket=BUCKET, path="small.bin", verify=True)
+    client.write_stream(
+        bucket=BUCKET, path="large.bin", source=io.BytesIO(content), part_size=5 * 1024 * 1024,
+        verify=True,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path_os = os.path.join(tmp, "test.bin")
+        with open(path_os, "wb") as fwrite:
+            fwrite.write(content)
+        client.upload(
+            bucket=BUCKET,
+            path_source=path_os,
+            path_destination="uploaded.bin",
+            configuration={"multipart_threshold": 5 * 1024 * 1024},
+            verify=True,
+        )
+        if not mock_client.head_object(Bucket=BUCKET, Key="uploaded.bin")["ETag"].endswith('-2"'):
+            LOGGER.error("Error applying the transfer configuration with verification")
+            sys.exit(1)
+
+        for path, want in [("small.bin", content[:1024]), ("large.bin", content),
+                           ("uploaded.bin", content)]:
+            client.download(bucket=BUCKET, path_source=path, path_destination=path_os, verify=True)
+            with open(path_os, "rb") as fread:
+                if fread.read() != want:
+                    LOGGER.error(f"Error downloading '{path}' with verification")
+                    sys.exit(1)
+
+            if client.read(bucket=BUCKET, path=path, verify=True) != want \
+                    or b"".join(client.read_stream(bucket=BUCKET, path=path, verify=True)) != want \
+                    or client.read_parallel(bucket=BUCKET, path=path, verify=True) != want:
+                LOGGER.error(f"Error reading '{path}' with verification")
+                sys.exit(1)
+
+        get_object = client.client.get_object
+
+        def _get_object_corrupted(**kwargs) -> dict:
+            resp = get_object(**kwargs)
+            body = bytearray(resp["Body"].read())
+            body[0] ^= 1
+            resp["Body"] = StreamingBody(io.BytesIO(bytes(body)), len(body))
+            return resp
+
+        client.client.get_object = _get_object_corrupted
+        for func in [
+                lambda: client.read(bucket=BUCKET, path="large.bin", verify=True),
+                lambda: list(client.read_stream(bucket=BUCKET, path="large.bin", verify=True)),
+                lambda: client.read_parallel(bucket=BUCKET, path="large.bin", verify=True),
+                lambda: client.download(
+                    bucket=BUCKET, path_source="small.bin", path_destination=path_os, verify=True
+                ),
+        ]:
+            try:
+                func()
+                LOGGER.error("Corrupted object is not detected")
+                sys.exit(1)
+            except Exception as ex:
+                if type(ex).__name__ != "ChecksumMismatch":
+                    LOGGER.error("Wrong error type to handle ChecksumMismatch")
+                    sys.exit(1)
+
+        if os.path.exists(path_os):
+            LOGGER.error("Corrupted download is not removed")
+            sys.exit(1)
+
+        # the corrupted object is not read without verification
+        if client.read(bucket=BUCKET, path="small.bin") == content[:1024]:
+            LOGGER.error("Error corrupting the object")
+            sys.exit(1)
+
+
+@mock_s3
+def test_scheduler() -> None:
+    content = os.urandom(11 * 1024 * 1024)
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+
+    scheduler = TransferScheduler(max_bytes=6 * 1024 * 1024, max_connections=2)
+    client = module.Client(scheduler=scheduler, priority="bulk")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path_os = os.path.join(tmp, "test.bin")
+        with open(path_os, "wb") as fwrite:
+            fwrite.write(content)
+
+        client.write(content[:1024], bucket=BUCKET, path="small.bin")
+        client.upload(
+            bucket=BUCKET,
+            path_source=path_os,
+            path_destination="test.bin",
+            configuration={"multipart_threshold": 5 * 1024 * 1024, "max_concurrency": 4},
+        )
+        client.download(bucket=BUCKET, path_source="test.bin", path_destination=path_os)
+        with open(path_os, "rb") as fread:
+            if fread.read() != content:
+                LOGGER.error("Error downloading object with the scheduler")
+                sys.exit(1)
+
+        got = [
+            client.read(bucket=BUCKET, path="test.bin"),
+            client.read_range(bucket=BUCKET, path="test.bin", start=10, end=20),
+            client.read_parallel(bucket=BUCKET, path="test.bin", part_size=5 * 1024 * 1024),
+            b"".join(client.read_stream(bucket=BUCKET, path="small.bin")),
+        ]
+        if got != [content, content[10:20], content, content[:1024]]:
+            LOGGER.error("Error reading object with the scheduler")
+            sys.exit(1)
+
+        # the slot of the stream is released once the stream is dropped
+        stream = client.read_stream(bucket=BUCKET, path="test.bin")
+        if scheduler.stats().in_flight_connections != 1:
+            LOGGER.error("Error holding the slot of the stream")
+            sys.exit(1)
+        del stream
+
+        # the partly read stream releases the slot and the connection once it's closed
+        client.write(content[:1024], bucket=BUCKET, path="small.bin.gz", codec="gzip")
+        for path, codec in [("test.bin", None), ("small.bin.gz", "gzip")]:
+            stream = client.read_stream(
+                bucket=BUCKET, path=path, chunk_size=256, codec=codec, verify=True
+            )
+            if len(next(stream)) != 256:
+                LOGGER.error("Error reading the stream chunk")
+                sys.exit(1)
+            stream.close()
+            if scheduler.stats().in_flight_connections:
+                LOGGER.error(f"Error releasing the slot of the abandoned stream: {codec}")
+                sys.exit(1)
+
+        # the copies and S3 Select requests are scheduled
+        granted = scheduler.stats().granted["bulk"]
+        client.copy(bucket_source=BUCKET, bucket_destination=BUCKET,
+                    path_source="small.bin", path_destination="copy.bin")
+        client.copy(bucket_source=BUCKET, bucket_destination=BUCKET,
+                    path_source="test.bin", path_destination="copy.bin",
+                    multipart_threshold=5 * 1024 * 1024, part_size=5 * 1024 * 1024)
+        if scheduler.stats().granted["bulk"] != granted + 4:
+            LOGGER.error(f"Error scheduling the copies: {scheduler.stats()}")
+            sys.exit(1)
+
+        client.write(b'{"id": 1}\n{"id": 2}\n', bucket=BUCKET, path="test.json")
+        records = client.select(BUCKET, "test.json", "SELECT * FROM S3Object", pushdown=True)
+        if scheduler.stats().in_flight_connections != 1:
+            LOGGER.error("Error holding the slot of the S3 Select records")
+            sys.exit(1)
+        # the records are released before the first one is read too
+        records.close()
+        with client.select(BUCKET, "test.json", "SELECT * FROM S3Object", pushdown=False) \
+                as records:
+            if next(records) != b'{"id":1}\n':
+                LOGGER.error("Error filtering the records locally")
+                sys.exit(1)
+        if scheduler.stats().in_flight_connections:
+            LOGGER.error("Error releasing the slot of the abandoned records")
+            sys.exit(1)
+
+        # the disk cache misses reserve the object size, the revalidated hits hold a connection
+        requests = []
+        acquire = scheduler.acquire
+
+        def _acquire(size: int, connections: int = 1, **kwargs) -> int:
+            requests.append((size, connections))
+            return acquire(size, connections=connections, **kwargs)
+
+        scheduler.acquire = _acquire
+        client_cached = module.Client(
+            scheduler=scheduler, priority="bulk", disk_cache_dir=os.path.join(tmp, "cache")
+        )
+        client_cached.download(bucket=BUCKET, path_source="small.bin", path_destination=path_os)
+        if client_cached.read(bucket=BUCKET, path="small.bin") != content[:1024] \
+                or requests != [(0, 1), (1024, 0), (0, 1)]:
+            LOGGER.error(f"Error scheduling the disk cache requests: {requests}")
+            sys.exit(1)
+        del scheduler.acquire
+
+    stats = scheduler.stats()
+    if stats.in_flight_bytes or stats.in_flight_connections or stats.granted["bulk"] < 10:
+        LOGGER.error(f"Error scheduling the transfers: {stats}")
+        sys.exit(1)
+
+    try:
+        module.Client(priority="urgent")
+        LOGGER.error("Unknown priority is not detected")
+        sys.exit(1)
+    except ValueError:
+        pass
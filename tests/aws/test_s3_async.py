@@ -0,0 +1,216 @@
+# pylint: disable=missing-function-docstring
+import os
+import sys
+import socket
+import asyncio
+import inspect
+import tempfile
+import warnings
+import logging
+import pytest
+from moto.server import ThreadedMotoServer  # type: ignore
+
+pytest.importorskip("aiobotocore")
+
+from cloud_connectors.aws import s3_async as module  # pylint: disable=wrong-import-position
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+CLASSES = {"AsyncClient"}
+
+CLASS_METHODS = {
+    "connect",
+    "close",
+    "list_buckets",
+    "list_objects",
+    "list_objects_size",
+    "iter_objects",
+    "read",
+    "write",
+    "upload",
+    "download",
+    "copy",
+    "move",
+    "delete_object",
+    "delete_objects",
+}
+
+BUCKET = "test"
+
+
+@pytest.fixture(scope="module")
+def configuration():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    yield {
+        "region_name": "us-east-1",
+        "aws_access_key_id": "AKIAAAAAAAAAAAAA1111",
+        "aws_secret_access_key": "aaaaaaaaxxxxxxxx02330128skjjhasdg7723s!!",
+        "endpoint_url": f"http://127.0.0.1:{port}",
+    }
+    server.stop()
+
+
+def test_module_miss_classes() -> None:
+    missing = CLASSES.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Class(es) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def test_class_client_miss_methods() -> None:
+    model_members = inspect.getmembers(module.AsyncClient)
+    missing = CLASS_METHODS.difference({i[0] for i in model_members})
+    if missing:
+        LOGGER.error(
+            f"""Class 'AsyncClient' Method(s) '{"', '".join(missing)}' is(are) missing."""
+        )
+        sys.exit(1)
+
+
+def test_init() -> None:
+    try:
+        _ = module.AsyncClient({"region_name": "foo"})
+    except Exception as ex:
+        if type(ex).__name__ != "ConfigurationError":
+            LOGGER.error("Wrong error type to handle wrong configuration")
+            sys.exit(1)
+
+
+async def _test_read_write(configuration: dict) -> None:
+    async with module.AsyncClient(configuration, max_connections=4) as client:
+        await client.client.create_bucket(Bucket=BUCKET)
+
+        await asyncio.gather(*[
+            client.write(f"{i}".encode(), bucket=BUCKET, path=f"data/{i:04d}.json")
+            for i in range(1005)
+        ])
+
+        listed = await client.list_objects_size(bucket=BUCKET, prefix="data/")
+        if len(listed) != 1005 or listed[10] != ("data/0010.json", 2):
+            LOGGER.error("Error listing objects")
+            sys.exit(1)
+
+        if await client.list_objects(bucket=BUCKET, max_objects=2) != [
+            "data/0000.json",
+            "data/0001.json",
+        ]:
+            LOGGER.error("Error listing max objects")
+            sys.exit(1)
+
+        if BUCKET not in await client.list_buckets():
+            LOGGER.error("Error listing buckets")
+            sys.exit(1)
+
+        if await client.read(bucket=BUCKET, path="data/0042.json") != b"42":
+            LOGGER.error("Error reading the object")
+            sys.exit(1)
+
+        await client.copy(
+            bucket_source=BUCKET,
+            bucket_destination=BUCKET,
+            path_source="data/0001.json",
+            path_destination="copy.json",
+        )
+        await client.move(
+            bucket_source=BUCKET,
+            bucket_destination=BUCKET,
+            path_source="copy.json",
+            path_destination="moved.json",
+        )
+        if await client.list_objects(bucket=BUCKET, prefix="m") != ["moved.json"] \
+                or await client.list_objects(bucket=BUCKET, prefix="c"):
+            LOGGER.error("Error moving the object")
+            sys.exit(1)
+
+        # the in-place copy keeps the content type and the metadata
+        await client.client.put_object(
+            Bucket=BUCKET,
+            Key="typed.json",
+            Body=b"{}",
+            ContentType="application/json",
+            Metadata={"foo": "bar"},
+        )
+        await client.copy(bucket_source=BUCKET, bucket_destination=BUCKET, path_source="typed.json")
+        head = await client.client.head_object(Bucket=BUCKET, Key="typed.json")
+        if head["ContentType"] != "application/json" or head["Metadata"] != {"foo": "bar"}:
+            LOGGER.error(f"Error copying the object in place: {head['ContentType']}")
+            sys.exit(1)
+
+        try:
+            await client.copy(
+                bucket_source=BUCKET, bucket_destination=BUCKET, path_source="missing.json"
+            )
+        except Exception as ex:
+            if type(ex).__name__ != "ObjectNotFound":
+                LOGGER.error("Wrong error type to handle the missing object copied in place")
+                sys.exit(1)
+
+        failed = await client.delete_objects(
+            bucket=BUCKET, paths=[path for path, _ in listed]
+        )
+        if failed or await client.list_objects(bucket=BUCKET, prefix="data/"):
+            LOGGER.error(f"Error deleting objects: {failed}")
+            sys.exit(1)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "large.bin")
+            data = os.urandom(11 * 1024 * 1024)
+            with open(path, "wb") as fwrite:
+                fwrite.write(data)
+
+            await client.upload(
+                bucket=BUCKET,
+                path_source=path,
+                path_destination="large.bin",
+                part_size=5 * 1024 * 1024,
+            )
+            await client.download(
+                bucket=BUCKET, path_source="large.bin", path_destination=f"{path}.copy"
+            )
+            with open(f"{path}.copy", "rb") as fread:
+                if fread.read() != data:
+                    LOGGER.error("Error uploading and downloading the multipart object")
+                    sys.exit(1)
+
+            try:
+                await client.download(
+                    bucket=BUCKET,
+                    path_source="large.bin",
+                    path_destination=os.path.join(tmp, "missing", "large.bin"),
+                )
+            except Exception as ex:
+                if type(ex).__name__ != "DestinationPathError":
+                    LOGGER.error("Wrong error type to handle missing destination directory")
+                    sys.exit(1)
+
+        try:
+            await client.read(bucket=BUCKET, path="missing.json")
+        except Exception as ex:
+            if type(ex).__name__ != "ObjectNotFound":
+                LOGGER.error("Wrong error type to handle NoSuchKey error")
+                sys.exit(1)
+
+        try:
+            await client.list_objects(bucket=f"{BUCKET}-bar")
+        except Exception as ex:
+            if type(ex).__name__ != "BucketNotFound":
+                LOGGER.error("Wrong error type to handle NoSuchBucket error")
+                sys.exit(1)
+
+    try:
+        await client.read(bucket=BUCKET, path="moved.json")
+    except Exception as ex:
+        if type(ex).__name__ != "ConnectionError":
+            LOGGER.error("Wrong error type to handle closed client")
+            sys.exit(1)
+
+
+def test_read_write(configuration) -> None:  # pylint: disable=redefined-outer-name
+    asyncio.run(_test_read_write(configuration))
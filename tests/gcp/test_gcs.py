@@ -1,9 +1,12 @@
 # pylint: disable=missing-function-docstring
 import sys
+import gzip
+import base64
 import inspect
 import warnings
 import logging
 from google.cloud import storage
+import google_crc32c
 import mock
 from cloud_connectors.gcp import gcs as module
 
@@ -19,7 +22,13 @@ CLASS_METHODS = {
     "list_buckets",
     "list_objects",
     "list_objects_size",
+    "iter_objects_size",
+    "head",
+    "exists",
     "read",
+    "read_stream",
+    "read_many",
+    "select",
     "write",
     "upload",
     "download",
@@ -54,3 +63,118 @@ def test_init() -> None:
     except Exception as ex:
         LOGGER.error(ex)
         sys.exit(1)
+
+
+def _client_mock(content: bytes) -> module.Client:
+    client = module.Client.__new__(module.Client)
+    client.client = mock.MagicMock()
+    blob = client.client.lookup_bucket.return_value.get_blob.return_value
+    blob.size = len(content)
+    blob.content_encoding = None
+    blob.crc32c = None
+    blob.download_as_bytes.side_effect = _download_mock(content)
+    return client
+
+
+def _download_mock(content: bytes):
+    def _download(start: int, end: int, raw_download: bool = False) -> bytes:
+        # the gzip encoded objects are decompressed by the server unless the raw bytes requested
+        if not raw_download and content[:2] == b"\x1f\x8b":
+            return gzip.decompress(content)[start:end + 1]
+        return content[start:end + 1]
+
+    return _download
+
+
+def test_read_stream() -> None:
+    content = b"0123456789" * 10
+    client = _client_mock(content)
+
+    chunks = list(client.read_stream("bucket", "test.bin", chunk_size=30))
+    if b"".join(chunks) != content or [len(i) for i in chunks] != [30, 30, 30, 10]:
+        LOGGER.error("Error reading object by chunks")
+        sys.exit(1)
+
+    blob = client.client.lookup_bucket.return_value.get_blob.return_value
+    # crc32c of the content
+    blob.crc32c = "kM3zbg=="
+    if b"".join(client.read_stream("bucket", "test.bin", chunk_size=30, verify=True)) != content:
+        LOGGER.error("Error reading object with verification")
+        sys.exit(1)
+
+    blob.crc32c = "AAAAAA=="
+    try:
+        list(client.read_stream("bucket", "test.bin", chunk_size=30, verify=True))
+        LOGGER.error("Checksum mismatch is not detected")
+        sys.exit(1)
+    except Exception as ex:
+        if type(ex).__name__ != "ChecksumMismatch":
+            LOGGER.error("Wrong error type to handle checksum mismatch")
+            sys.exit(1)
+
+    # the gzip encoded object is fetched as stored and decoded once
+    encoded = gzip.compress(content)
+    client = _client_mock(encoded)
+    blob = client.client.lookup_bucket.return_value.get_blob.return_value
+    blob.content_encoding = "gzip"
+    blob.crc32c = base64.b64encode(google_crc32c.value(encoded).to_bytes(4, "big")).decode()
+    got = b"".join(
+        client.read_stream("bucket", "test.bin.gz", chunk_size=30, codec="auto", verify=True)
+    )
+    if got != content:
+        LOGGER.error("Error reading gzip encoded object")
+        sys.exit(1)
+
+    client.client.lookup_bucket.return_value.get_blob.return_value = None
+    try:
+        client.read_stream("bucket", "test.bin")
+    except Exception as ex:
+        if type(ex).__name__ != "ObjectNotFound":
+            LOGGER.error("Wrong error type to handle missing object")
+            sys.exit(1)
+
+
+def test_select() -> None:
+    client = _client_mock(b'{"a": 1}\n{"a": 2}\n{"a": 3}\n')
+
+    got = list(client.select("bucket", "test.json", "SELECT s.a FROM S3Object s WHERE s.a >= 2"))
+    if got != [b'{"a":2}\n', b'{"a":3}\n']:
+        LOGGER.error(f"Error selecting records. got: {got}")
+        sys.exit(1)
+
+
+def test_read_many() -> None:
+    client = _client_mock(b"")
+
+    class NotFound(Exception):
+        pass
+
+    def _blob(path: str) -> mock.MagicMock:
+        blob = mock.MagicMock()
+        if path == "missing.json":
+            blob.download_as_bytes.side_effect = NotFound(path)
+        else:
+            blob.download_as_bytes.return_value = path.encode("utf-8")
+        return blob
+
+    client.client.lookup_bucket.return_value.blob.side_effect = _blob
+
+    paths = [f"test{i}.json" for i in range(10)] + ["missing.json"]
+    got = list(client.read_many("bucket", paths, max_concurrency=4))
+    if [i.path for i in got] != paths or got[0].data != b"test0.json":
+        LOGGER.error("Error reading objects in the paths order")
+        sys.exit(1)
+
+    if type(got[-1].exception).__name__ != "ObjectNotFound":
+        LOGGER.error("Wrong error type to handle missing object")
+        sys.exit(1)
+
+    client.client.lookup_bucket.return_value = None
+    try:
+        list(client.read_many("bucket", paths))
+        LOGGER.error("Missing bucket is not detected")
+        sys.exit(1)
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle missing bucket")
+            sys.exit(1)
@@ -0,0 +1,157 @@
+# pylint: disable=missing-function-docstring
+import os
+import sys
+import time
+import tempfile
+import warnings
+import logging
+from cloud_connectors import cache as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+CLASSES = {"MetadataCache", "DiskCache"}
+
+
+def test_module_miss_classes() -> None:
+    missing = CLASSES.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Class(es) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def test_metadata_cache() -> None:
+    cache = module.MetadataCache(max_size=2, ttl=60)
+
+    cache.put("bucket", "a", 1)
+    cache.put("bucket", "b", 2, complete=False)
+    if cache.get("bucket", "a") != 1 or cache.get("bucket", "b") is not None:
+        LOGGER.error("Error getting complete entries")
+        sys.exit(1)
+
+    if cache.get("bucket", "b", complete=False) != 2:
+        LOGGER.error("Error getting partial entries")
+        sys.exit(1)
+
+    # "a" is the least recently used
+    _ = cache.get("bucket", "b", complete=False)
+    cache.put("bucket", "c", 3)
+    if len(cache) != 2 or cache.get("bucket", "a") is not None:
+        LOGGER.error("Error evicting the least recently used entry")
+        sys.exit(1)
+
+    cache.invalidate("bucket", "c")
+    cache.invalidate_many("bucket", ["b", "missing"])
+    if len(cache) != 0:
+        LOGGER.error("Error invalidating entries")
+        sys.exit(1)
+
+    cache.ttl = 0.01
+    cache.put_many("bucket", [("a", 1), ("b", 2)])
+    time.sleep(0.02)
+    if cache.get("bucket", "a") is not None or len(cache) != 1:
+        LOGGER.error("Error expiring entries")
+        sys.exit(1)
+
+    cache.clear()
+    if len(cache) != 0:
+        LOGGER.error("Error clearing the cache")
+        sys.exit(1)
+
+    disabled = module.MetadataCache(max_size=0)
+    disabled.put("bucket", "a", 1)
+    if disabled.get("bucket", "a") is not None:
+        LOGGER.error("Disabled cache stores entries")
+        sys.exit(1)
+
+
+def test_disk_cache() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = module.DiskCache(tmp, max_bytes=10)
+
+        if cache.get("bucket", "a") is not None:
+            LOGGER.error("Error getting missing object")
+            sys.exit(1)
+
+        with cache.put("bucket", "a", '"etag-1"', [b"abc", b"de"]) as obj:
+            if obj.read() != b"abcde":
+                LOGGER.error("Error putting the object")
+                sys.exit(1)
+
+        etag, obj = cache.get("bucket", "a")
+        with obj:
+            if etag != '"etag-1"' or obj.read() != b"abcde":
+                LOGGER.error(f"Error getting the cached object: {etag}")
+                sys.exit(1)
+
+        # the new version replaces the previous one
+        cache.put("bucket", "a", '"etag-2"', [b"abcd"]).close()
+        etag, obj = cache.get("bucket", "a")
+        obj.close()
+        if etag != '"etag-2"':
+            LOGGER.error("Error replacing the object version")
+            sys.exit(1)
+
+        # "a" is touched last, so "b" is evicted
+        cache.put("bucket", "b", '"etag"', [b"abcd"]).close()
+        time.sleep(0.01)
+        cache.get("bucket", "a")[1].close()
+        time.sleep(0.01)
+        cache.put("bucket", "c", '"etag"', [b"abcd"]).close()
+        if cache.get("bucket", "b") is not None or cache.get("bucket", "a") is None:
+            LOGGER.error("Error evicting the least recently used object")
+            sys.exit(1)
+
+        # the opened file stays readable after eviction
+        with cache.put("bucket", "large", '"etag"', [b"x" * 20]) as obj:
+            if cache.get("bucket", "large") is not None or obj.read() != b"x" * 20:
+                LOGGER.error("Error evicting the object over the budget")
+                sys.exit(1)
+
+        cache.clear()
+        if cache.get("bucket", "a") is not None or cache.get("bucket", "c") is not None:
+            LOGGER.error("Error clearing the cache")
+            sys.exit(1)
+
+
+def test_disk_cache_size() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = module.DiskCache(tmp, max_bytes=100)
+
+        for path in ["a", "b", "c"]:
+            cache.put("bucket", path, '"etag-1"', [b"x" * 10]).close()
+        cache.put("bucket", "a", '"etag-2"', [b"x" * 20]).close()
+        if cache._read_size() != 40:
+            LOGGER.error(f"Error tracking the cache size: {cache._read_size()}")
+            sys.exit(1)
+
+        # the files are not scanned while the tracked size is within the budget
+        untracked = os.path.join(tmp, "00", "untracked", "etag")
+        os.makedirs(os.path.dirname(untracked))
+        with open(untracked, "wb") as fwrite:
+            fwrite.write(b"x" * 1000)
+        os.utime(untracked, (0, 0))
+        cache.put("bucket", "d", '"etag"', [b"x" * 10]).close()
+        if not os.path.exists(untracked):
+            LOGGER.error("Cache is scanned within the budget")
+            sys.exit(1)
+
+        # the eviction scan corrects the tracked size
+        cache.put("bucket", "e", '"etag"', [b"x" * 60]).close()
+        if os.path.exists(untracked) or cache._read_size() != 100:
+            LOGGER.error(f"Error correcting the cache size: {cache._read_size()}")
+            sys.exit(1)
+
+        cache.clear()
+        if cache._read_size() != 0:
+            LOGGER.error("Error resetting the cache size")
+            sys.exit(1)
+
+        # overwriting the same version replaces its size
+        for _ in range(5):
+            cache.put("bucket", "a", '"etag"', [b"x" * 30]).close()
+        if cache._read_size() != 30:
+            LOGGER.error(f"Error tracking the overwritten cache size: {cache._read_size()}")
+            sys.exit(1)
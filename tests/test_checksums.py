@@ -0,0 +1,85 @@
+# pylint: disable=missing-function-docstring
+import os
+import sys
+import hashlib
+import warnings
+import logging
+from cloud_connectors import checksums as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+FUNCTIONS = {"etag_parts_count", "multipart_etag", "check", "verify"}
+CLASSES = {"ETag", "CRC32C"}
+
+CONTENT = os.urandom(100000)
+
+
+def _chunks(data: bytes, size: int) -> list:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_module_miss_functions() -> None:
+    missing = FUNCTIONS.union(CLASSES).difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Function(s) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def test_etag_parts_count() -> None:
+    tests = [('"5717f0a3b8f1dd5634c7848eebbef44e-3"', 3), ("900150983cd24fb0d6963f7d28e17f72", 0)]
+    for etag, want in tests:
+        if module.etag_parts_count(etag) != want:
+            LOGGER.error(f"Wrong number of parts of '{etag}'")
+            sys.exit(1)
+
+
+def test_etag() -> None:
+    digests = [hashlib.md5(part).digest() for part in _chunks(CONTENT, 30000)]
+    tests = [
+        {"part_size": None, "want": hashlib.md5(CONTENT).hexdigest()},
+        {"part_size": 30000, "want": module.multipart_etag(digests)},
+        {"part_size": 50000, "want": module.multipart_etag(
+            [hashlib.md5(part).digest() for part in _chunks(CONTENT, 50000)]
+        )},
+    ]
+    for test in tests:
+        checksum = module.ETag(test["part_size"])
+        # chunks unaligned with the parts
+        for chunk in _chunks(CONTENT, 7777):
+            checksum.update(chunk)
+        if checksum.hexdigest() != test["want"]:
+            LOGGER.error(f"Wrong ETag for the part size {test['part_size']}")
+            sys.exit(1)
+
+    if not module.multipart_etag(digests).endswith("-4"):
+        LOGGER.error("Wrong number of parts of the multipart ETag")
+        sys.exit(1)
+
+
+def test_crc32c() -> None:
+    checksum = module.CRC32C()
+    for chunk in _chunks(b"123456789", 2):
+        checksum.update(chunk)
+    if checksum.hexdigest() != "e3069283":
+        LOGGER.error("Wrong CRC32C")
+        sys.exit(1)
+
+
+def test_verify() -> None:
+    expected = f'"{hashlib.md5(CONTENT).hexdigest()}"'
+    got = b"".join(module.verify(_chunks(CONTENT, 1000), module.ETag(), expected, "test"))
+    if got != CONTENT:
+        LOGGER.error("Error passing the stream through")
+        sys.exit(1)
+
+    try:
+        list(module.verify(_chunks(CONTENT[:-1], 1000), module.ETag(), expected, "test"))
+        LOGGER.error("Checksum mismatch is not detected")
+        sys.exit(1)
+    except Exception as ex:
+        if type(ex).__name__ != "ChecksumMismatch":
+            LOGGER.error("Wrong error type to handle checksum mismatch")
+            sys.exit(1)
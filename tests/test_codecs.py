@@ -0,0 +1,91 @@
+# pylint: disable=missing-function-docstring
+import os
+import sys
+import gzip
+import warnings
+import logging
+import pytest
+from cloud_connectors import codecs as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+FUNCTIONS = {"check", "codec_from_encoding", "encode", "decode"}
+
+CONTENT = os.urandom(100000) + b'{"a": 1}\n' * 100000
+
+
+def _chunks(data: bytes, size: int) -> list:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_module_miss_functions() -> None:
+    missing = FUNCTIONS.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Function(s) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def test_gzip() -> None:
+    encoded = b"".join(module.encode(_chunks(CONTENT, 7777), "gzip"))
+    if gzip.decompress(encoded) != CONTENT:
+        LOGGER.error("Error encoding gzip stream")
+        sys.exit(1)
+
+    decoded = list(module.decode(_chunks(gzip.compress(CONTENT), 333), "gzip", chunk_size=65536))
+    if b"".join(decoded) != CONTENT or max(len(chunk) for chunk in decoded) > 65536:
+        LOGGER.error("Error decoding gzip stream")
+        sys.exit(1)
+
+    # concatenated members
+    if b"".join(module.decode(_chunks(encoded * 2, 1000), "gzip")) != CONTENT * 2:
+        LOGGER.error("Error decoding multi-member gzip stream")
+        sys.exit(1)
+
+    if b"".join(module.decode(module.encode([], "gzip"), "gzip")) != b"":
+        LOGGER.error("Error encoding empty stream")
+        sys.exit(1)
+
+    try:
+        list(module.decode([encoded[:-10]], "gzip"))
+        LOGGER.error("Truncated stream is not detected")
+        sys.exit(1)
+    except Exception as ex:
+        if type(ex).__name__ != "EOFError":
+            LOGGER.error("Wrong error type to handle truncated stream")
+            sys.exit(1)
+
+
+def test_zstd() -> None:
+    pytest.importorskip("zstandard")
+
+    encoded = b"".join(module.encode(_chunks(CONTENT, 7777), "zstd"))
+    if b"".join(module.decode(_chunks(encoded, 333), "zstd")) != CONTENT:
+        LOGGER.error("Error round trip of zstd stream")
+        sys.exit(1)
+
+    if b"".join(module.decode(_chunks(encoded * 2, 1000), "zstd")) != CONTENT * 2:
+        LOGGER.error("Error decoding multi-frame zstd stream")
+        sys.exit(1)
+
+
+def test_unknown_codec() -> None:
+    for func in [lambda: module.encode([], "bz2"), lambda: module.decode([], "bz2")]:
+        try:
+            func()
+            LOGGER.error("Unknown codec is not detected")
+            sys.exit(1)
+        except Exception as ex:
+            if type(ex).__name__ != "ValueError":
+                LOGGER.error("Wrong error type to handle unknown codec")
+                sys.exit(1)
+
+
+def test_codec_from_encoding() -> None:
+    tests = [("gzip", "gzip"), ("GZIP ", "gzip"), ("zstd", "zstd"), ("br", None), (None, None)]
+    for encoding, want in tests:
+        if module.codec_from_encoding(encoding) != want:
+            LOGGER.error(f"Wrong codec for '{encoding}'")
+            sys.exit(1)
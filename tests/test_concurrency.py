@@ -0,0 +1,122 @@
+# pylint: disable=missing-function-docstring
+import sys
+import time
+import warnings
+import logging
+from typing import Iterator
+from cloud_connectors import concurrency as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+FUNCTIONS = {"merge_iterators", "bounded_map", "shared_executor"}
+
+
+def test_module_miss_functions() -> None:
+    missing = FUNCTIONS.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Function(s) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def _producer(start: int, delay: float = 0.):
+    def _gen():
+        for i in range(start, start + 5):
+            time.sleep(delay)
+            yield i
+    return _gen
+
+
+def test_merge_iterators() -> None:
+    producers = [_producer(0, 0.01), _producer(5), _producer(10, 0.005)]
+
+    got = list(module.merge_iterators(producers, max_concurrency=2, ordered=True))
+    if got != list(range(15)):
+        LOGGER.error(f"Error merging in order. got: {got}")
+        sys.exit(1)
+
+    got = list(module.merge_iterators(producers, max_concurrency=3, ordered=False))
+    if sorted(got) != list(range(15)):
+        LOGGER.error(f"Error merging unordered. got: {got}")
+        sys.exit(1)
+
+    if list(module.merge_iterators([], max_concurrency=3)) != []:
+        LOGGER.error("Error merging no producers")
+        sys.exit(1)
+
+    merged = module.merge_iterators([_producer(0)] * 10, max_concurrency=2, buffer_size=1)
+    _ = next(merged)
+    merged.close()
+
+    # the queued producers are not started once the consumer stops
+    started = []
+
+    def _counted() -> Iterator[int]:
+        started.append(1)
+        yield from _producer(0, 0.01)()
+
+    merged = module.merge_iterators([_counted] * 200, max_concurrency=2, buffer_size=1)
+    _ = next(merged)
+    merged.close()
+    if len(started) > 4:
+        LOGGER.error(f"Producers run after close: {len(started)}")
+        sys.exit(1)
+
+    def _faulty():
+        yield 1
+        raise ValueError("test")
+
+    try:
+        _ = list(module.merge_iterators([_producer(0), _faulty], max_concurrency=2))
+        LOGGER.error("Producer exception is not raised")
+        sys.exit(1)
+    except ValueError:
+        pass
+
+
+def test_bounded_map() -> None:
+    consumed = []
+
+    def _items():
+        for i in range(20):
+            consumed.append(i)
+            yield i
+
+    def _func(i: int) -> int:
+        time.sleep(0.001 * (i % 3))
+        if i % 5 == 0:
+            raise ValueError(i)
+        return i * 2
+
+    outcomes = module.bounded_map(_func, _items(), max_concurrency=2)
+    _ = next(outcomes)
+    if len(consumed) > 5:
+        LOGGER.error(f"Items are not consumed lazily: {len(consumed)}")
+        sys.exit(1)
+
+    outcomes = sorted(module.bounded_map(_func, range(20), max_concurrency=4), key=lambda i: i[0])
+    for item, result, exception in outcomes:
+        if item % 5 == 0:
+            if not isinstance(exception, ValueError) or result is not None:
+                LOGGER.error(f"Error reporting exception for {item}")
+                sys.exit(1)
+        elif exception is not None or result != item * 2:
+            LOGGER.error(f"Error reporting result for {item}")
+            sys.exit(1)
+
+    if len(outcomes) != 20:
+        LOGGER.error("Not all items processed")
+        sys.exit(1)
+
+    outcomes = list(module.bounded_map(
+        _func, range(20), max_concurrency=4, ordered=True, executor=module.shared_executor()
+    ))
+    if [item for item, _, _ in outcomes] != list(range(20)):
+        LOGGER.error("Error reporting outcomes in the items order")
+        sys.exit(1)
+
+    if module.shared_executor() is not module.shared_executor():
+        LOGGER.error("Error sharing the executor")
+        sys.exit(1)
@@ -18,6 +18,7 @@ CLASSES = {
     "DataStructureError",
     "DatabaseConnectionError",
     "DatabaseError",
+    "ChecksumMismatch",
 }
 
 
@@ -0,0 +1,92 @@
+# pylint: disable=missing-function-docstring
+import sys
+import json
+import subprocess
+import warnings
+import logging
+from cloud_connectors import lazy as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+FUNCTIONS = {"lazy_import"}
+
+# the SDK modules must not be imported with the connectors
+# botocore.exceptions is imported by aws.s3 and aws.sts to catch the client errors, it doesn't
+# load the botocore session, client or data loaders, so it's not listed
+HEAVY_MODULES = {
+    "boto3",
+    "botocore.session",
+    "botocore.client",
+    "google.cloud.storage",
+    "psycopg2",
+    "fastjsonschema",
+}
+
+# the import time is measured with benchmarks/import_time.py
+CONNECTORS = [
+    "cloud_connectors.aws.s3",
+    "cloud_connectors.aws.sts",
+    "cloud_connectors.aws.redshift",
+    "cloud_connectors.gcp.gcs",
+    "cloud_connectors.listing_index",
+]
+
+
+def _imported_modules(module_name: str) -> set:
+    resp = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, json, {module_name}; print(json.dumps(list(sys.modules)))",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    return set(json.loads(resp.stdout))
+
+
+def test_module_miss_functions() -> None:
+    missing = FUNCTIONS.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Function(s) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def test_lazy_import() -> None:
+    placeholder = module.lazy_import("cloud_connectors_missing_module")
+    try:
+        _ = placeholder.attribute
+    except Exception as ex:
+        if type(ex).__name__ != "ModuleNotFoundError":
+            LOGGER.error("Wrong error type to handle missing module")
+            sys.exit(1)
+
+    if module.lazy_import("sys") is not sys:
+        LOGGER.error("Error returning the imported module")
+        sys.exit(1)
+
+    resp = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from cloud_connectors.lazy import lazy_import; "
+            "m = lazy_import('json.decoder'); assert 'json.decoder' not in sys.modules; "
+            "assert m.JSONDecodeError.__name__ == 'JSONDecodeError'; "
+            "assert 'json.decoder' in sys.modules",
+        ],
+        check=False,
+    )
+    if resp.returncode != 0:
+        LOGGER.error("Error importing the module on the first attribute access")
+        sys.exit(1)
+
+
+def test_heavy_imports() -> None:
+    for module_name in CONNECTORS:
+        heavy = HEAVY_MODULES.intersection(_imported_modules(module_name))
+        if heavy:
+            LOGGER.error(f"""'{module_name}' imports '{"', '".join(sorted(heavy))}'""")
+            sys.exit(1)
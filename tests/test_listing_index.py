@@ -0,0 +1,140 @@
+# pylint: disable=missing-function-docstring
+import os
+import sys
+import time
+import tempfile
+import warnings
+import logging
+from moto import mock_s3  # type: ignore
+import boto3  # type: ignore
+from cloud_connectors.aws import s3
+from cloud_connectors import listing_index as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+CLASSES = {"ListingIndex"}
+
+BUCKET = "test"
+
+
+class _CountingClient(s3.Client):
+    """Client counting the listing calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = []
+
+    def iter_objects_size(self, bucket, prefix="", start_after=None):
+        self.calls.append((bucket, prefix, start_after))
+        return super().iter_objects_size(bucket, prefix, start_after)
+
+
+def test_module_miss_classes() -> None:
+    missing = CLASSES.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Class(es) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+@mock_s3
+def test_listing_index() -> None:
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    for i in range(15):
+        mock_client.put_object(Bucket=BUCKET, Key=f"data/{i:02d}.json", Body=b"{}")
+    mock_client.put_object(Bucket=BUCKET, Key="data/sub/00.csv", Body=b"a,b")
+    mock_client.put_object(Bucket=BUCKET, Key="other.csv", Body=b"a")
+
+    client = _CountingClient()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.sqlite")
+        index = module.ListingIndex(client, path=path, ttl=3600)
+
+        expected = client.list_objects_size(bucket=BUCKET, prefix="data/")
+        if index.list_objects_size(bucket=BUCKET, prefix="data/") != expected:
+            LOGGER.error("Error listing objects from the index")
+            sys.exit(1)
+
+        if index.list_objects(bucket=BUCKET, prefix="data/1", max_objects=2) != [
+            "data/10.json",
+            "data/11.json",
+        ]:
+            LOGGER.error("Error listing sub-prefix from the index")
+            sys.exit(1)
+
+        if [i for i, _ in index.glob(bucket=BUCKET, pattern="data/*.csv")] != ["data/sub/00.csv"]:
+            LOGGER.error("Error globbing the index")
+            sys.exit(1)
+
+        if index.size(bucket=BUCKET, prefix="data/") != (16, 33):
+            LOGGER.error(f"Error aggregating size: {index.size(bucket=BUCKET, prefix='data/')}")
+            sys.exit(1)
+
+        if len(client.calls) != 1:
+            LOGGER.error(f"Covered prefixes are listed again: {client.calls}")
+            sys.exit(1)
+
+        if index.list_objects(bucket=BUCKET) != client.list_objects(bucket=BUCKET):
+            LOGGER.error("Error listing the whole bucket from the index")
+            sys.exit(1)
+        index.close()
+
+        # the index persists
+        mock_client.delete_object(Bucket=BUCKET, Key="other.csv")
+        index = module.ListingIndex(client, path=path, ttl=3600)
+        if "other.csv" not in index.list_objects(bucket=BUCKET) or len(client.calls) != 2:
+            LOGGER.error("Error reading persisted index")
+            sys.exit(1)
+
+        # full rescan after ttl
+        index.ttl = 0
+        time.sleep(0.01)
+        if "other.csv" in index.list_objects(bucket=BUCKET):
+            LOGGER.error("Error re-scanning the expired listing")
+            sys.exit(1)
+        index.close()
+
+    try:
+        _ = module.ListingIndex(client, path=":memory:").list_objects(bucket=f"{BUCKET}_bar")
+    except Exception as ex:
+        if type(ex).__name__ != "BucketNotFound":
+            LOGGER.error("Wrong error type to handle NoSuchBucket error")
+            sys.exit(1)
+
+
+@mock_s3
+def test_listing_index_append_only() -> None:
+    mock_client = boto3.client("s3")
+    mock_client.create_bucket(Bucket=BUCKET)
+    for i in range(5):
+        mock_client.put_object(Bucket=BUCKET, Key=f"logs/{i:02d}.json", Body=b"{}")
+
+    client = _CountingClient()
+    index = module.ListingIndex(client, path=":memory:", ttl=0, append_only=True)
+
+    if index.size(bucket=BUCKET, prefix="logs/") != (5, 10):
+        LOGGER.error("Error listing the append only prefix")
+        sys.exit(1)
+
+    for i in range(5, 8):
+        mock_client.put_object(Bucket=BUCKET, Key=f"logs/{i:02d}.json", Body=b"{}")
+    time.sleep(0.01)
+
+    if index.size(bucket=BUCKET, prefix="logs/") != (8, 16):
+        LOGGER.error("Error refreshing the append only prefix")
+        sys.exit(1)
+
+    if client.calls[-1] != (BUCKET, "logs/", "logs/04.json"):
+        LOGGER.error(f"Error listing incrementally: {client.calls}")
+        sys.exit(1)
+
+    if index.refresh(bucket=BUCKET, prefix="logs/") != 0:
+        LOGGER.error("Error refreshing without new objects")
+        sys.exit(1)
+
+    if index.refresh(bucket=BUCKET, prefix="logs/", full=True) != 8:
+        LOGGER.error("Error re-scanning the prefix")
+        sys.exit(1)
@@ -0,0 +1,186 @@
+# pylint: disable=missing-function-docstring
+import sys
+import json
+import warnings
+import logging
+from cloud_connectors import local_select as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+FUNCTIONS = {"select", "split_records"}
+
+JSON_LINES = b"".join(
+    json.dumps({"id": i, "name": f"name{i}", "nested": {"value": i * 10}}).encode("utf-8") + b"\n"
+    for i in range(10)
+)
+
+CSV_DATA = b'id,name\n1,a\n2,"b,c"\n3,d\n'
+
+
+def _select(data: bytes, sql: str, **kwargs) -> list:
+    # small chunks to split the records between chunks
+    return list(module.select([data[i:i + 7] for i in range(0, len(data), 7)], sql, **kwargs))
+
+
+def test_module_miss_functions() -> None:
+    missing = FUNCTIONS.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Function(s) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def test_split_records() -> None:
+    tests = [
+        {"chunks": [b"a\nb", b"c\n\nd"], "keep": False, "want": [b"a", b"bc", b"d"]},
+        {"chunks": [b"a\nb", b"c\n"], "keep": True, "want": [b"a\n", b"bc\n"]},
+        {"chunks": [], "keep": False, "want": []},
+    ]
+    for test in tests:
+        got = list(module.split_records(test["chunks"], b"\n", keep_delimiter=test["keep"]))
+        if got != test["want"]:
+            LOGGER.error(f"Error splitting records. got: {got}, want: {test['want']}")
+            sys.exit(1)
+
+    # the quoted delimiters don't split the records, "" is the escaped quote
+    data = b'1,"a\r\n""b""\r\nc"\r\n2,d\r\n\r\n3,"e"'
+    want = [b'1,"a\r\n""b""\r\nc"', b"2,d", b'3,"e"']
+    for size in [1, 2, 3, len(data)]:
+        got = list(
+            module.split_records(
+                [data[i:i + size] for i in range(0, len(data), size)], b"\r\n", quote=b'"'
+            )
+        )
+        if got != want:
+            LOGGER.error(f"Error splitting quoted records. got: {got}, want: {want}")
+            sys.exit(1)
+
+
+def test_select_json() -> None:
+    tests = [
+        {
+            "sql": "SELECT * FROM S3Object s WHERE s.id > 7",
+            "want": [b'{"id":8,"name":"name8","nested":{"value":80}}\n',
+                     b'{"id":9,"name":"name9","nested":{"value":90}}\n'],
+        },
+        {
+            "sql": "SELECT s.name, s.nested.value AS v FROM S3Object[*] s "
+                   "WHERE s.id BETWEEN 2 AND 3 OR s.name LIKE '%9'",
+            "want": [b'{"name":"name2","v":20}\n', b'{"name":"name3","v":30}\n',
+                     b'{"name":"name9","v":90}\n'],
+        },
+        {
+            "sql": "SELECT id FROM S3Object WHERE id IN (1, 5) AND NOT name = 'name5' LIMIT 5",
+            "want": [b'{"id":1}\n'],
+        },
+        {
+            "sql": "SELECT UPPER(s.name), s.id * 2 FROM S3Object s WHERE s.missing IS NULL LIMIT 1",
+            "want": [b'{"_1":"NAME0","_2":0}\n'],
+        },
+        {
+            "sql": "SELECT COUNT(*), SUM(s.id), MAX(s.name) AS m FROM S3Object s WHERE s.id < 4",
+            "want": [b'{"_1":4,"_2":6,"m":"name3"}\n'],
+        },
+    ]
+    for test in tests:
+        got = _select(JSON_LINES, test["sql"])
+        if got != test["want"]:
+            LOGGER.error(f"Error selecting '{test['sql']}'. got: {got}, want: {test['want']}")
+            sys.exit(1)
+
+
+def test_select_missing() -> None:
+    data = b'{"id":1,"a":null}\n{"id":2}\n{"id":3,"a":0}\n'
+    tests = [
+        {"sql": "SELECT s.id FROM S3Object s WHERE s.a IS MISSING", "want": [b'{"id":2}\n']},
+        {
+            "sql": "SELECT s.id FROM S3Object s WHERE s.a IS NOT MISSING",
+            "want": [b'{"id":1}\n', b'{"id":3}\n'],
+        },
+        # the missing values are null too
+        {
+            "sql": "SELECT s.id FROM S3Object s WHERE s.a IS NULL",
+            "want": [b'{"id":1}\n', b'{"id":2}\n'],
+        },
+        {"sql": "SELECT s.id FROM S3Object s WHERE s.a IS NOT NULL", "want": [b'{"id":3}\n']},
+    ]
+    for test in tests:
+        got = _select(data, test["sql"])
+        if got != test["want"]:
+            LOGGER.error(f"Error selecting '{test['sql']}'. got: {got}, want: {test['want']}")
+            sys.exit(1)
+
+
+def test_select_csv() -> None:
+    tests = [
+        {
+            "sql": "SELECT * FROM S3Object s WHERE CAST(s.id AS INT) >= 2",
+            "input_serialization": {"FileHeaderInfo": "USE"},
+            "output_format": "CSV",
+            "want": [b'2,"b,c"\n', b"3,d\n"],
+        },
+        {
+            "sql": "SELECT s._2 FROM S3Object s WHERE s._1 = 3",
+            "input_serialization": {"FileHeaderInfo": "IGNORE"},
+            "output_format": "JSON",
+            "want": [b'{"_2":"d"}\n'],
+        },
+        {
+            "sql": "SELECT * FROM S3Object LIMIT 1",
+            "input_serialization": None,
+            "output_format": "JSON",
+            "want": [b'{"_1":"id","_2":"name"}\n'],
+        },
+    ]
+    for test in tests:
+        got = _select(
+            CSV_DATA,
+            test["sql"],
+            input_format="CSV",
+            output_format=test["output_format"],
+            input_serialization=test["input_serialization"],
+        )
+        if got != test["want"]:
+            LOGGER.error(f"Error selecting '{test['sql']}'. got: {got}, want: {test['want']}")
+            sys.exit(1)
+
+
+def test_select_csv_multiline() -> None:
+    data = b'id,text\n1,"first\nline, ""quoted"""\n2,second\n'
+    want = [b'{"id":"1","text":"first\\nline, \\"quoted\\""}\n']
+    got = _select(data, "SELECT * FROM S3Object s WHERE s.id = 1", input_format="CSV",
+                  input_serialization={"FileHeaderInfo": "USE"})
+    if got != want:
+        LOGGER.error(f"Error selecting multiline CSV fields. got: {got}, want: {want}")
+        sys.exit(1)
+
+
+def test_select_errors() -> None:
+    tests = [
+        "SELECT * FROM S3Object WHERE",
+        "SELECT * FROM table",
+        "SELECT id, COUNT(*) FROM S3Object",
+        "SELECT * FROM S3Object WHERE COUNT(*) > 1",
+        "SELECT unknown(id) FROM S3Object",
+        "SELECT * FROM S3Object WHERE name = 'a",
+    ]
+    for sql in tests:
+        try:
+            module.select([], sql)
+            LOGGER.error(f"Error is not raised for '{sql}'")
+            sys.exit(1)
+        except Exception as ex:
+            if type(ex).__name__ != "ValueError":
+                LOGGER.error(f"Wrong error type for '{sql}'")
+                sys.exit(1)
+
+    try:
+        module.select([], "SELECT * FROM S3Object", input_format="PARQUET")
+        LOGGER.error("Error is not raised for unknown format")
+        sys.exit(1)
+    except Exception as ex:
+        if type(ex).__name__ != "ValueError":
+            LOGGER.error("Wrong error type for unknown format")
+            sys.exit(1)
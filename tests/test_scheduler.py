@@ -0,0 +1,170 @@
+# pylint: disable=missing-function-docstring
+import sys
+import time
+import warnings
+import logging
+from threading import Thread
+from cloud_connectors import scheduler as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+CLASSES = {"TransferScheduler", "TransferSlot"}
+CLASS_METHODS = {"slot", "acquire", "release", "stats"}
+
+
+def test_module_miss_classes() -> None:
+    missing = CLASSES.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Class(es) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def test_class_scheduler_miss_methods() -> None:
+    missing = CLASS_METHODS.difference(set(module.TransferScheduler.__dict__.keys()))
+    if missing:
+        LOGGER.error(f"""Class 'TransferScheduler' Method(s) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def _wait_queued(scheduler: module.TransferScheduler, depth: int) -> None:
+    while sum(scheduler.stats().queue_depth.values()) < depth:
+        time.sleep(0.001)
+
+
+def test_limits() -> None:
+    scheduler = module.TransferScheduler(max_bytes=100, max_connections=2)
+
+    with scheduler.slot(60):
+        try:
+            scheduler.acquire(50, timeout=0.01)
+            LOGGER.error("Bytes limit is not applied")
+            sys.exit(1)
+        except TimeoutError:
+            pass
+
+        with scheduler.slot(40):
+            try:
+                scheduler.acquire(0, timeout=0.01)
+                LOGGER.error("Connections limit is not applied")
+                sys.exit(1)
+            except TimeoutError:
+                pass
+
+            # the bytes of a granted connection
+            try:
+                scheduler.acquire(1, connections=0, timeout=0.01)
+                LOGGER.error("Bytes limit is not applied to the reservation")
+                sys.exit(1)
+            except TimeoutError:
+                pass
+
+        stats = scheduler.stats()
+        if stats.in_flight_bytes != 60 or stats.in_flight_connections != 1:
+            LOGGER.error(f"Error releasing the slot: {stats}")
+            sys.exit(1)
+
+    # the transfer larger than the budget is granted alone
+    with scheduler.slot(1000) as slot:
+        if slot.size != 100:
+            LOGGER.error("Error capping the transfer size")
+            sys.exit(1)
+
+    stats = scheduler.stats()
+    if stats.in_flight_bytes or stats.in_flight_connections or any(stats.queue_depth.values()):
+        LOGGER.error(f"Error releasing the slots: {stats}")
+        sys.exit(1)
+
+    for func in [lambda: scheduler.acquire(1, priority="urgent"),
+                 lambda: module.TransferScheduler(max_bytes=0),
+                 lambda: module.TransferScheduler(bulk_share=0)]:
+        try:
+            func()
+            LOGGER.error("Wrong arguments are not detected")
+            sys.exit(1)
+        except ValueError:
+            pass
+
+
+def test_bulk_share() -> None:
+    scheduler = module.TransferScheduler(max_bytes=100, max_connections=4, bulk_share=0.5)
+
+    with scheduler.slot(40, priority="bulk"):
+        try:
+            scheduler.acquire(20, priority="bulk", timeout=0.01)
+            LOGGER.error("Bulk share is not applied")
+            sys.exit(1)
+        except TimeoutError:
+            pass
+
+        with scheduler.slot(60, priority="interactive"):
+            stats = scheduler.stats()
+            if stats.in_flight_bytes != 100 or stats.in_flight_connections != 2:
+                LOGGER.error(f"Error granting the interactive slot: {stats}")
+                sys.exit(1)
+
+
+def test_priorities_and_fairness() -> None:
+    scheduler = module.TransferScheduler(max_bytes=10, max_connections=1)
+    granted = []
+
+    def _transfer(name: str, priority: str, caller: str) -> None:
+        with scheduler.slot(10, priority=priority, caller=caller):
+            granted.append(name)
+
+    blocker = scheduler.slot(10)
+    blocker.acquire()
+
+    threads = []
+    requests = [
+        ("bulk-a1", "bulk", "a"),
+        ("bulk-a2", "bulk", "a"),
+        ("bulk-b1", "bulk", "b"),
+        ("interactive-c1", "interactive", "c"),
+    ]
+    for depth, request in enumerate(requests, 1):
+        threads.append(Thread(target=_transfer, args=request))
+        threads[-1].start()
+        _wait_queued(scheduler, depth)
+
+    stats = scheduler.stats()
+    if stats.queue_depth != {"interactive": 1, "bulk": 3}:
+        LOGGER.error(f"Wrong queue depth: {stats.queue_depth}")
+        sys.exit(1)
+
+    blocker.release()
+    # the repeated release is ignored
+    blocker.release()
+    for thread in threads:
+        thread.join()
+
+    if granted != ["interactive-c1", "bulk-a1", "bulk-b1", "bulk-a2"]:
+        LOGGER.error(f"Wrong grant order: {granted}")
+        sys.exit(1)
+
+    stats = scheduler.stats()
+    if stats.granted != {"interactive": 2, "bulk": 3} or stats.wait_time_max["bulk"] <= 0:
+        LOGGER.error(f"Wrong counters: {stats}")
+        sys.exit(1)
+
+
+def test_reserve() -> None:
+    scheduler = module.TransferScheduler(max_bytes=10, max_connections=1)
+
+    with scheduler.slot() as slot:
+        slot.reserve(8)
+        if scheduler.stats().in_flight_bytes != 8:
+            LOGGER.error("Error reserving the bytes")
+            sys.exit(1)
+        try:
+            slot.reserve(1)
+            LOGGER.error("Repeated reservation is not detected")
+            sys.exit(1)
+        except RuntimeError:
+            pass
+
+    # no scheduler
+    with module.TransferSlot(None, size=10) as slot:
+        slot.reserve(10)
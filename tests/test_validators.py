@@ -0,0 +1,69 @@
+# pylint: disable=missing-function-docstring
+import sys
+import warnings
+import logging
+from threading import Thread
+from fastjsonschema import JsonSchemaException
+from cloud_connectors import validators as module
+
+
+logging.basicConfig(level=logging.ERROR, format="[line: %(lineno)s] %(message)s")
+LOGGER = logging.getLogger(__name__)
+warnings.simplefilter(action="ignore", category=FutureWarning)
+
+FUNCTIONS = {"get_validator", "validate"}
+
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "a": {"type": "integer", "default": 1},
+    },
+}
+
+
+def test_module_miss_functions() -> None:
+    missing = FUNCTIONS.difference(set(module.__dir__()))
+    if missing:
+        LOGGER.error(f"""Function(s) '{"', '".join(missing)}' is(are) missing.""")
+        sys.exit(1)
+
+
+def test_get_validator() -> None:
+    validator = module.get_validator(SCHEMA)
+    if module.get_validator(SCHEMA) is not validator:
+        LOGGER.error("Validator is not reused")
+        sys.exit(1)
+
+    schema_copy = dict(SCHEMA)
+    if module.get_validator(schema_copy) is validator:
+        LOGGER.error("Validator is shared between different schemas")
+        sys.exit(1)
+
+    validators = []
+    threads = [
+        Thread(target=lambda: validators.append(module.get_validator(schema_copy)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if len({id(i) for i in validators}) != 1:
+        LOGGER.error("Validator is compiled more than once")
+        sys.exit(1)
+
+
+def test_validate() -> None:
+    if module.validate(SCHEMA, {}) != {"a": 1}:
+        LOGGER.error("Default values are not set")
+        sys.exit(1)
+
+    try:
+        module.validate(SCHEMA, {"b": 1})
+        LOGGER.error("Faulty data passed validation")
+        sys.exit(1)
+    except JsonSchemaException:
+        pass